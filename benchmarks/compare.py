@@ -0,0 +1,58 @@
+"""Compares the results of two runs of ``benchmarks.run``"""
+import argparse
+import json
+import sys
+from typing import Any, Dict
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(
+    before: Dict[str, Any], after: Dict[str, Any], metric: str, threshold: float
+) -> bool:
+    """Prints the change of ``metric`` for every benchmark and returns whether
+    one of them got slower by more than ``threshold``
+    """
+    print(f"{'benchmark':<28}{'before':>12}{'after':>12}{'change':>10}")
+    regressed = False
+    for name, result in after["results"].items():
+        if name not in before["results"]:
+            print(f"{name:<28}{'-':>12}{result[metric] * 1000:>10.3f}ms{'new':>10}")
+            continue
+        old, new = before["results"][name][metric], result[metric]
+        change = new / old - 1
+        flag = ""
+        if change > threshold:
+            flag = " !"
+            regressed = True
+        print(
+            f"{name:<28}{old * 1000:>10.3f}ms{new * 1000:>10.3f}ms"
+            f"{change:>+10.1%}{flag}"
+        )
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="benchmarks.compare")
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument("--metric", choices=["mean", "median", "min"], default="median")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown reported as a regression",
+    )
+    args = parser.parse_args()
+
+    before, after = load_report(args.before), load_report(args.after)
+    print(f"{before.get('commit')} -> {after.get('commit')}")
+    if compare(before, after, args.metric, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,654 @@
+CREATE TABLE word (wordid INTEGER PRIMARY KEY, lang TEXT, lemma TEXT, pron TEXT, pos TEXT);
+CREATE TABLE sense (synset TEXT, wordid INTEGER, lang TEXT, rank TEXT, lexid INTEGER, freq INTEGER, src TEXT);
+CREATE TABLE synset (synset TEXT, pos TEXT, name TEXT, src TEXT);
+CREATE INDEX word_lemma ON word (lemma);
+CREATE INDEX sense_wordid ON sense (wordid);
+CREATE INDEX sense_synset ON sense (synset);
+INSERT INTO word VALUES
+(1,'jpn','本日',NULL,'n'),
+(2,'jpn','今日',NULL,'n'),
+(3,'jpn','当日',NULL,'n'),
+(4,'eng','english_0',NULL,'n'),
+(5,'jpn','晴天',NULL,'n'),
+(6,'jpn','晴れ',NULL,'n'),
+(7,'jpn','好天',NULL,'n'),
+(8,'eng','english_1',NULL,'n'),
+(9,'jpn','大学',NULL,'n'),
+(10,'jpn','学校',NULL,'n'),
+(11,'jpn','学院',NULL,'n'),
+(12,'eng','english_2',NULL,'n'),
+(13,'jpn','参る',NULL,'v'),
+(14,'jpn','行く',NULL,'v'),
+(15,'jpn','伺う',NULL,'v'),
+(16,'eng','english_3',NULL,'v'),
+(17,'jpn','希望',NULL,'n'),
+(18,'jpn','願い',NULL,'n'),
+(19,'jpn','望み',NULL,'n'),
+(20,'eng','english_4',NULL,'n'),
+(21,'jpn','日付',NULL,'n'),
+(22,'jpn','日',NULL,'n'),
+(23,'jpn','日にち',NULL,'n'),
+(24,'eng','english_5',NULL,'n'),
+(25,'jpn','選択',NULL,'v'),
+(26,'jpn','選ぶ',NULL,'v'),
+(27,'jpn','決める',NULL,'v'),
+(28,'eng','english_6',NULL,'v'),
+(29,'jpn','食事',NULL,'v'),
+(30,'jpn','食べる',NULL,'v'),
+(31,'jpn','ご飯',NULL,'v'),
+(32,'eng','english_7',NULL,'v'),
+(33,'jpn','友人',NULL,'n'),
+(34,'jpn','友達',NULL,'n'),
+(35,'jpn','仲間',NULL,'n'),
+(36,'eng','english_8',NULL,'n'),
+(37,'jpn','会議',NULL,'n'),
+(38,'jpn','会合',NULL,'n'),
+(39,'jpn','集まり',NULL,'n'),
+(40,'eng','english_9',NULL,'n'),
+(41,'jpn','資料',NULL,'n'),
+(42,'jpn','材料',NULL,'n'),
+(43,'jpn','データ',NULL,'n'),
+(44,'eng','english_10',NULL,'n'),
+(45,'jpn','迅速',NULL,'a'),
+(46,'jpn','速い',NULL,'a'),
+(47,'jpn','早い',NULL,'a'),
+(48,'eng','english_11',NULL,'a'),
+(49,'jpn','作成',NULL,'v'),
+(50,'jpn','作る',NULL,'v'),
+(51,'jpn','こしらえる',NULL,'v'),
+(52,'eng','english_12',NULL,'v'),
+(53,'jpn','上司',NULL,'n'),
+(54,'jpn','上役',NULL,'n'),
+(55,'jpn','上の人',NULL,'n'),
+(56,'eng','english_13',NULL,'n'),
+(57,'jpn','提出',NULL,'v'),
+(58,'jpn','出す',NULL,'v'),
+(59,'jpn','渡す',NULL,'v'),
+(60,'eng','english_14',NULL,'v'),
+(61,'jpn','長年',NULL,'n'),
+(62,'jpn','長い間',NULL,'n'),
+(63,'jpn','多年',NULL,'n'),
+(64,'eng','english_15',NULL,'n'),
+(65,'jpn','地域',NULL,'n'),
+(66,'jpn','地方',NULL,'n'),
+(67,'jpn','場所',NULL,'n'),
+(68,'eng','english_16',NULL,'n'),
+(69,'jpn','発展',NULL,'n'),
+(70,'jpn','成長',NULL,'n'),
+(71,'jpn','発達',NULL,'n'),
+(72,'eng','english_17',NULL,'n'),
+(73,'jpn','尽力',NULL,'v'),
+(74,'jpn','努力',NULL,'v'),
+(75,'jpn','頑張る',NULL,'v'),
+(76,'eng','english_18',NULL,'v'),
+(77,'jpn','人物',NULL,'n'),
+(78,'jpn','人',NULL,'n'),
+(79,'jpn','者',NULL,'n'),
+(80,'eng','english_19',NULL,'n'),
+(81,'jpn','農業',NULL,'n'),
+(82,'jpn','農作',NULL,'n'),
+(83,'jpn','農耕',NULL,'n'),
+(84,'eng','english_20',NULL,'n'),
+(85,'jpn','盛ん',NULL,'a'),
+(86,'jpn','活発',NULL,'a'),
+(87,'jpn','にぎやか',NULL,'a'),
+(88,'eng','english_21',NULL,'a'),
+(89,'jpn','営む',NULL,'v'),
+(90,'jpn','行う',NULL,'v'),
+(91,'jpn','する',NULL,'v'),
+(92,'eng','english_22',NULL,'v'),
+(93,'jpn','多様',NULL,'a'),
+(94,'jpn','色々',NULL,'a'),
+(95,'jpn','様々',NULL,'a'),
+(96,'eng','english_23',NULL,'a'),
+(97,'jpn','作物',NULL,'n'),
+(98,'jpn','野菜',NULL,'n'),
+(99,'jpn','農作物',NULL,'n'),
+(100,'eng','english_24',NULL,'n'),
+(101,'jpn','栽培',NULL,'v'),
+(102,'jpn','育てる',NULL,'v'),
+(103,'eng','english_25',NULL,'v'),
+(104,'jpn','制度',NULL,'n'),
+(105,'jpn','仕組み',NULL,'n'),
+(106,'jpn','システム',NULL,'n'),
+(107,'eng','english_26',NULL,'n'),
+(108,'jpn','導入',NULL,'n'),
+(109,'jpn','取り入れ',NULL,'n'),
+(110,'jpn','採用',NULL,'n'),
+(111,'eng','english_27',NULL,'n'),
+(112,'jpn','伴う',NULL,'v'),
+(113,'jpn','連れる',NULL,'v'),
+(114,'jpn','付く',NULL,'v'),
+(115,'eng','english_28',NULL,'v'),
+(116,'jpn','手続き',NULL,'n'),
+(117,'jpn','手順',NULL,'n'),
+(118,'jpn','手続',NULL,'n'),
+(119,'eng','english_29',NULL,'n'),
+(120,'jpn','速やか',NULL,'a'),
+(121,'jpn','すぐ',NULL,'a'),
+(122,'eng','english_30',NULL,'a'),
+(123,'jpn','完了',NULL,'v'),
+(124,'jpn','終わる',NULL,'v'),
+(125,'jpn','済む',NULL,'v'),
+(126,'eng','english_31',NULL,'v'),
+(127,'jpn','必要',NULL,'n'),
+(128,'jpn','要る',NULL,'n'),
+(129,'jpn','入用',NULL,'n'),
+(130,'eng','english_32',NULL,'n'),
+(131,'jpn','近年',NULL,'n'),
+(132,'jpn','最近',NULL,'n'),
+(133,'jpn','この頃',NULL,'n'),
+(134,'eng','english_33',NULL,'n'),
+(135,'jpn','技術',NULL,'n'),
+(136,'jpn','技',NULL,'n'),
+(137,'jpn','腕',NULL,'n'),
+(138,'eng','english_34',NULL,'n'),
+(139,'jpn','急速',NULL,'a'),
+(140,'jpn','急',NULL,'a'),
+(141,'eng','english_35',NULL,'a'),
+(142,'jpn','進歩',NULL,'n'),
+(143,'jpn','向上',NULL,'n'),
+(144,'eng','english_36',NULL,'n'),
+(145,'jpn','生活',NULL,'n'),
+(146,'jpn','暮らし',NULL,'n'),
+(147,'jpn','日常',NULL,'n'),
+(148,'eng','english_37',NULL,'n'),
+(149,'jpn','様式',NULL,'n'),
+(150,'jpn','スタイル',NULL,'n'),
+(151,'jpn','形',NULL,'n'),
+(152,'eng','english_38',NULL,'n'),
+(153,'jpn','変容',NULL,'v'),
+(154,'jpn','変化',NULL,'v'),
+(155,'jpn','変わる',NULL,'v'),
+(156,'eng','english_39',NULL,'v'),
+(157,'jpn','従来',NULL,'n'),
+(158,'jpn','今まで',NULL,'n'),
+(159,'jpn','これまで',NULL,'n'),
+(160,'eng','english_40',NULL,'n'),
+(161,'jpn','契機',NULL,'n'),
+(162,'jpn','きっかけ',NULL,'n'),
+(163,'jpn','機会',NULL,'n'),
+(164,'eng','english_41',NULL,'n'),
+(165,'jpn','顧客',NULL,'n'),
+(166,'jpn','客',NULL,'n'),
+(167,'jpn','お客',NULL,'n'),
+(168,'eng','english_42',NULL,'n'),
+(169,'jpn','要望',NULL,'n'),
+(170,'eng','english_43',NULL,'n'),
+(171,'jpn','対応',NULL,'v'),
+(172,'jpn','応じる',NULL,'v'),
+(173,'jpn','扱う',NULL,'v'),
+(174,'eng','english_44',NULL,'v'),
+(175,'jpn','重視',NULL,'v'),
+(176,'jpn','大切',NULL,'v'),
+(177,'jpn','重んじる',NULL,'v'),
+(178,'eng','english_45',NULL,'v'),
+(179,'jpn','商品',NULL,'n'),
+(180,'jpn','品物',NULL,'n'),
+(181,'jpn','物',NULL,'n'),
+(182,'eng','english_46',NULL,'n'),
+(183,'jpn','開発',NULL,'v'),
+(184,'jpn','開く',NULL,'v'),
+(185,'eng','english_47',NULL,'v'),
+(186,'jpn','市場',NULL,'n'),
+(187,'jpn','マーケット',NULL,'n'),
+(188,'jpn','市',NULL,'n'),
+(189,'eng','english_48',NULL,'n'),
+(190,'jpn','提供',NULL,'v'),
+(191,'jpn','与える',NULL,'v'),
+(192,'eng','english_49',NULL,'v'),
+(193,'jpn','計画',NULL,'v'),
+(194,'jpn','企画',NULL,'v'),
+(195,'jpn','予定',NULL,'v'),
+(196,'eng','english_50',NULL,'v'),
+(197,'jpn','調査',NULL,'n'),
+(198,'jpn','調べ',NULL,'n'),
+(199,'jpn','研究',NULL,'n'),
+(200,'eng','english_51',NULL,'n'),
+(201,'jpn','目的',NULL,'n'),
+(202,'jpn','目当て',NULL,'n'),
+(203,'jpn','狙い',NULL,'n'),
+(204,'eng','english_52',NULL,'n'),
+(205,'jpn','方法',NULL,'n'),
+(206,'jpn','やり方',NULL,'n'),
+(207,'jpn','手段',NULL,'n'),
+(208,'eng','english_53',NULL,'n'),
+(209,'jpn','説明',NULL,'v'),
+(210,'jpn','解説',NULL,'v'),
+(211,'jpn','話す',NULL,'v'),
+(212,'eng','english_54',NULL,'v'),
+(213,'jpn','結果',NULL,'n'),
+(214,'jpn','成果',NULL,'n'),
+(215,'jpn','結末',NULL,'n'),
+(216,'eng','english_55',NULL,'n'),
+(217,'jpn','詳細',NULL,'a'),
+(218,'jpn','細か',NULL,'a'),
+(219,'jpn','詳しい',NULL,'a'),
+(220,'eng','english_56',NULL,'a'),
+(221,'jpn','分析',NULL,'v'),
+(222,'jpn','調べる',NULL,'v'),
+(223,'jpn','解析',NULL,'v'),
+(224,'eng','english_57',NULL,'v'),
+(225,'jpn','課題',NULL,'n'),
+(226,'jpn','問題',NULL,'n'),
+(227,'jpn','宿題',NULL,'n'),
+(228,'eng','english_58',NULL,'n'),
+(229,'jpn','改善',NULL,'n'),
+(230,'jpn','改良',NULL,'n'),
+(231,'jpn','良くする',NULL,'n'),
+(232,'eng','english_59',NULL,'n'),
+(233,'jpn','考察',NULL,'v'),
+(234,'jpn','考える',NULL,'v'),
+(235,'jpn','検討',NULL,'v'),
+(236,'eng','english_60',NULL,'v'),
+(237,'jpn','昨年',NULL,'n'),
+(238,'jpn','去年',NULL,'n'),
+(239,'jpn','前年',NULL,'n'),
+(240,'eng','english_61',NULL,'n'),
+(241,'jpn','祖父',NULL,'n'),
+(242,'jpn','おじいさん',NULL,'n'),
+(243,'jpn','祖父さん',NULL,'n'),
+(244,'eng','english_62',NULL,'n'),
+(245,'jpn','田舎',NULL,'n'),
+(246,'jpn','村',NULL,'n'),
+(247,'eng','english_63',NULL,'n'),
+(248,'jpn','訪問',NULL,'v'),
+(249,'jpn','訪ねる',NULL,'v'),
+(250,'eng','english_64',NULL,'v'),
+(251,'jpn','住民',NULL,'n'),
+(252,'jpn','住人',NULL,'n'),
+(253,'jpn','人々',NULL,'n'),
+(254,'eng','english_65',NULL,'n'),
+(255,'jpn','協力',NULL,'v'),
+(256,'jpn','手伝う',NULL,'v'),
+(257,'jpn','助ける',NULL,'v'),
+(258,'eng','english_66',NULL,'v'),
+(259,'jpn','伝統',NULL,'n'),
+(260,'jpn','しきたり',NULL,'n'),
+(261,'jpn','習わし',NULL,'n'),
+(262,'eng','english_67',NULL,'n'),
+(263,'jpn','開催',NULL,'v'),
+(264,'eng','english_68',NULL,'v'),
+(265,'jpn','熱意',NULL,'n'),
+(266,'jpn','やる気',NULL,'n'),
+(267,'jpn','情熱',NULL,'n'),
+(268,'eng','english_69',NULL,'n'),
+(269,'jpn','感銘',NULL,'n'),
+(270,'jpn','感動',NULL,'n'),
+(271,'jpn','感激',NULL,'n'),
+(272,'eng','english_70',NULL,'n'),
+(273,'jpn','鮮明',NULL,'a'),
+(274,'jpn','はっきり',NULL,'a'),
+(275,'jpn','明らか',NULL,'a'),
+(276,'eng','english_71',NULL,'a'),
+(277,'jpn','記憶',NULL,'v'),
+(278,'jpn','覚える',NULL,'v'),
+(279,'jpn','思い出す',NULL,'v'),
+(280,'eng','english_72',NULL,'v');
+INSERT INTO sense VALUES
+('00000000-n',1,'jpn',NULL,0,0,'bench'),
+('00000000-n',2,'jpn',NULL,0,0,'bench'),
+('00000000-n',3,'jpn',NULL,0,0,'bench'),
+('00000000-n',4,'eng',NULL,0,0,'bench'),
+('00000001-n',5,'jpn',NULL,0,0,'bench'),
+('00000001-n',6,'jpn',NULL,0,0,'bench'),
+('00000001-n',7,'jpn',NULL,0,0,'bench'),
+('00000001-n',8,'eng',NULL,0,0,'bench'),
+('00000002-n',9,'jpn',NULL,0,0,'bench'),
+('00000002-n',10,'jpn',NULL,0,0,'bench'),
+('00000002-n',11,'jpn',NULL,0,0,'bench'),
+('00000002-n',12,'eng',NULL,0,0,'bench'),
+('00000003-v',13,'jpn',NULL,0,0,'bench'),
+('00000003-v',14,'jpn',NULL,0,0,'bench'),
+('00000003-v',15,'jpn',NULL,0,0,'bench'),
+('00000003-v',16,'eng',NULL,0,0,'bench'),
+('00000004-n',17,'jpn',NULL,0,0,'bench'),
+('00000004-n',18,'jpn',NULL,0,0,'bench'),
+('00000004-n',19,'jpn',NULL,0,0,'bench'),
+('00000004-n',20,'eng',NULL,0,0,'bench'),
+('00000005-n',21,'jpn',NULL,0,0,'bench'),
+('00000005-n',22,'jpn',NULL,0,0,'bench'),
+('00000005-n',23,'jpn',NULL,0,0,'bench'),
+('00000005-n',24,'eng',NULL,0,0,'bench'),
+('00000006-v',25,'jpn',NULL,0,0,'bench'),
+('00000006-v',26,'jpn',NULL,0,0,'bench'),
+('00000006-v',27,'jpn',NULL,0,0,'bench'),
+('00000006-v',28,'eng',NULL,0,0,'bench'),
+('00000007-v',29,'jpn',NULL,0,0,'bench'),
+('00000007-v',30,'jpn',NULL,0,0,'bench'),
+('00000007-v',31,'jpn',NULL,0,0,'bench'),
+('00000007-v',32,'eng',NULL,0,0,'bench'),
+('00000008-n',33,'jpn',NULL,0,0,'bench'),
+('00000008-n',34,'jpn',NULL,0,0,'bench'),
+('00000008-n',35,'jpn',NULL,0,0,'bench'),
+('00000008-n',36,'eng',NULL,0,0,'bench'),
+('00000009-n',37,'jpn',NULL,0,0,'bench'),
+('00000009-n',38,'jpn',NULL,0,0,'bench'),
+('00000009-n',39,'jpn',NULL,0,0,'bench'),
+('00000009-n',40,'eng',NULL,0,0,'bench'),
+('00000010-n',41,'jpn',NULL,0,0,'bench'),
+('00000010-n',42,'jpn',NULL,0,0,'bench'),
+('00000010-n',43,'jpn',NULL,0,0,'bench'),
+('00000010-n',44,'eng',NULL,0,0,'bench'),
+('00000011-a',45,'jpn',NULL,0,0,'bench'),
+('00000011-a',46,'jpn',NULL,0,0,'bench'),
+('00000011-a',47,'jpn',NULL,0,0,'bench'),
+('00000011-a',48,'eng',NULL,0,0,'bench'),
+('00000012-v',49,'jpn',NULL,0,0,'bench'),
+('00000012-v',50,'jpn',NULL,0,0,'bench'),
+('00000012-v',51,'jpn',NULL,0,0,'bench'),
+('00000012-v',52,'eng',NULL,0,0,'bench'),
+('00000013-n',53,'jpn',NULL,0,0,'bench'),
+('00000013-n',54,'jpn',NULL,0,0,'bench'),
+('00000013-n',55,'jpn',NULL,0,0,'bench'),
+('00000013-n',56,'eng',NULL,0,0,'bench'),
+('00000014-v',57,'jpn',NULL,0,0,'bench'),
+('00000014-v',58,'jpn',NULL,0,0,'bench'),
+('00000014-v',59,'jpn',NULL,0,0,'bench'),
+('00000014-v',60,'eng',NULL,0,0,'bench'),
+('00000015-n',61,'jpn',NULL,0,0,'bench'),
+('00000015-n',62,'jpn',NULL,0,0,'bench'),
+('00000015-n',63,'jpn',NULL,0,0,'bench'),
+('00000015-n',64,'eng',NULL,0,0,'bench'),
+('00000016-n',65,'jpn',NULL,0,0,'bench'),
+('00000016-n',66,'jpn',NULL,0,0,'bench'),
+('00000016-n',67,'jpn',NULL,0,0,'bench'),
+('00000016-n',68,'eng',NULL,0,0,'bench'),
+('00000017-n',69,'jpn',NULL,0,0,'bench'),
+('00000017-n',70,'jpn',NULL,0,0,'bench'),
+('00000017-n',71,'jpn',NULL,0,0,'bench'),
+('00000017-n',72,'eng',NULL,0,0,'bench'),
+('00000018-v',73,'jpn',NULL,0,0,'bench'),
+('00000018-v',74,'jpn',NULL,0,0,'bench'),
+('00000018-v',75,'jpn',NULL,0,0,'bench'),
+('00000018-v',76,'eng',NULL,0,0,'bench'),
+('00000019-n',77,'jpn',NULL,0,0,'bench'),
+('00000019-n',78,'jpn',NULL,0,0,'bench'),
+('00000019-n',79,'jpn',NULL,0,0,'bench'),
+('00000019-n',80,'eng',NULL,0,0,'bench'),
+('00000020-n',81,'jpn',NULL,0,0,'bench'),
+('00000020-n',82,'jpn',NULL,0,0,'bench'),
+('00000020-n',83,'jpn',NULL,0,0,'bench'),
+('00000020-n',84,'eng',NULL,0,0,'bench'),
+('00000021-a',85,'jpn',NULL,0,0,'bench'),
+('00000021-a',86,'jpn',NULL,0,0,'bench'),
+('00000021-a',87,'jpn',NULL,0,0,'bench'),
+('00000021-a',88,'eng',NULL,0,0,'bench'),
+('00000022-v',89,'jpn',NULL,0,0,'bench'),
+('00000022-v',90,'jpn',NULL,0,0,'bench'),
+('00000022-v',91,'jpn',NULL,0,0,'bench'),
+('00000022-v',92,'eng',NULL,0,0,'bench'),
+('00000023-a',93,'jpn',NULL,0,0,'bench'),
+('00000023-a',94,'jpn',NULL,0,0,'bench'),
+('00000023-a',95,'jpn',NULL,0,0,'bench'),
+('00000023-a',96,'eng',NULL,0,0,'bench'),
+('00000024-n',97,'jpn',NULL,0,0,'bench'),
+('00000024-n',98,'jpn',NULL,0,0,'bench'),
+('00000024-n',99,'jpn',NULL,0,0,'bench'),
+('00000024-n',100,'eng',NULL,0,0,'bench'),
+('00000025-v',101,'jpn',NULL,0,0,'bench'),
+('00000025-v',102,'jpn',NULL,0,0,'bench'),
+('00000025-v',50,'jpn',NULL,0,0,'bench'),
+('00000025-v',103,'eng',NULL,0,0,'bench'),
+('00000026-n',104,'jpn',NULL,0,0,'bench'),
+('00000026-n',105,'jpn',NULL,0,0,'bench'),
+('00000026-n',106,'jpn',NULL,0,0,'bench'),
+('00000026-n',107,'eng',NULL,0,0,'bench'),
+('00000027-n',108,'jpn',NULL,0,0,'bench'),
+('00000027-n',109,'jpn',NULL,0,0,'bench'),
+('00000027-n',110,'jpn',NULL,0,0,'bench'),
+('00000027-n',111,'eng',NULL,0,0,'bench'),
+('00000028-v',112,'jpn',NULL,0,0,'bench'),
+('00000028-v',113,'jpn',NULL,0,0,'bench'),
+('00000028-v',114,'jpn',NULL,0,0,'bench'),
+('00000028-v',115,'eng',NULL,0,0,'bench'),
+('00000029-n',116,'jpn',NULL,0,0,'bench'),
+('00000029-n',117,'jpn',NULL,0,0,'bench'),
+('00000029-n',118,'jpn',NULL,0,0,'bench'),
+('00000029-n',119,'eng',NULL,0,0,'bench'),
+('00000030-a',120,'jpn',NULL,0,0,'bench'),
+('00000030-a',46,'jpn',NULL,0,0,'bench'),
+('00000030-a',121,'jpn',NULL,0,0,'bench'),
+('00000030-a',122,'eng',NULL,0,0,'bench'),
+('00000031-v',123,'jpn',NULL,0,0,'bench'),
+('00000031-v',124,'jpn',NULL,0,0,'bench'),
+('00000031-v',125,'jpn',NULL,0,0,'bench'),
+('00000031-v',126,'eng',NULL,0,0,'bench'),
+('00000032-n',127,'jpn',NULL,0,0,'bench'),
+('00000032-n',128,'jpn',NULL,0,0,'bench'),
+('00000032-n',129,'jpn',NULL,0,0,'bench'),
+('00000032-n',130,'eng',NULL,0,0,'bench'),
+('00000033-n',131,'jpn',NULL,0,0,'bench'),
+('00000033-n',132,'jpn',NULL,0,0,'bench'),
+('00000033-n',133,'jpn',NULL,0,0,'bench'),
+('00000033-n',134,'eng',NULL,0,0,'bench'),
+('00000034-n',135,'jpn',NULL,0,0,'bench'),
+('00000034-n',136,'jpn',NULL,0,0,'bench'),
+('00000034-n',137,'jpn',NULL,0,0,'bench'),
+('00000034-n',138,'eng',NULL,0,0,'bench'),
+('00000035-a',139,'jpn',NULL,0,0,'bench'),
+('00000035-a',46,'jpn',NULL,0,0,'bench'),
+('00000035-a',140,'jpn',NULL,0,0,'bench'),
+('00000035-a',141,'eng',NULL,0,0,'bench'),
+('00000036-n',142,'jpn',NULL,0,0,'bench'),
+('00000036-n',71,'jpn',NULL,0,0,'bench'),
+('00000036-n',143,'jpn',NULL,0,0,'bench'),
+('00000036-n',144,'eng',NULL,0,0,'bench'),
+('00000037-n',145,'jpn',NULL,0,0,'bench'),
+('00000037-n',146,'jpn',NULL,0,0,'bench'),
+('00000037-n',147,'jpn',NULL,0,0,'bench'),
+('00000037-n',148,'eng',NULL,0,0,'bench'),
+('00000038-n',149,'jpn',NULL,0,0,'bench'),
+('00000038-n',150,'jpn',NULL,0,0,'bench'),
+('00000038-n',151,'jpn',NULL,0,0,'bench'),
+('00000038-n',152,'eng',NULL,0,0,'bench'),
+('00000039-v',153,'jpn',NULL,0,0,'bench'),
+('00000039-v',154,'jpn',NULL,0,0,'bench'),
+('00000039-v',155,'jpn',NULL,0,0,'bench'),
+('00000039-v',156,'eng',NULL,0,0,'bench'),
+('00000040-n',157,'jpn',NULL,0,0,'bench'),
+('00000040-n',158,'jpn',NULL,0,0,'bench'),
+('00000040-n',159,'jpn',NULL,0,0,'bench'),
+('00000040-n',160,'eng',NULL,0,0,'bench'),
+('00000041-n',161,'jpn',NULL,0,0,'bench'),
+('00000041-n',162,'jpn',NULL,0,0,'bench'),
+('00000041-n',163,'jpn',NULL,0,0,'bench'),
+('00000041-n',164,'eng',NULL,0,0,'bench'),
+('00000042-n',165,'jpn',NULL,0,0,'bench'),
+('00000042-n',166,'jpn',NULL,0,0,'bench'),
+('00000042-n',167,'jpn',NULL,0,0,'bench'),
+('00000042-n',168,'eng',NULL,0,0,'bench'),
+('00000043-n',169,'jpn',NULL,0,0,'bench'),
+('00000043-n',17,'jpn',NULL,0,0,'bench'),
+('00000043-n',18,'jpn',NULL,0,0,'bench'),
+('00000043-n',170,'eng',NULL,0,0,'bench'),
+('00000044-v',171,'jpn',NULL,0,0,'bench'),
+('00000044-v',172,'jpn',NULL,0,0,'bench'),
+('00000044-v',173,'jpn',NULL,0,0,'bench'),
+('00000044-v',174,'eng',NULL,0,0,'bench'),
+('00000045-v',175,'jpn',NULL,0,0,'bench'),
+('00000045-v',176,'jpn',NULL,0,0,'bench'),
+('00000045-v',177,'jpn',NULL,0,0,'bench'),
+('00000045-v',178,'eng',NULL,0,0,'bench'),
+('00000046-n',179,'jpn',NULL,0,0,'bench'),
+('00000046-n',180,'jpn',NULL,0,0,'bench'),
+('00000046-n',181,'jpn',NULL,0,0,'bench'),
+('00000046-n',182,'eng',NULL,0,0,'bench'),
+('00000047-v',183,'jpn',NULL,0,0,'bench'),
+('00000047-v',50,'jpn',NULL,0,0,'bench'),
+('00000047-v',184,'jpn',NULL,0,0,'bench'),
+('00000047-v',185,'eng',NULL,0,0,'bench'),
+('00000048-n',186,'jpn',NULL,0,0,'bench'),
+('00000048-n',187,'jpn',NULL,0,0,'bench'),
+('00000048-n',188,'jpn',NULL,0,0,'bench'),
+('00000048-n',189,'eng',NULL,0,0,'bench'),
+('00000049-v',190,'jpn',NULL,0,0,'bench'),
+('00000049-v',191,'jpn',NULL,0,0,'bench'),
+('00000049-v',58,'jpn',NULL,0,0,'bench'),
+('00000049-v',192,'eng',NULL,0,0,'bench'),
+('00000050-v',193,'jpn',NULL,0,0,'bench'),
+('00000050-v',194,'jpn',NULL,0,0,'bench'),
+('00000050-v',195,'jpn',NULL,0,0,'bench'),
+('00000050-v',196,'eng',NULL,0,0,'bench'),
+('00000051-n',197,'jpn',NULL,0,0,'bench'),
+('00000051-n',198,'jpn',NULL,0,0,'bench'),
+('00000051-n',199,'jpn',NULL,0,0,'bench'),
+('00000051-n',200,'eng',NULL,0,0,'bench'),
+('00000052-n',201,'jpn',NULL,0,0,'bench'),
+('00000052-n',202,'jpn',NULL,0,0,'bench'),
+('00000052-n',203,'jpn',NULL,0,0,'bench'),
+('00000052-n',204,'eng',NULL,0,0,'bench'),
+('00000053-n',205,'jpn',NULL,0,0,'bench'),
+('00000053-n',206,'jpn',NULL,0,0,'bench'),
+('00000053-n',207,'jpn',NULL,0,0,'bench'),
+('00000053-n',208,'eng',NULL,0,0,'bench'),
+('00000054-v',209,'jpn',NULL,0,0,'bench'),
+('00000054-v',210,'jpn',NULL,0,0,'bench'),
+('00000054-v',211,'jpn',NULL,0,0,'bench'),
+('00000054-v',212,'eng',NULL,0,0,'bench'),
+('00000055-n',213,'jpn',NULL,0,0,'bench'),
+('00000055-n',214,'jpn',NULL,0,0,'bench'),
+('00000055-n',215,'jpn',NULL,0,0,'bench'),
+('00000055-n',216,'eng',NULL,0,0,'bench'),
+('00000056-a',217,'jpn',NULL,0,0,'bench'),
+('00000056-a',218,'jpn',NULL,0,0,'bench'),
+('00000056-a',219,'jpn',NULL,0,0,'bench'),
+('00000056-a',220,'eng',NULL,0,0,'bench'),
+('00000057-v',221,'jpn',NULL,0,0,'bench'),
+('00000057-v',222,'jpn',NULL,0,0,'bench'),
+('00000057-v',223,'jpn',NULL,0,0,'bench'),
+('00000057-v',224,'eng',NULL,0,0,'bench'),
+('00000058-n',225,'jpn',NULL,0,0,'bench'),
+('00000058-n',226,'jpn',NULL,0,0,'bench'),
+('00000058-n',227,'jpn',NULL,0,0,'bench'),
+('00000058-n',228,'eng',NULL,0,0,'bench'),
+('00000059-n',229,'jpn',NULL,0,0,'bench'),
+('00000059-n',230,'jpn',NULL,0,0,'bench'),
+('00000059-n',231,'jpn',NULL,0,0,'bench'),
+('00000059-n',232,'eng',NULL,0,0,'bench'),
+('00000060-v',233,'jpn',NULL,0,0,'bench'),
+('00000060-v',234,'jpn',NULL,0,0,'bench'),
+('00000060-v',235,'jpn',NULL,0,0,'bench'),
+('00000060-v',236,'eng',NULL,0,0,'bench'),
+('00000061-n',237,'jpn',NULL,0,0,'bench'),
+('00000061-n',238,'jpn',NULL,0,0,'bench'),
+('00000061-n',239,'jpn',NULL,0,0,'bench'),
+('00000061-n',240,'eng',NULL,0,0,'bench'),
+('00000062-n',241,'jpn',NULL,0,0,'bench'),
+('00000062-n',242,'jpn',NULL,0,0,'bench'),
+('00000062-n',243,'jpn',NULL,0,0,'bench'),
+('00000062-n',244,'eng',NULL,0,0,'bench'),
+('00000063-n',245,'jpn',NULL,0,0,'bench'),
+('00000063-n',66,'jpn',NULL,0,0,'bench'),
+('00000063-n',246,'jpn',NULL,0,0,'bench'),
+('00000063-n',247,'eng',NULL,0,0,'bench'),
+('00000064-v',248,'jpn',NULL,0,0,'bench'),
+('00000064-v',249,'jpn',NULL,0,0,'bench'),
+('00000064-v',14,'jpn',NULL,0,0,'bench'),
+('00000064-v',250,'eng',NULL,0,0,'bench'),
+('00000065-n',251,'jpn',NULL,0,0,'bench'),
+('00000065-n',252,'jpn',NULL,0,0,'bench'),
+('00000065-n',253,'jpn',NULL,0,0,'bench'),
+('00000065-n',254,'eng',NULL,0,0,'bench'),
+('00000066-v',255,'jpn',NULL,0,0,'bench'),
+('00000066-v',256,'jpn',NULL,0,0,'bench'),
+('00000066-v',257,'jpn',NULL,0,0,'bench'),
+('00000066-v',258,'eng',NULL,0,0,'bench'),
+('00000067-n',259,'jpn',NULL,0,0,'bench'),
+('00000067-n',260,'jpn',NULL,0,0,'bench'),
+('00000067-n',261,'jpn',NULL,0,0,'bench'),
+('00000067-n',262,'eng',NULL,0,0,'bench'),
+('00000068-v',263,'jpn',NULL,0,0,'bench'),
+('00000068-v',184,'jpn',NULL,0,0,'bench'),
+('00000068-v',90,'jpn',NULL,0,0,'bench'),
+('00000068-v',264,'eng',NULL,0,0,'bench'),
+('00000069-n',265,'jpn',NULL,0,0,'bench'),
+('00000069-n',266,'jpn',NULL,0,0,'bench'),
+('00000069-n',267,'jpn',NULL,0,0,'bench'),
+('00000069-n',268,'eng',NULL,0,0,'bench'),
+('00000070-n',269,'jpn',NULL,0,0,'bench'),
+('00000070-n',270,'jpn',NULL,0,0,'bench'),
+('00000070-n',271,'jpn',NULL,0,0,'bench'),
+('00000070-n',272,'eng',NULL,0,0,'bench'),
+('00000071-a',273,'jpn',NULL,0,0,'bench'),
+('00000071-a',274,'jpn',NULL,0,0,'bench'),
+('00000071-a',275,'jpn',NULL,0,0,'bench'),
+('00000071-a',276,'eng',NULL,0,0,'bench'),
+('00000072-v',277,'jpn',NULL,0,0,'bench'),
+('00000072-v',278,'jpn',NULL,0,0,'bench'),
+('00000072-v',279,'jpn',NULL,0,0,'bench'),
+('00000072-v',280,'eng',NULL,0,0,'bench');
+INSERT INTO synset VALUES
+('00000000-n','n','synset_0','bench'),
+('00000001-n','n','synset_1','bench'),
+('00000002-n','n','synset_2','bench'),
+('00000003-v','v','synset_3','bench'),
+('00000004-n','n','synset_4','bench'),
+('00000005-n','n','synset_5','bench'),
+('00000006-v','v','synset_6','bench'),
+('00000007-v','v','synset_7','bench'),
+('00000008-n','n','synset_8','bench'),
+('00000009-n','n','synset_9','bench'),
+('00000010-n','n','synset_10','bench'),
+('00000011-a','a','synset_11','bench'),
+('00000012-v','v','synset_12','bench'),
+('00000013-n','n','synset_13','bench'),
+('00000014-v','v','synset_14','bench'),
+('00000015-n','n','synset_15','bench'),
+('00000016-n','n','synset_16','bench'),
+('00000017-n','n','synset_17','bench'),
+('00000018-v','v','synset_18','bench'),
+('00000019-n','n','synset_19','bench'),
+('00000020-n','n','synset_20','bench'),
+('00000021-a','a','synset_21','bench'),
+('00000022-v','v','synset_22','bench'),
+('00000023-a','a','synset_23','bench'),
+('00000024-n','n','synset_24','bench'),
+('00000025-v','v','synset_25','bench'),
+('00000026-n','n','synset_26','bench'),
+('00000027-n','n','synset_27','bench'),
+('00000028-v','v','synset_28','bench'),
+('00000029-n','n','synset_29','bench'),
+('00000030-a','a','synset_30','bench'),
+('00000031-v','v','synset_31','bench'),
+('00000032-n','n','synset_32','bench'),
+('00000033-n','n','synset_33','bench'),
+('00000034-n','n','synset_34','bench'),
+('00000035-a','a','synset_35','bench'),
+('00000036-n','n','synset_36','bench'),
+('00000037-n','n','synset_37','bench'),
+('00000038-n','n','synset_38','bench'),
+('00000039-v','v','synset_39','bench'),
+('00000040-n','n','synset_40','bench'),
+('00000041-n','n','synset_41','bench'),
+('00000042-n','n','synset_42','bench'),
+('00000043-n','n','synset_43','bench'),
+('00000044-v','v','synset_44','bench'),
+('00000045-v','v','synset_45','bench'),
+('00000046-n','n','synset_46','bench'),
+('00000047-v','v','synset_47','bench'),
+('00000048-n','n','synset_48','bench'),
+('00000049-v','v','synset_49','bench'),
+('00000050-v','v','synset_50','bench'),
+('00000051-n','n','synset_51','bench'),
+('00000052-n','n','synset_52','bench'),
+('00000053-n','n','synset_53','bench'),
+('00000054-v','v','synset_54','bench'),
+('00000055-n','n','synset_55','bench'),
+('00000056-a','a','synset_56','bench'),
+('00000057-v','v','synset_57','bench'),
+('00000058-n','n','synset_58','bench'),
+('00000059-n','n','synset_59','bench'),
+('00000060-v','v','synset_60','bench'),
+('00000061-n','n','synset_61','bench'),
+('00000062-n','n','synset_62','bench'),
+('00000063-n','n','synset_63','bench'),
+('00000064-v','v','synset_64','bench'),
+('00000065-n','n','synset_65','bench'),
+('00000066-v','v','synset_66','bench'),
+('00000067-n','n','synset_67','bench'),
+('00000068-v','v','synset_68','bench'),
+('00000069-n','n','synset_69','bench'),
+('00000070-n','n','synset_70','bench'),
+('00000071-a','a','synset_71','bench'),
+('00000072-v','v','synset_72','bench');
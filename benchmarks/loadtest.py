@@ -0,0 +1,262 @@
+"""Replays a request log against ``/translate`` to measure capacity
+
+The log is a JSONL file, optionally compressed, where each line is the body of
+a request::
+
+    python -m benchmarks.loadtest requests.jsonl --url http://127.0.0.1:8000
+    python -m benchmarks.loadtest requests.jsonl --rate 20 --concurrency 32
+
+Without ``--rate``, each of the ``--concurrency`` clients sends its next
+request as soon as the previous one completed (closed loop). With it, requests
+arrive following a Poisson process regardless of the responses (open loop).
+``--in-process`` calls ``Processor.process_sentence`` directly instead, which
+gives the cost of the models alone.
+"""
+import argparse
+import json
+import logging
+import random
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.run import build_fixtures
+from slt import settings
+from slt.ngram import open_corpus
+from slt.processor import Processor
+
+
+# latency in seconds and error, if the request failed
+Result = Tuple[float, Optional[str]]
+
+
+def read_log(path: str, field: str = "sentence", limit: int = None) -> List[str]:
+    sentences = []
+    with open_corpus(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if field in record:
+                sentences.append(record[field])
+    if not sentences:
+        raise ValueError(f"no {field} field in {path}")
+    if limit is not None:
+        # cycle through the log when more requests than it contains are wanted
+        sentences = [sentences[i % len(sentences)] for i in range(limit)]
+    return sentences
+
+
+class HttpTarget:  # pylint: disable=too-few-public-methods
+    def __init__(self, url: str, timeout: float):
+        self.url = url.rstrip("/") + "/translate"
+        self.timeout = timeout
+
+    def __call__(self, sentence: str):
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps({"sentence": sentence}).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class ProcessorTarget:  # pylint: disable=too-few-public-methods
+    def __init__(self, processor: Processor):
+        """Calls are serialized as the Sudachi tokenizer cannot be used by
+        several threads at once, like in a single synchronous worker
+        """
+        self.processor = processor
+        self._lock = threading.Lock()
+
+    def __call__(self, sentence: str):
+        with self._lock:
+            new_sentence, old_sentence = self.processor.process_sentence(sentence)
+        # serialized as well to compare with what the server does
+        json.dumps(
+            {
+                "new_sentence": new_sentence.as_dict(),
+                "old_sentence": old_sentence.as_dict(),
+            }
+        )
+
+
+def timed_call(
+    target: Callable[[str], None], sentence: str, start: float = None
+) -> Result:
+    """Latencies are counted from ``start``, the time at which the request was
+    scheduled, so that the time spent waiting for a free client is included
+    """
+    if start is None:
+        start = time.perf_counter()
+    try:
+        target(sentence)
+    except urllib.error.HTTPError as e:
+        return time.perf_counter() - start, f"http {e.code}"
+    except Exception as e:  # pylint: disable=broad-except
+        return time.perf_counter() - start, type(e).__name__
+    return time.perf_counter() - start, None
+
+
+def run_closed_loop(
+    target: Callable[[str], None], sentences: List[str], concurrency: int
+) -> List[Result]:
+    results = []
+    remaining = iter(sentences)
+    lock = threading.Lock()
+
+    def client():
+        while True:
+            with lock:
+                sentence = next(remaining, None)
+            if sentence is None:
+                return
+            result = timed_call(target, sentence)
+            with lock:
+                results.append(result)
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def run_open_loop(
+    target: Callable[[str], None],
+    sentences: List[str],
+    rate: float,
+    concurrency: int,
+    seed: int = 0,
+) -> List[Result]:
+    rng = random.Random(seed)
+    futures = []
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        scheduled = time.perf_counter()
+        for sentence in sentences:
+            scheduled += rng.expovariate(rate)
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            futures.append(executor.submit(timed_call, target, sentence, scheduled))
+    return [future.result() for future in futures]
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile of the sorted ``values``"""
+    if not values:
+        return None
+    return values[min(len(values) - 1, max(0, round(q / 100 * len(values)) - 1))]
+
+
+def summarize(results: List[Result], duration: float) -> Dict[str, Any]:
+    latencies = sorted(latency for latency, error in results if error is None)
+    errors = Counter(error for _, error in results if error is not None)
+    return {
+        "requests": len(results),
+        "errors": dict(errors),
+        "error_rate": sum(errors.values()) / len(results) if results else 0.0,
+        "duration": duration,
+        "throughput": len(latencies) / duration if duration else 0.0,
+        "latency": {
+            "mean": sum(latencies) / len(latencies) if latencies else None,
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+            "max": latencies[-1] if latencies else None,
+        },
+    }
+
+
+def print_summary(summary: Dict[str, Any]):
+    print(
+        f"requests={summary['requests']}\t"
+        f"throughput={summary['throughput']:.1f}/s\t"
+        f"error_rate={summary['error_rate']:.2%}"
+    )
+    latency = summary["latency"]
+    if latency["p50"] is not None:
+        print(
+            "\t".join(
+                f"{name}={latency[name] * 1000:.1f}ms"
+                for name in ["mean", "p50", "p95", "p99", "max"]
+            )
+        )
+    for error, count in sorted(summary["errors"].items()):
+        print(f"{error}\t{count}")
+
+
+def load_processor(fixtures: bool, japanese_model: str, directory: str) -> Processor:
+    if not fixtures:
+        return Processor.load(japanese_model=japanese_model)
+    return Processor.load(**build_fixtures(directory, japanese_model))
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format=settings.LOG_FORMAT)
+    parser = argparse.ArgumentParser(prog="benchmarks.loadtest")
+    parser.add_argument("log", help="JSONL file with one request body per line")
+    parser.add_argument("--field", default="sentence")
+    parser.add_argument("--url", default="http://127.0.0.1:5000")
+    parser.add_argument("-c", "--concurrency", type=int, default=8)
+    parser.add_argument(
+        "-r", "--rate", type=float, help="requests per second, open loop if given"
+    )
+    parser.add_argument(
+        "-n", "--requests", type=int, help="defaults to the size of the log"
+    )
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="call Processor.process_sentence instead of the server",
+    )
+    parser.add_argument(
+        "--fixtures",
+        action="store_true",
+        help="use the benchmark fixture models with --in-process",
+    )
+    parser.add_argument("-m", "--model", default=settings.JAPANESE_MODEL)
+    parser.add_argument("-o", "--output", help="write the summary as JSON")
+    args = parser.parse_args()
+
+    sentences = read_log(args.log, field=args.field, limit=args.requests)
+    with tempfile.TemporaryDirectory() as directory:
+        if args.in_process:
+            processor = load_processor(args.fixtures, args.model, directory)
+            target = ProcessorTarget(processor)
+        else:
+            target = HttpTarget(args.url, args.timeout)
+
+        logging.info("sending %s requests", len(sentences))
+        start = time.perf_counter()
+        if args.rate:
+            results = run_open_loop(
+                target, sentences, args.rate, args.concurrency, seed=args.seed
+            )
+        else:
+            results = run_closed_loop(target, sentences, args.concurrency)
+        summary = summarize(results, time.perf_counter() - start)
+
+    summary["config"] = {
+        "target": "processor" if args.in_process else args.url,
+        "mode": "open" if args.rate else "closed",
+        "rate": args.rate,
+        "concurrency": args.concurrency,
+    }
+    print_summary(summary)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
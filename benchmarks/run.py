@@ -0,0 +1,254 @@
+"""Benchmarks of the simplification pipeline
+
+Everything runs offline on the models bundled in ``benchmarks/fixtures``::
+
+    python -m benchmarks.run -o results.json
+    python -m benchmarks.compare before.json results.json
+"""
+import argparse
+import gzip
+import json
+import logging
+import os
+import platform
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+import spacy
+
+from slt import settings
+from slt.loading import LOAD_TIMES
+from slt.processor import Processor
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+SENTENCES_PATH = os.path.join(FIXTURES_DIR, "sentences.txt")
+
+# upper bound of the number of tokens of each group of sentences
+LENGTHS = {"short": 10, "medium": 25, "long": None}
+
+
+def fixture(name: str) -> str:
+    return os.path.join(FIXTURES_DIR, name)
+
+
+def build_fixtures(directory: str, japanese_model: str) -> Dict[str, str]:
+    """Writes the bundled models to ``directory`` in the formats expected by
+    ``Processor.load`` and returns its arguments
+
+    ``japanese_model`` can be ``blank`` to only use the tokenizer, which does
+    not require any downloaded model
+    """
+    wordnet_db_path = os.path.join(directory, "wordnet.db")
+    with open(fixture("wordnet.sql")) as f:
+        db = sqlite3.connect(wordnet_db_path)
+        db.executescript(f.read())
+        db.commit()
+        db.close()
+
+    ngrams_path = os.path.join(directory, "ngrams.json.gz")
+    with open(fixture("ngrams.json"), "rb") as f, gzip.open(ngrams_path, "wb") as out:
+        shutil.copyfileobj(f, out)
+
+    if japanese_model == "blank":
+        japanese_model = os.path.join(directory, "ja_blank")
+        spacy.blank("ja").to_disk(japanese_model)
+
+    return {
+        "wordnet_db_path": wordnet_db_path,
+        "w2v_model_path": fixture("vectors.txt"),
+        "japanese_model": japanese_model,
+        "jlpt_words_path": settings.JLPT_WORDS_PATH,
+        "ngrams_path": ngrams_path,
+        "verbs_path": fixture("verbs.csv"),
+        "lazy_ngrams": False,
+    }
+
+
+def read_sentences(path: str = SENTENCES_PATH) -> List[str]:
+    with open(path) as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def measure(
+    func: Callable[[], Any], repeat: int, setup: Callable[[], Any] = None
+) -> Dict[str, float]:
+    """Calls ``func`` once to warm up then ``repeat`` times, ``setup`` is
+    called before each call and is not timed
+    """
+    times = []
+    for i in range(repeat + 1):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        if i > 0:
+            times.append(time.perf_counter() - start)
+    times.sort()
+    return {
+        "repeat": repeat,
+        "mean": statistics.mean(times),
+        "median": statistics.median(times),
+        "min": times[0],
+        "max": times[-1],
+        "stdev": statistics.stdev(times) if repeat > 1 else 0.0,
+    }
+
+
+def group_by_length(nlp, sentences: List[str]) -> Dict[str, List[str]]:
+    groups = {name: [] for name in LENGTHS}
+    for sentence in sentences:
+        length = len(nlp.make_doc(sentence))
+        for name, limit in LENGTHS.items():
+            if limit is None or length < limit:
+                groups[name].append(sentence)
+                break
+    return groups
+
+
+def run_benchmarks(
+    fixtures: Dict[str, str], sentences: List[str], repeat: int, load_repeat: int
+) -> Dict[str, Dict[str, float]]:
+    results = {}
+
+    def load():
+        return Processor.load(**fixtures)
+
+    results["load"] = measure(load, load_repeat)
+    results["load"]["steps"] = dict(LOAD_TIMES)
+    processor = load()
+    extractor = processor.synonyms_extractor
+    docs = [processor.nlp(sentence) for sentence in sentences]
+
+    for name, group in group_by_length(processor.nlp, sentences).items():
+        if not group:
+            continue
+
+        def process_sentences(group=group):
+            for sentence in group:
+                processor.process_sentence(sentence)
+
+        results[f"process_sentence/{name}"] = measure(process_sentences, repeat)
+        results[f"process_sentence/{name}"]["items"] = len(group)
+
+    def process_all():
+        for sentence in sentences:
+            processor.process_sentence(sentence)
+
+    results["process_sentence/cold"] = measure(
+        process_all, repeat, setup=processor.clear_cache
+    )
+    results["process_sentence/cold"]["items"] = len(sentences)
+
+    words_with_pos = sorted(
+        {(t.lemma_, t.pos_) for doc in docs for t in doc if not processor.is_skipped(t)}
+    )
+
+    def find_synonyms():
+        for word, pos in words_with_pos:
+            extractor.find_synonyms(word, topn=-1, pos=pos)
+
+    results["find_synonyms/cold"] = measure(
+        find_synonyms, repeat, setup=extractor.clear_cache
+    )
+    results["find_synonyms/warm"] = measure(find_synonyms, repeat)
+    results["find_synonyms/batch"] = measure(
+        lambda: extractor.find_synonyms_batch(words_with_pos, topn=-1),
+        repeat,
+        setup=extractor.clear_cache,
+    )
+    for name in ["find_synonyms/cold", "find_synonyms/warm", "find_synonyms/batch"]:
+        results[name]["items"] = len(words_with_pos)
+
+    # the bigrams looked up when checking the candidates of a token
+    bigrams = [
+        doc[i - 1].text + doc[i].text for doc in docs for i in range(1, len(doc))
+    ]
+
+    def ngram_lookups():
+        for bigram in bigrams:
+            processor.ngrams[bigram]  # pylint: disable=pointless-statement
+
+    results["ngrams"] = measure(ngram_lookups, repeat)
+    results["ngrams"]["items"] = len(bigrams)
+
+    conjugations = [
+        (
+            "".join(t.text for t in verb_tokens),
+            [t.lemma_ for t in verb_tokens],
+            candidate,
+        )
+        for doc in docs
+        for token in doc
+        if token.pos_ == "VERB"
+        for verb_tokens in [processor.get_verb_tokens(token)]
+        for candidate in extractor.find_synonyms(token.lemma_, topn=-1, pos="VERB")
+    ]
+
+    def adjust_conjugations():
+        for verb, lemmas, candidate in conjugations:
+            processor.conjugator.adjust_conjugation(verb, lemmas, candidate)
+
+    results["conjugation"] = measure(adjust_conjugations, repeat)
+    results["conjugation"]["items"] = len(conjugations)
+
+    return results
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=settings.PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING, format=settings.LOG_FORMAT)
+    parser = argparse.ArgumentParser(prog="benchmarks.run")
+    parser.add_argument("-o", "--output", help="defaults to stdout")
+    parser.add_argument("-r", "--repeat", type=int, default=20)
+    parser.add_argument("--load-repeat", type=int, default=3)
+    parser.add_argument(
+        "-m",
+        "--model",
+        default=settings.JAPANESE_MODEL,
+        help="spaCy model, or blank to only use the tokenizer",
+    )
+    parser.add_argument("-s", "--sentences", default=SENTENCES_PATH)
+    args = parser.parse_args()
+
+    sentences = read_sentences(args.sentences)
+    with tempfile.TemporaryDirectory() as directory:
+        fixtures = build_fixtures(directory, args.model)
+        results = run_benchmarks(fixtures, sentences, args.repeat, args.load_repeat)
+
+    report = {
+        "commit": git_commit(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "spacy": spacy.__version__,
+        "model": args.model,
+        "sentences": len(sentences),
+        "results": results,
+    }
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""gunicorn configuration sharing the models between workers
+
+The application, and with it every model, is loaded once in the master
+process. Workers are forked from it and share the loaded models copy-on-write
+instead of each loading their own copy::
+
+    gunicorn -c gunicorn.conf.py slt.slt_web:app
+"""
+import gc
+import os
+import shutil
+import tempfile
+
+
+# models must be loaded before forking, not in a background thread
+os.environ.setdefault("MODEL_LOADING", "eager")
+
+# workers write their metrics there so that /metrics can aggregate them,
+# it must be set before prometheus_client is imported
+metrics_dir = os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "slt-metrics")
+)
+shutil.rmtree(metrics_dir, ignore_errors=True)
+os.makedirs(metrics_dir)
+
+bind = os.environ.get("BIND", "127.0.0.1:8000")
+workers = int(os.environ.get("WEB_CONCURRENCY", "4"))
+preload_app = True
+# loading the word2vec model takes longer than the default 30 seconds
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "120"))
+
+# Objects allocated and freed while loading leave holes in memory pages that
+# later allocations in the workers would fill, copying the pages. Collections
+# in the workers would also write to the header of every object inherited
+# from the master. The garbage collector is disabled until the models are
+# loaded and the inherited objects are then frozen, see ``gc.freeze``
+gc.disable()
+
+
+def pre_fork(server, worker):  # pylint: disable=unused-argument
+    gc.freeze()
+
+
+def post_fork(server, worker):  # pylint: disable=unused-argument
+    gc.enable()
+
+
+def child_exit(server, worker):  # pylint: disable=unused-argument
+    # pylint: disable=import-outside-toplevel
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
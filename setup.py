@@ -3,7 +3,7 @@ from setuptools import setup, find_packages
 
 setup(
     name="slt",
-    packages=find_packages(exclude=("tests",)),
+    packages=find_packages(exclude=("tests", "benchmarks")),
     install_requires=[
         "gensim",
         "spacy",
@@ -12,6 +12,8 @@ setup(
         "python-dotenv",
         "sklearn",
         "flask-cors",
+        "prometheus-client",
+        "msgpack",
     ],
     extras_require={
         "dev": [
@@ -21,6 +23,7 @@ setup(
         ],
         "deploy": [
             "gunicorn",
+            "uvicorn",
         ],
     },
 )
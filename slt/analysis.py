@@ -0,0 +1,69 @@
+from typing import List, Optional, Tuple
+
+from spacy.tokens import Doc, Token
+
+
+HONORIFIC_PREFIXES = ["お", "ご"]
+COPULAS = ["な", "だ"]
+# dependencies of the tokens conjugating a verb
+VERB_GROUP_DEPS = ["aux", "mark"]
+
+
+class DocAnalysis:
+    __slots__ = ("verb_groups", "honorific_prefix", "copula")
+
+    def __init__(self, doc: Doc):
+        """Dependencies needed to replace the tokens of ``doc``, gathered in a
+        single pass over it and indexed by token position
+        """
+        length = len(doc)
+        last_left = [-1] * length
+        rights: List[List[Token]] = [[] for _ in range(length)]
+        for token in doc:
+            head = token.head.i
+            if token.i < head:
+                last_left[head] = token.i
+            elif token.i > head:
+                rights[head].append(token)
+
+        # tokens conjugating each verb, starting with the verb itself
+        self.verb_groups: List[Optional[List[Token]]] = [None] * length
+        # preceded by お or ご, which is replaced with the token
+        self.honorific_prefix = [False] * length
+        # adjectives followed by な or だ
+        self.copula = [False] * length
+        for token in doc:
+            i = token.i
+            left = last_left[i]
+            self.honorific_prefix[i] = (
+                left >= 0
+                and doc[left].pos_ == "INTJ"
+                and doc[left].text in HONORIFIC_PREFIXES
+            )
+            if token.pos_ == "VERB":
+                group = [token]
+                for right in rights[i]:
+                    if right.dep_ not in VERB_GROUP_DEPS:
+                        break
+                    group.append(right)
+                self.verb_groups[i] = group
+            elif token.pos_ == "ADJ":
+                self.copula[i] = bool(rights[i]) and rights[i][0].text in COPULAS
+
+    def count_to_replace(self, token: Token, new_word_surface: str) -> Tuple[int, int]:
+        """Number of tokens before and after ``token`` replaced along with it
+        by ``new_word_surface``
+        """
+        i = token.i
+        before, after = 0, 0
+        if self.verb_groups[i] is not None:
+            after = len(self.verb_groups[i]) - 1
+        elif (
+            self.copula[i]
+            and new_word_surface.endswith("い")
+            or new_word_surface.endswith("かった")
+        ):
+            after = 1
+        if self.honorific_prefix[i]:
+            before = 1
+        return (before, after)
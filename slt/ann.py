@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import time
+from typing import Tuple
+
+import numpy as np
+
+from slt import settings
+
+
+INDEX_SUFFIX = ".ivf.npz"
+# k-means sample points per cluster
+SAMPLE_PER_LIST = 50
+
+
+def index_path(model_path: str) -> str:
+    """The index is persisted next to the model it was built from"""
+    return model_path + INDEX_SUFFIX
+
+
+def compute_norms(vectors: np.ndarray, chunk_size: int = 100_000) -> np.ndarray:
+    norms = np.empty(len(vectors), dtype=np.float32)
+    for start in range(0, len(vectors), chunk_size):
+        norms[start : start + chunk_size] = np.linalg.norm(
+            vectors[start : start + chunk_size], axis=1
+        )
+    norms[norms == 0] = 1
+    return norms
+
+
+def nearest_centroids(
+    vectors: np.ndarray, centroids: np.ndarray, chunk_size: int = 8192
+) -> np.ndarray:
+    """Index of the centroid the most similar to each vector, computed by
+    chunks so that the similarities of only ``chunk_size`` vectors to every
+    centroid are held at once
+    """
+    assignment = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), chunk_size):
+        chunk = vectors[start : start + chunk_size]
+        assignment[start : start + chunk_size] = np.argmax(chunk @ centroids.T, axis=1)
+    return assignment
+
+
+class IVFIndex:
+    def __init__(
+        self,
+        vectors: np.ndarray,
+        norms: np.ndarray,
+        centroids: np.ndarray,
+        order: np.ndarray,
+        offsets: np.ndarray,
+        nprobe: int = settings.ANN_NPROBE,
+    ):
+        """Inverted file index for approximate cosine similarity search.
+
+        Vectors are clustered with spherical k-means; a query only scans the
+        vectors of the ``nprobe`` clusters whose centroids are the most similar
+        to it. Increasing ``nprobe`` improves recall at the cost of latency.
+        ``vectors`` are not copied, the index only stores the clustering
+        """
+        self.vectors = vectors
+        self.norms = norms
+        self.centroids = centroids
+        self.order = order
+        self.offsets = offsets
+        self.nprobe = nprobe
+
+    @property
+    def n_lists(self) -> int:
+        return len(self.centroids)
+
+    def search(
+        self, vector: np.ndarray, topn: int = 10, nprobe: int = None, exclude: int = -1
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the ids and cosine similarities of the ``topn`` vectors the
+        most similar to ``vector``, ignoring the vector at index ``exclude``
+        """
+        nprobe = min(nprobe or self.nprobe, self.n_lists)
+        query = vector / (np.linalg.norm(vector) or 1)
+        centroid_scores = self.centroids @ query
+        probes = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe]
+        ids = np.concatenate(
+            [self.order[self.offsets[c] : self.offsets[c + 1]] for c in probes]
+        )
+        ids = ids[ids != exclude]
+        scores = (self.vectors[ids] @ query) / self.norms[ids]
+        if len(ids) > topn:
+            best = np.argpartition(-scores, topn - 1)[:topn]
+            ids, scores = ids[best], scores[best]
+        ranking = np.argsort(-scores)
+        return ids[ranking], scores[ranking]
+
+    @classmethod
+    def build(
+        cls,
+        vectors: np.ndarray,
+        n_lists: int = None,
+        sample_size: int = None,
+        iterations: int = 10,
+        chunk_size: int = 8192,
+        seed: int = 0,
+        **kwargs,
+    ) -> IVFIndex:
+        """Clusters ``vectors`` into ``n_lists`` lists, by default the square
+        root of their number, with k-means on ``sample_size`` of them, by
+        default ``SAMPLE_PER_LIST`` per list
+        """
+        rng = np.random.default_rng(seed)
+        norms = compute_norms(vectors)
+        if n_lists is None:
+            n_lists = max(1, int(np.sqrt(len(vectors))))
+        if sample_size is None:
+            sample_size = SAMPLE_PER_LIST * n_lists
+        sample_ids = rng.choice(
+            len(vectors), min(sample_size, len(vectors)), replace=False
+        )
+        sample = vectors[sample_ids] / norms[sample_ids, None]
+        n_lists = min(n_lists, len(sample))
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)]
+
+        for i in range(iterations):
+            assignment = nearest_centroids(sample, centroids, chunk_size)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            counts = np.bincount(assignment, minlength=n_lists)
+            # empty clusters keep their previous centroid
+            non_empty = counts > 0
+            centroids[non_empty] = sums[non_empty] / np.linalg.norm(
+                sums[non_empty], axis=1, keepdims=True
+            )
+            logging.info("k-means iteration %s/%s", i + 1, iterations)
+
+        assignment = nearest_centroids(vectors, centroids, chunk_size)
+        order = np.argsort(assignment, kind="stable").astype(np.int32)
+        offsets = np.concatenate(
+            [[0], np.cumsum(np.bincount(assignment, minlength=n_lists))]
+        )
+        return cls(vectors, norms, centroids, order, offsets, **kwargs)
+
+    def save(self, path: str):
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                norms=self.norms,
+                centroids=self.centroids,
+                order=self.order,
+                offsets=self.offsets,
+            )
+
+    @classmethod
+    def load(cls, path: str, vectors: np.ndarray, **kwargs) -> IVFIndex:
+        with np.load(path) as data:
+            if len(data["order"]) != len(vectors):
+                raise ValueError(f"{path} was not built for this model")
+            return cls(
+                vectors,
+                data["norms"],
+                data["centroids"],
+                data["order"],
+                data["offsets"],
+                **kwargs,
+            )
+
+    @classmethod
+    def load_or_build(cls, path: str, vectors: np.ndarray, **kwargs) -> IVFIndex:
+        if os.path.exists(path):
+            return cls.load(path, vectors, **kwargs)
+        logging.info("building ANN index at %s", path)
+        index = cls.build(vectors, **kwargs)
+        index.save(path)
+        return index
+
+
+def benchmark(model, index: IVFIndex, queries: int, topn: int, nprobes):
+    rng = np.random.default_rng(0)
+    # restrict queries to frequent words, which are the ones actually looked up
+    words = [
+        model.index_to_key[i]
+        for i in rng.choice(min(len(model), 50_000), queries, replace=False)
+    ]
+    start = time.perf_counter()
+    exact = [{w for w, _ in model.most_similar(word, topn=topn)} for word in words]
+    exact_time = (time.perf_counter() - start) / queries
+    print(f"exact\tlatency={exact_time * 1000:.2f}ms\trecall=1.000")
+    for nprobe in nprobes:
+        start = time.perf_counter()
+        approx = [
+            index.search(
+                model.get_vector(word),
+                topn=topn,
+                nprobe=nprobe,
+                exclude=model.key_to_index[word],
+            )[0]
+            for word in words
+        ]
+        approx_time = (time.perf_counter() - start) / queries
+        recall = np.mean(
+            [
+                len(expected & {model.index_to_key[i] for i in ids}) / len(expected)
+                for expected, ids in zip(exact, approx)
+            ]
+        )
+        print(
+            f"nprobe={nprobe}\tlatency={approx_time * 1000:.2f}ms\trecall={recall:.3f}"
+        )
+
+
+def main():
+    # pylint: disable=import-outside-toplevel
+    # imported here as slt.synonyms depends on this module
+    from slt.synonyms import load_word2vec_model
+
+    logging.basicConfig(level=logging.INFO, format=settings.LOG_FORMAT)
+    parser = argparse.ArgumentParser(prog="ann")
+    parser.add_argument(
+        "model", nargs="?", default=settings.W2V_MODEL_PATH, help="word2vec model"
+    )
+    parser.add_argument("-n", "--n-lists", type=int, help="number of clusters")
+    parser.add_argument(
+        "-b", "--benchmark", type=int, help="compare with exact search on N queries"
+    )
+    parser.add_argument("-t", "--topn", type=int, default=10)
+    parser.add_argument(
+        "-p",
+        "--nprobe",
+        type=int,
+        nargs="+",
+        default=[1, 4, 16, 64],
+        help="values of nprobe to benchmark",
+    )
+    args = parser.parse_args()
+
+    model = load_word2vec_model(args.model)
+    path = index_path(args.model)
+    if os.path.exists(path) and args.n_lists is None:
+        index = IVFIndex.load(path, model.vectors)
+    else:
+        index = IVFIndex.build(model.vectors, n_lists=args.n_lists)
+        index.save(path)
+    if args.benchmark:
+        benchmark(model, index, args.benchmark, args.topn, args.nprobe)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import argparse
+import json
+import logging
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+from slt import settings
+from slt.entities import find_changes
+from slt.japanese import split_sentences
+from slt.ngram import open_corpus, read_articles
+from slt.workers import get_processor, init_worker
+
+
+# articles sent to a worker at once
+CHUNK_SIZE = 8
+# chunks submitted ahead of the results, per worker
+PENDING_CHUNKS_PER_WORKER = 4
+
+
+def simplify_article(article: Dict[str, Any]) -> Dict[str, Any]:
+    processor = get_processor()
+    sentences = []
+    for new_sentence, old_sentence in processor.process_sentences(
+        split_sentences(article["content"])
+    ):
+        sentences.append(
+            {
+                "old_sentence": old_sentence.text,
+                "new_sentence": new_sentence.text,
+                "changes": [
+                    {"old": old, "new": new}
+                    for old, new in find_changes(old_sentence, new_sentence)
+                ],
+            }
+        )
+    result = {k: v for k, v in article.items() if k != "content"}
+    result["sentences"] = sentences
+    return result
+
+
+def map_chunk(func: Callable, items: List[Any]) -> List[Any]:
+    return [func(item) for item in items]
+
+
+def map_bounded(
+    executor: Executor,
+    func: Callable,
+    items: Iterable[Any],
+    chunk_size: int,
+    max_pending: int,
+) -> Iterator[Any]:
+    """Like ``executor.map`` with ``chunksize``, but with at most ``max_pending``
+    chunks submitted ahead of the results, so that ``items`` are read as the
+    results are consumed instead of all being queued up front
+    """
+    items = iter(items)
+    pending = deque()
+    while True:
+        while len(pending) < max_pending:
+            chunk = list(islice(items, chunk_size))
+            if not chunk:
+                break
+            pending.append(executor.submit(map_chunk, func, chunk))
+        if not pending:
+            return
+        yield from pending.popleft().result()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format=settings.LOG_FORMAT)
+    parser = argparse.ArgumentParser(prog="batch")
+    parser.add_argument("file", help="JSONL corpus, optionally gzip or bz2 compressed")
+    parser.add_argument(
+        "-o", "--output", required=True, help="output file, compressed by extension"
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=2, help="number of worker processes"
+    )
+    parser.add_argument(
+        "-l", "--limit", type=int, help="Limit number of documents to process"
+    )
+    parser.add_argument(
+        "--log-every", type=int, default=100, help="documents between progress logs"
+    )
+    args = parser.parse_args()
+
+    articles = read_articles(args.file, args.limit)
+    start = time.perf_counter()
+    sentences_count = 0
+    with ProcessPoolExecutor(
+        max_workers=args.workers, initializer=init_worker
+    ) as executor, open_corpus(args.output, "wt") as f:
+        results = map_bounded(
+            executor,
+            simplify_article,
+            articles,
+            chunk_size=CHUNK_SIZE,
+            max_pending=args.workers * PENDING_CHUNKS_PER_WORKER,
+        )
+        for i, result in enumerate(results, start=1):
+            print(json.dumps(result, ensure_ascii=False), file=f)
+            sentences_count += len(result["sentences"])
+            if i % args.log_every == 0:
+                elapsed = time.perf_counter() - start
+                logging.info(
+                    "done: %s documents, %s sentences, %.1f sentences/s",
+                    i,
+                    sentences_count,
+                    sentences_count / elapsed,
+                )
+    elapsed = time.perf_counter() - start
+    logging.info(
+        "simplified %s sentences in %.0fs (%.1f sentences/s)",
+        sentences_count,
+        elapsed,
+        sentences_count / elapsed,
+    )
+
+
+if __name__ == "__main__":
+    main()
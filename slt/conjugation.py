@@ -34,14 +34,18 @@ class VerbTense:
 
 
 class Conjugator:
-    def __init__(self):
+    def __init__(
+        self,
+        conjugator_data_path: str = settings.CONJUGATOR_DATA,
+        verbs_path: str = settings.VERBS_PATH,
+    ):
         self.conjugator = JapaneseVerbFormGenerator()
-        with open(settings.CONJUGATOR_DATA, newline="") as f:
+        with open(conjugator_data_path, newline="") as f:
             reader = csv.DictReader(f, delimiter="\t")
             self.conjugator_data = sorted(reader, key=lambda x: -len(x["okuri"]))
 
         self.verbs = {}
-        with open(settings.VERBS_PATH) as f:
+        with open(verbs_path) as f:
             for verb in csv.DictReader(f):
                 self.verbs.setdefault(verb["normalized"], {})
                 if verb["form"] == "基本形":
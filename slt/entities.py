@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import json
+import re
 from enum import Enum
-from typing import List, Union, overload
+from itertools import groupby
+from json.encoder import encode_basestring
+from operator import itemgetter
+from typing import Iterable, Iterator, List, Tuple, Union, overload
 
 
 class Status(Enum):
@@ -11,27 +15,84 @@ class Status(Enum):
     REMOVED = "removed"
 
 
-@dataclass()
+# JSON encoding of the statuses, see ``Sentence.to_json``
+STATUS_JSON = {status: encode_basestring(status.value) for status in Status}
+# lone surrogates, which cannot be encoded to UTF-8
+SURROGATE_RE = re.compile("[\ud800-\udfff]")
+# integer statuses of the compact format: 0 unchanged, 1 added, 2 removed
+STATUS_CODES = {status: code for code, status in enumerate(Status)}
+
+
+def escape_surrogates(text: str) -> str:
+    """Escapes the lone surrogates of JSON ``text``, as ``json.dumps`` does
+    with ``ensure_ascii``, so that it can be encoded to UTF-8
+    """
+    if SURROGATE_RE.search(text) is None:
+        return text
+    return SURROGATE_RE.sub(lambda match: f"\\u{ord(match.group()):04x}", text)
+
+
 class Word:
-    surface: str
-    status: Status = Status.UNCHANGED
+    __slots__ = ("surface", "status")
+
+    def __init__(self, surface: str, status: Status = Status.UNCHANGED):
+        self.surface = surface
+        self.status = status
+
+    def __eq__(self, other):
+        if not isinstance(other, Word):
+            return NotImplemented
+        return self.surface == other.surface and self.status == other.status
+
+    def __repr__(self):
+        return f"Word(surface={self.surface!r}, status={self.status})"
 
     def as_dict(self):
         return {"surface": self.surface, "status": self.status.value}
 
 
-@dataclass()
 class Sentence:
-    words: List[Word] = field(default_factory=list)
+    __slots__ = ("surfaces", "statuses")
+
+    def __init__(self, words: Iterable[Word] = ()):
+        """Stores the surfaces and statuses of the words in two lists, words
+        are only created when accessed
+        """
+        self.surfaces: List[str] = []
+        self.statuses: List[Status] = []
+        for word in words:
+            self.append(word)
+
+    @property
+    def words(self) -> List[Word]:
+        return list(self)
 
     def append(self, word: Word):
-        self.words.append(word)
+        self.append_word(word.surface, word.status)
+
+    def append_word(self, surface: str, status: Status = Status.UNCHANGED):
+        self.surfaces.append(surface)
+        self.statuses.append(status)
+
+    def truncate(self, count: int):
+        """Removes the last ``count`` words, in place"""
+        if count > 0:
+            del self.surfaces[-count:]
+            del self.statuses[-count:]
 
     def __len__(self):
-        return len(self.words)
+        return len(self.surfaces)
 
-    def __iter__(self):
-        return iter(self.words)
+    def __iter__(self) -> Iterator[Word]:
+        return map(Word, self.surfaces, self.statuses)
+
+    def __eq__(self, other):
+        if not isinstance(other, Sentence):
+            return NotImplemented
+        return self.surfaces == other.surfaces and self.statuses == other.statuses
+
+    def __repr__(self):
+        return f"Sentence(words={self.words!r})"
 
     @overload
     def __getitem__(self, key: slice) -> Sentence: ...
@@ -41,8 +102,80 @@ class Sentence:
 
     def __getitem__(self, key: Union[int, slice]):
         if isinstance(key, slice):
-            return Sentence(words=self.words[key])
-        return self.words[key]
+            sentence = Sentence()
+            sentence.surfaces = self.surfaces[key]
+            sentence.statuses = self.statuses[key]
+            return sentence
+        return Word(self.surfaces[key], self.statuses[key])
+
+    @property
+    def text(self) -> str:
+        return "".join(self.surfaces)
+
+    def spans(self, status: Status) -> List[str]:
+        """Surfaces of the consecutive words with ``status``"""
+        return [
+            "".join(surface for surface, _ in words)
+            for word_status, words in groupby(
+                zip(self.surfaces, self.statuses), key=itemgetter(1)
+            )
+            if word_status == status
+        ]
 
     def as_dict(self):
-        return [word.as_dict() for word in self.words]
+        return [
+            {"surface": surface, "status": status.value}
+            for surface, status in zip(self.surfaces, self.statuses)
+        ]
+
+    def as_columns(self):
+        """Compact representation, with the statuses as ``STATUS_CODES``"""
+        return {
+            "surfaces": list(self.surfaces),
+            "statuses": [STATUS_CODES[status] for status in self.statuses],
+        }
+
+    def to_json(self) -> str:
+        """Same as ``json.dumps(self.as_dict(), ensure_ascii=False)`` without
+        building the dicts, lone surrogates being escaped
+        """
+        return escape_surrogates(
+            "["
+            + ",".join(
+                f'{{"surface":{encode_basestring(surface)},'
+                f'"status":{STATUS_JSON[status]}}}'
+                for surface, status in zip(self.surfaces, self.statuses)
+            )
+            + "]"
+        )
+
+
+def encode_result(new_sentence: Sentence, old_sentence: Sentence, **fields) -> str:
+    """JSON object with both sentences and ``fields``, as returned by
+    ``/translate``
+    """
+    members = [
+        (key, escape_surrogates(json.dumps(value, ensure_ascii=False)))
+        for key, value in fields.items()
+    ]
+    members += [
+        ("new_sentence", new_sentence.to_json()),
+        ("old_sentence", old_sentence.to_json()),
+    ]
+    return (
+        "{"
+        + ",".join(f"{encode_basestring(key)}:{value}" for key, value in members)
+        + "}"
+    )
+
+
+def find_changes(
+    old_sentence: Sentence, new_sentence: Sentence
+) -> List[Tuple[str, str]]:
+    """Pairs of replaced and replacing text, in order
+    Each run of removed words in ``old_sentence`` is replaced by the
+    corresponding run of added words in ``new_sentence``
+    """
+    return list(
+        zip(old_sentence.spans(Status.REMOVED), new_sentence.spans(Status.ADDED))
+    )
@@ -0,0 +1,104 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List
+
+from slt import settings
+from slt.instrumentation import instrumentation
+from slt.japanese import split_sentences
+from slt.processor import Processor
+
+
+# results of the sentences of a document, by sentence
+SentenceResults = Dict[str, Dict[str, Any]]
+
+
+class DocumentStore:
+    def __init__(
+        self,
+        max_sentences: int = settings.DOCUMENT_STORE_MAX_SENTENCES,
+        ttl: float = settings.DOCUMENT_TTL,
+    ):
+        """Keeps the results of the last version of each document
+
+        Documents not updated for ``ttl`` seconds are dropped, as well as the
+        least recently updated ones once more than ``max_sentences`` are kept
+        """
+        self.max_sentences = max_sentences
+        self.ttl = ttl
+        # document id -> (last update, results), least recently updated first
+        self._documents: OrderedDict = OrderedDict()
+        self._sentences = 0
+        self._lock = threading.Lock()
+
+    def _remove(self, document_id: str):
+        _, results = self._documents.pop(document_id)
+        self._sentences -= len(results)
+
+    def _expire(self, now: float):
+        while self._documents:
+            document_id, (updated, _) = next(iter(self._documents.items()))
+            if now - updated < self.ttl and self._sentences <= self.max_sentences:
+                break
+            self._remove(document_id)
+
+    def get(self, document_id: str) -> SentenceResults:
+        with self._lock:
+            self._expire(time.monotonic())
+            if document_id not in self._documents:
+                return {}
+            return self._documents[document_id][1]
+
+    def set(self, document_id: str, results: SentenceResults):
+        with self._lock:
+            if document_id in self._documents:
+                self._remove(document_id)
+            self._documents[document_id] = (time.monotonic(), results)
+            self._sentences += len(results)
+            self._expire(time.monotonic())
+
+    def delete(self, document_id: str):
+        with self._lock:
+            if document_id in self._documents:
+                self._remove(document_id)
+
+    def __len__(self):
+        return len(self._documents)
+
+    @property
+    def sentences(self) -> int:
+        return self._sentences
+
+
+class IncrementalSimplifier:
+    def __init__(self, processor: Processor, store: DocumentStore = None):
+        """Simplifies successive versions of documents, only processing the
+        sentences which changed since the previous version
+        """
+        self.processor = processor
+        self.store = store if store is not None else DocumentStore()
+
+    def update(self, document_id: str, text: str) -> List[Dict[str, Any]]:
+        """Returns the result of each sentence of ``text``, with whether it
+        was reused from the previous version of the document
+        """
+        sentences = split_sentences(text)
+        previous = self.store.get(document_id)
+        results = {s: previous[s] for s in sentences if s in previous}
+        changed = [s for s in dict.fromkeys(sentences) if s not in results]
+        for sentence, (new_sentence, old_sentence) in zip(
+            changed, self.processor.process_sentences(changed)
+        ):
+            results[sentence] = {
+                "new_sentence": new_sentence.as_dict(),
+                "old_sentence": old_sentence.as_dict(),
+            }
+        instrumentation.incr("document_sentences_reused", len(sentences) - len(changed))
+        instrumentation.incr("document_sentences_processed", len(changed))
+        # only the sentences of the current version are kept
+        self.store.set(document_id, results)
+        reprocessed = set(changed)
+        return [
+            {"index": i, "reused": sentence not in reprocessed, **results[sentence]}
+            for i, sentence in enumerate(sentences)
+        ]
@@ -0,0 +1,140 @@
+"""Memory footprint of the artifacts loaded by ``Processor``
+
+    python -m slt.inspect
+
+Deep sizes follow the references of every object, each object being counted
+once for the first artifact referencing it. Objects implemented in C which do
+not expose their references, such as parts of the spaCy pipeline, are
+underestimated, the growth of the resident memory while loading each artifact
+gives the actual cost
+"""
+import argparse
+import gc
+import json
+import logging
+import sys
+import time
+import types
+from typing import Any, Dict, Set
+
+import numpy as np
+
+from slt import settings
+from slt.loading import LOAD_MEMORY, LOAD_TIMES, resident_memory
+from slt.ngram import LazyNGramsContainer
+from slt.processor import Processor
+
+
+# objects shared by everything rather than owned by an artifact
+SKIPPED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.FrameType,
+    types.CodeType,
+)
+
+
+def deep_sizeof(obj, seen: Set[int] = None) -> Dict[str, int]:
+    """Returns the number of ``objects`` reachable from ``obj`` and their
+    size in ``bytes``, of which ``numpy`` is the size of the arrays data.
+    ``seen`` contains the ids of the objects already counted and is updated
+    """
+    if seen is None:
+        seen = set()
+    objects, size, numpy_size = 0, 0, 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, SKIPPED_TYPES):
+            continue
+        seen.add(id(current))
+        objects += 1
+        size += sys.getsizeof(current)
+        if isinstance(current, np.ndarray):
+            # views do not own their data, which is counted with their base
+            if current.base is None:
+                size += current.nbytes
+                numpy_size += current.nbytes
+            else:
+                stack.append(current.base)
+            continue
+        if isinstance(current, dict):
+            # keys which are strings are not visited by the garbage collector
+            stack.extend(current.keys())
+        stack.extend(gc.get_referents(current))
+    return {"objects": objects, "bytes": size, "numpy": numpy_size}
+
+
+def get_artifacts(processor: Processor) -> Dict[str, Any]:
+    ngrams = processor.ngrams
+    if isinstance(ngrams, LazyNGramsContainer):
+        ngrams = ngrams.container if ngrams.loaded else None
+    return {
+        "word2vec": getattr(processor.synonyms_extractor, "model", None),
+        "spacy": processor.nlp,
+        "ngrams": ngrams.ngrams if ngrams is not None else None,
+        "conjugator.verbs": processor.conjugator.verbs,
+        "conjugator.conjugator_data": processor.conjugator.conjugator_data,
+        "jlpt": processor.jlpt_words,
+    }
+
+
+def inspect_processor(processor: Processor) -> Dict[str, Any]:
+    start = time.perf_counter()
+    seen: Set[int] = set()
+    artifacts = {}
+    for name, artifact in get_artifacts(processor).items():
+        if artifact is not None:
+            artifacts[name] = deep_sizeof(artifact, seen)
+    return {
+        "resident_memory": resident_memory(),
+        "artifacts": artifacts,
+        "load_steps": {
+            name: {"seconds": seconds, "resident_memory": LOAD_MEMORY.get(name)}
+            for name, seconds in LOAD_TIMES.items()
+        },
+        "inspection_seconds": time.perf_counter() - start,
+    }
+
+
+def megabytes(value: int) -> str:
+    if value is None:
+        return "-"
+    return f"{value / 1024**2:.1f}MB"
+
+
+def print_report(report: Dict[str, Any]):
+    print(f"resident memory: {megabytes(report['resident_memory'])}\n")
+    print(f"{'artifact':<28}{'objects':>12}{'deep size':>14}{'numpy':>12}")
+    for name, size in report["artifacts"].items():
+        print(
+            f"{name:<28}{size['objects']:>12}{megabytes(size['bytes']):>14}"
+            f"{megabytes(size['numpy']):>12}"
+        )
+    print(f"\n{'load step':<28}{'time':>12}{'rss delta':>14}")
+    for name, step in report["load_steps"].items():
+        print(
+            f"{name:<28}{step['seconds']:>11.2f}s"
+            f"{megabytes(step['resident_memory']):>14}"
+        )
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format=settings.LOG_FORMAT)
+    parser = argparse.ArgumentParser(prog="inspect")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    processor = Processor.load()
+    report = inspect_processor(processor)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
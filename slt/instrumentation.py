@@ -0,0 +1,146 @@
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Sequence
+
+
+# upper bounds of the histogram buckets, in seconds
+LATENCY_BUCKETS = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        # the last bucket counts values above all the bounds
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "buckets": dict(zip(self.buckets + (float("inf"),), self.counts)),
+            "count": self.count,
+            "sum": self.sum,
+        }
+
+
+class Instrumentation:
+    def __init__(self):
+        """Aggregates timers and counters of the processing stages.
+
+        Observations are also recorded in the trace of the current thread
+        when one is active, see ``trace``
+        """
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = defaultdict(int)
+        # forwarded every observation, see ``add_observer``
+        self.observers = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def current_trace(self):
+        return getattr(self._local, "trace", None)
+
+    def add_observer(self, observer):
+        """``observer`` must implement ``observe``, ``distribution`` and
+        ``incr`` with the same signatures as this class
+        """
+        self.observers.append(observer)
+
+    def _observe(self, kind: str, name: str, value: float, buckets):
+        with self._lock:
+            if name not in self.histograms:
+                self.histograms[name] = Histogram(buckets)
+            self.histograms[name].observe(value)
+        trace = self.current_trace
+        if trace is not None:
+            trace[kind][name] += value
+
+    def observe(self, name: str, seconds: float):
+        """Records the duration of a stage"""
+        self._observe("timers", name, seconds, LATENCY_BUCKETS)
+        for observer in self.observers:
+            observer.observe(name, seconds)
+
+    def distribution(self, name: str, value: int):
+        """Records a quantity, such as the number of candidates of a token"""
+        self._observe("values", name, value, COUNT_BUCKETS)
+        for observer in self.observers:
+            observer.distribution(name, value)
+
+    def incr(self, name: str, value: int = 1):
+        with self._lock:
+            self.counters[name] += value
+        for observer in self.observers:
+            observer.incr(name, value)
+        trace = self.current_trace
+        if trace is not None:
+            trace["counters"][name] += value
+
+    @contextmanager
+    def timer(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    @contextmanager
+    def trace(self):
+        """Collects the totals of everything observed by the current thread
+        until the end of the block
+        """
+        trace = {
+            "timers": defaultdict(float),
+            "values": defaultdict(float),
+            "counters": defaultdict(int),
+        }
+        previous = self.current_trace
+        self._local.trace = trace
+        try:
+            yield trace
+        finally:
+            self._local.trace = previous
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "histograms": {
+                    name: histogram.as_dict()
+                    for name, histogram in self.histograms.items()
+                },
+                "counters": dict(self.counters),
+            }
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+
+
+instrumentation = Instrumentation()
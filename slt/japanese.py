@@ -1,4 +1,5 @@
 import re
+from typing import Iterator, List
 
 
 ALPHABET_RE = re.compile("[a-zA-Z]+")
@@ -9,6 +10,8 @@ KANJI_RE = re.compile(
 HIRAGANA_RE = re.compile("[ぁ-ゟ]+")
 ONLY_HIRAGANA_RE = re.compile("^[ぁ-ゟ]+$")
 KATAKANA_RE = re.compile("[\u30A1-\u30FF]+")
+# a sentence ends with a line break, or punctuation outside of brackets
+SENTENCE_END_RE = re.compile("\n|[。！？!?]+(?![。！？!?」』）)])")
 
 
 def has_kanji(token: str) -> bool:
@@ -29,3 +32,36 @@ def has_katakana(token: str) -> bool:
 
 def has_alphabet(token: str) -> bool:
     return ALPHABET_RE.search(token) is not None
+
+
+def split_sentences(text: str) -> List[str]:
+    sentences = []
+    start = 0
+    for match in SENTENCE_END_RE.finditer(text):
+        sentences.append(text[start : match.end()])
+        start = match.end()
+    sentences.append(text[start:])
+    return [s.strip() for s in sentences if s.strip()]
+
+
+class SentenceSplitter:
+    def __init__(self):
+        """Splits text received in chunks into sentences"""
+        self.buffer = ""
+
+    def feed(self, chunk: str) -> Iterator[str]:
+        """Yields the sentences completed by ``chunk``"""
+        self.buffer += chunk
+        last_end = None
+        for match in SENTENCE_END_RE.finditer(self.buffer):
+            # punctuation at the very end could be followed by more of it
+            if match.end() < len(self.buffer) or match.group() == "\n":
+                last_end = match.end()
+        if last_end is not None:
+            yield from split_sentences(self.buffer[:last_end])
+            self.buffer = self.buffer[last_end:]
+
+    def flush(self) -> Iterator[str]:
+        """Yields what is left once all the text was received"""
+        yield from split_sentences(self.buffer)
+        self.buffer = ""
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import logging
+import mmap
+import re
+import struct
+import sys
+import zlib
+from bisect import bisect_left
+from os import path
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from slt import settings
+
+
+LEXICON_SUFFIX = ".lex"
+MAGIC = b"SLTLEX02"
+# magic, number of words, number of hash table slots
+HEADER = struct.Struct("<8sII")
+DEFAULT_SOURCES = [
+    path.join(settings.PROJECT_ROOT, f"data/n{level}.csv") for level in range(1, 6)
+] + [settings.JLPT_WORDS_PATH]
+
+WORD_SEPARATOR_RE = re.compile(r"\s+|、")
+
+
+def read_jlpt_csv(filepath: str) -> Dict[str, int]:
+    """Reads ``level,word`` rows, with or without a header.
+    A row can contain several spellings of the same word
+    """
+    words = {}
+    with open(filepath, newline="") as f:
+        for row in csv.reader(f):
+            if len(row) < 2 or not row[0].strip().isdigit():
+                continue
+            for word in WORD_SEPARATOR_RE.split(row[1]):
+                if word:
+                    words[word] = int(row[0])
+    return words
+
+
+def hash_word(encoded: bytes) -> int:
+    # unlike ``hash``, stable across processes
+    return zlib.crc32(encoded)
+
+
+class JlptLexicon:
+    def __init__(self, buffer):
+        """Read-only JLPT level lookup over a compiled lexicon.
+
+        The lexicon is a sorted array of UTF-8 encoded words indexed by an open
+        addressing hash table, so ``buffer`` can be a memory map shared between
+        processes instead of a dict per worker
+        """
+        magic, count, n_slots = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("not a compiled JLPT lexicon")
+        if sys.byteorder != "little":
+            raise ValueError("compiled JLPT lexicons are little-endian")
+        slots_start = HEADER.size
+        offsets_start = slots_start + 4 * n_slots
+        levels_start = offsets_start + 4 * (count + 1)
+        blob_start = levels_start + count
+        self._buffer = buffer
+        self._count = count
+        self._mask = n_slots - 1
+        view = memoryview(buffer)
+        # plain memoryviews are much faster than numpy arrays to index scalars
+        self._slots = view[slots_start:offsets_start].cast("I")
+        self._offsets = view[offsets_start:levels_start].cast("I")
+        self._levels = view[levels_start:blob_start]
+        self._blob = view[blob_start:]
+
+    def _find(self, word: str) -> int:
+        key = word.encode("utf-8")
+        slot = hash_word(key) & self._mask
+        while True:
+            # slots store word index + 1, 0 marks an empty slot
+            i = self._slots[slot] - 1
+            if i < 0:
+                return -1
+            if self._blob[self._offsets[i] : self._offsets[i + 1]] == key:
+                return i
+            slot = (slot + 1) & self._mask
+
+    def level(self, lemma: str, default: int = None) -> int:
+        i = self._find(lemma)
+        return default if i < 0 else self._levels[i]
+
+    def levels(self, lemmas: Iterable[str], default: int = None) -> List[int]:
+        return [self.level(lemma, default) for lemma in lemmas]
+
+    # same interface as the dict previously used by ``Processor``
+    def get(self, word: str, default: int = None) -> int:
+        return self.level(word, default)
+
+    def __contains__(self, word: str) -> bool:
+        return self._find(word) >= 0
+
+    def __len__(self):
+        return self._count
+
+    @staticmethod
+    def compile(words: Dict[str, int]) -> bytes:
+        encoded = sorted((w.encode("utf-8"), level) for w, level in words.items())
+        offsets = np.zeros(len(encoded) + 1, dtype="<u4")
+        offsets[1:] = np.cumsum([len(w) for w, _ in encoded])
+        levels = np.array([level for _, level in encoded], dtype=np.uint8)
+        # at most half full to keep probe sequences short
+        n_slots = 1 << (2 * len(encoded)).bit_length()
+        slots = np.zeros(n_slots, dtype="<u4")
+        for i, (word, _) in enumerate(encoded):
+            slot = hash_word(word) & (n_slots - 1)
+            while slots[slot]:
+                slot = (slot + 1) & (n_slots - 1)
+            slots[slot] = i + 1
+        return b"".join(
+            [
+                HEADER.pack(MAGIC, len(encoded), n_slots),
+                slots.tobytes(),
+                offsets.tobytes(),
+                levels.tobytes(),
+                *(w for w, _ in encoded),
+            ]
+        )
+
+    @classmethod
+    def load(cls, filepath: str) -> JlptLexicon:
+        with open(filepath, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+class LevelPartitionedWords:
+    __slots__ = ("words", "ranks", "keys")
+
+    def __init__(self, words: List[str], jlpt_words, default: int = 1):
+        """Partitions ``words`` by JLPT level, the easiest levels first, so that
+        the words easier than a given level are a prefix of the partition.
+        Words not in ``jlpt_words`` get the ``default`` level
+        """
+        self.words = words
+        levels = [jlpt_words.get(word, default) for word in words]
+        # stable, so that words of the same level keep their order
+        self.ranks = sorted(range(len(words)), key=lambda i: -levels[i])
+        self.keys = [-levels[i] for i in self.ranks]
+
+    def easier_than(self, level: int) -> List[str]:
+        """Words whose level is above ``level``, in their original order"""
+        count = bisect_left(self.keys, -level)
+        if count == len(self.words):
+            return list(self.words)
+        return [self.words[i] for i in sorted(self.ranks[:count])]
+
+
+def load_jlpt_words(filepath: str):
+    """Loads either a compiled lexicon or a CSV file"""
+    if filepath.endswith(LEXICON_SUFFIX):
+        return JlptLexicon.load(filepath)
+    return read_jlpt_csv(filepath)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format=settings.LOG_FORMAT)
+    parser = argparse.ArgumentParser(prog="lexicon")
+    parser.add_argument(
+        "files",
+        nargs="*",
+        default=DEFAULT_SOURCES,
+        help="CSV files, later files take precedence",
+    )
+    parser.add_argument("-o", "--output", required=True, help="output file")
+    args = parser.parse_args()
+
+    words = {}
+    for filepath in args.files:
+        words.update(read_jlpt_csv(filepath))
+    with open(args.output, "wb") as f:
+        f.write(JlptLexicon.compile(words))
+    logging.info("wrote %s words to %s", len(words), args.output)
+
+
+if __name__ == "__main__":
+    main()
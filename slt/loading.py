@@ -0,0 +1,65 @@
+import logging
+import resource
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict
+
+
+# time taken to load each artifact, in seconds
+LOAD_TIMES: Dict[str, float] = {}
+# growth of the resident memory while loading each artifact, in bytes
+LOAD_MEMORY: Dict[str, int] = {}
+
+
+def resident_memory() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        # not on Linux, only the peak is available
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+@contextmanager
+def timed_load(name: str):
+    start = time.perf_counter()
+    memory = resident_memory()
+    yield
+    LOAD_TIMES[name] = time.perf_counter() - start
+    LOAD_MEMORY[name] = resident_memory() - memory
+    logging.info(
+        "loaded %s in %.2fs, %+.1fMB",
+        name,
+        LOAD_TIMES[name],
+        LOAD_MEMORY[name] / 1024**2,
+    )
+
+
+class BackgroundLoader:
+    def __init__(self, load: Callable[[], None]):
+        """Runs ``load`` in a daemon thread and records whether it finished"""
+        self.load = load
+        self.error: Exception = None
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="loader", daemon=True)
+
+    def _run(self):
+        try:
+            self.load()
+        except Exception as e:  # pylint: disable=broad-except
+            logging.exception("failed to load models")
+            self.error = e
+        finally:
+            self._done.set()
+
+    def start(self):
+        self._thread.start()
+
+    @property
+    def ready(self) -> bool:
+        return self._done.is_set() and self.error is None
+
+    def wait(self, timeout: float = None) -> bool:
+        self._done.wait(timeout)
+        return self.ready
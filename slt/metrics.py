@@ -0,0 +1,98 @@
+"""Prometheus metrics
+
+When ``PROMETHEUS_MULTIPROC_DIR`` is set, as done by ``gunicorn.conf.py``,
+every worker writes its metrics to that directory and ``/metrics`` aggregates
+the metrics of all of them
+"""
+import os
+from typing import Dict
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from slt.instrumentation import COUNT_BUCKETS, LATENCY_BUCKETS, instrumentation
+from slt.loading import resident_memory
+
+
+TOKEN_BUCKETS = (5, 10, 20, 50, 100, 200, 500, 1000)
+
+REQUESTS = Counter(
+    "slt_requests_total", "Requests handled", ["endpoint", "method", "status"]
+)
+REQUEST_LATENCY = Histogram(
+    "slt_request_duration_seconds",
+    "Time spent handling requests",
+    ["endpoint"],
+    buckets=LATENCY_BUCKETS,
+)
+INPUT_TOKENS = Histogram(
+    "slt_input_tokens", "Number of tokens of the input sentences", buckets=TOKEN_BUCKETS
+)
+STAGE_LATENCY = Histogram(
+    "slt_stage_duration_seconds",
+    "Time spent in each processing stage",
+    ["stage"],
+    buckets=LATENCY_BUCKETS,
+)
+STAGE_VALUES = Histogram(
+    "slt_stage_values",
+    "Quantities observed while processing, such as candidates per token",
+    ["name"],
+    buckets=COUNT_BUCKETS,
+)
+EVENTS = Counter(
+    "slt_events_total",
+    "Work done while processing: SQL queries, n-gram lookups, cache hits",
+    ["event"],
+)
+RESIDENT_MEMORY = Gauge(
+    "slt_process_resident_memory_bytes",
+    "Resident memory of the process",
+    multiprocess_mode="liveall",
+)
+WORDNET_POOL = Gauge(
+    "slt_wordnet_pool",
+    "WordNet connection pool: connections created, in use and idle, "
+    "acquisitions, waits and timeouts",
+    ["stat"],
+    multiprocess_mode="liveall",
+)
+
+
+class PrometheusObserver:
+    """Forwards the observations of ``slt.instrumentation``"""
+
+    def observe(self, name: str, seconds: float):
+        STAGE_LATENCY.labels(name).observe(seconds)
+
+    def distribution(self, name: str, value: int):
+        STAGE_VALUES.labels(name).observe(value)
+
+    def incr(self, name: str, value: int = 1):
+        EVENTS.labels(name).inc(value)
+
+
+instrumentation.add_observer(PrometheusObserver())
+
+
+def update_process_metrics(wordnet_pool: Dict[str, int] = None):
+    RESIDENT_MEMORY.set(resident_memory())
+    for name, value in (wordnet_pool or {}).items():
+        WORDNET_POOL.labels(name).set(value)
+
+
+def generate_metrics() -> bytes:
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry)
@@ -1,20 +1,24 @@
 from __future__ import annotations
 
 import argparse
+import bz2
 import gzip
 import json
 import logging
 import multiprocessing
+import threading
 from collections import defaultdict
 from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from functools import lru_cache
 from itertools import islice
 from typing import Dict, Iterable, List, OrderedDict, Tuple
 
+import numpy as np
 import spacy
 
 from slt import settings
+from slt.loading import timed_load
+from slt.nlp import load_nlp
 
 
 def make_defaultdict_int():
@@ -65,11 +69,15 @@ class NGrams:
 
 
 class NGramsContainer:
-    def __init__(self, max_n: int = 2, ngrams: dict = None):
+    def __init__(self, max_n: int = 2, ngrams: dict = None, nlp=None):
+        """``nlp`` is only used to tokenize keys, and is loaded on first use
+        if not provided
+        """
         self.max_n = max_n
         if ngrams is None:
             ngrams = {i: NGrams(i) for i in range(1, max_n + 1)}
         self.ngrams = ngrams
+        self._nlp = nlp
 
     def add_entries(self, tokens: List[str]):
         for i in range(1, self.max_n + 1):
@@ -89,19 +97,25 @@ class NGramsContainer:
         return {n: grams.to_dict() for n, grams in self.ngrams.items()}
 
     @classmethod
-    def from_dict(cls, raw: dict):
+    def from_dict(cls, raw: dict, nlp=None):
         max_n = max(map(int, raw))
         ngrams = {int(k): NGrams.from_dict(v) for k, v in raw.items()}
-        return cls(max_n, ngrams)
+        return cls(max_n, ngrams, nlp=nlp)
 
     @property
-    @lru_cache
     def nlp(self):
-        return spacy.load("ja_core_news_sm", disable=["ner"])
+        if self._nlp is None:
+            self._nlp = load_nlp()
+        return self._nlp
+
+    @nlp.setter
+    def nlp(self, nlp):
+        self._nlp = nlp
 
     def _normalize_key(self, key):
         if isinstance(key, str):
-            key = tuple(str(v) for v in self.nlp(key))
+            # only the tokenizer is needed, the rest of the pipeline is skipped
+            key = tuple(str(v) for v in self.nlp.make_doc(key))
         return key
 
     def __getitem__(self, key):
@@ -114,6 +128,15 @@ class NGramsContainer:
             return 0
         return self.ngrams[n][key]
 
+    def counts(self, keys: List[str]) -> np.ndarray:
+        """Counts of all ``keys``, which are tokenized together"""
+        docs = self.nlp.tokenizer.pipe(keys)
+        return np.fromiter(
+            (self[tuple(str(v) for v in doc)] for doc in docs),
+            dtype=np.int64,
+            count=len(keys),
+        )
+
     def probability(self, key):
         key = self._normalize_key(key)
         count = self[key]
@@ -122,6 +145,48 @@ class NGramsContainer:
         return 0
 
 
+def load_ngrams(filepath: str, nlp=None) -> NGramsContainer:
+    with gzip.open(filepath) as f:
+        return NGramsContainer.from_dict(json.load(f), nlp=nlp)
+
+
+class LazyNGramsContainer:
+    def __init__(self, filepath: str, nlp=None):
+        """Same interface as ``NGramsContainer``, but only loads ``filepath``
+        the first time it is used
+        """
+        self.filepath = filepath
+        self._nlp = nlp
+        self._container: NGramsContainer = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._container is not None
+
+    @property
+    def container(self) -> NGramsContainer:
+        if self._container is None:
+            with self._lock:
+                if self._container is None:
+                    with timed_load("ngrams"):
+                        self._container = load_ngrams(self.filepath, nlp=self._nlp)
+        return self._container
+
+    @property
+    def nlp(self):
+        return self.container.nlp
+
+    def __getitem__(self, key):
+        return self.container[key]
+
+    def counts(self, keys: List[str]) -> np.ndarray:
+        return self.container.counts(keys)
+
+    def probability(self, key):
+        return self.container.probability(key)
+
+
 class NGramGenerator:
     def __init__(self):
         self.nlp = None
@@ -154,11 +219,27 @@ def generate_corpus_ngrams(corpus: Iterable[str]) -> NGramsContainer:
     return ngrams
 
 
-def read_articles_content(filepath: str, docs_limit: int = None) -> Iterable[str]:
-    with gzip.open(filepath, "r") as f:
+def open_corpus(filepath: str, mode: str = "rt"):
+    """Opens ``filepath``, compressed or not depending on its extension.
+    Text is always UTF-8, whatever the locale
+    """
+    kwargs = {} if "b" in mode else {"encoding": "utf-8"}
+    if filepath.endswith(".gz"):
+        return gzip.open(filepath, mode, **kwargs)
+    if filepath.endswith(".bz2"):
+        return bz2.open(filepath, mode, **kwargs)
+    return open(filepath, mode, **kwargs)
+
+
+def read_articles(filepath: str, docs_limit: int = None) -> Iterable[dict]:
+    with open_corpus(filepath) as f:
         for line in islice(f, None, docs_limit):
-            parsed = json.loads(line)
-            yield parsed["content"]
+            yield json.loads(line)
+
+
+def read_articles_content(filepath: str, docs_limit: int = None) -> Iterable[str]:
+    for article in read_articles(filepath, docs_limit):
+        yield article["content"]
 
 
 def main():
@@ -0,0 +1,67 @@
+import argparse
+import logging
+import time
+
+import spacy
+
+from slt import settings
+
+
+# components excluded from the pipeline for each profile
+# ``Processor`` only reads the tags, lemmas and dependencies of the tokens
+PIPELINE_PROFILES = {
+    "full": [],
+    "serving": ["ner", "senter"],
+}
+
+SAMPLE_SENTENCES = [
+    "本日は友人とお食事した後に、大学に参りました",
+    "ご希望の日付を選択して下さい",
+    "彼は会議の資料を迅速に作成し、上司に提出した",
+    "この地域では古くから農業が盛んに営まれており、多様な作物が栽培されている",
+]
+
+
+def load_nlp(model: str = settings.JAPANESE_MODEL, profile: str = None):
+    profile = profile or settings.SPACY_PROFILE
+    return spacy.load(model, exclude=PIPELINE_PROFILES[profile])
+
+
+def benchmark(model: str, profile: str, repeat: int):
+    start = time.perf_counter()
+    nlp = load_nlp(model, profile)
+    load_time = time.perf_counter() - start
+    # first call initializes lazily loaded resources
+    nlp(SAMPLE_SENTENCES[0])
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for sentence in SAMPLE_SENTENCES:
+            nlp(sentence)
+    sentence_time = (time.perf_counter() - start) / (repeat * len(SAMPLE_SENTENCES))
+    print(
+        f"{profile}\tpipeline={','.join(nlp.pipe_names)}\t"
+        f"load={load_time:.2f}s\tsentence={sentence_time * 1000:.2f}ms"
+    )
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format=settings.LOG_FORMAT)
+    parser = argparse.ArgumentParser(prog="nlp")
+    parser.add_argument("-m", "--model", default=settings.JAPANESE_MODEL)
+    parser.add_argument(
+        "-p",
+        "--profiles",
+        nargs="+",
+        choices=list(PIPELINE_PROFILES),
+        default=list(PIPELINE_PROFILES),
+        help="profiles to compare",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    for profile in args.profiles:
+        benchmark(args.model, profile, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Lemmas having at least one synonym at an easier JLPT level
+
+Tokens whose lemma is not one of them can never be replaced, so their synonyms
+do not need to be looked up. Built from WordNet and the JLPT lists::
+
+    python -m slt.prefilter -o data/simplifiable.tsv
+
+and used by setting ``PREFILTER_PATH``. It must be built again when WordNet
+or the JLPT lists change
+"""
+import argparse
+import logging
+from contextlib import closing
+from typing import Dict, Iterable, Tuple
+
+from slt import settings, wordnet
+from slt.lexicon import load_jlpt_words
+from slt.synonyms import WithWordnet
+
+
+# every lemma with the part of speech of the synset and its synonyms
+SYNONYMS_QUERY = """
+    SELECT DISTINCT w0.lemma, s2.pos, w.lemma FROM word w0
+    JOIN sense s0 ON w0.wordid = s0.wordid
+    JOIN synset s2 ON s0.synset = s2.synset
+    JOIN sense s ON s.synset = s0.synset
+    JOIN word w ON w.wordid = s.wordid
+    WHERE w.lang = ? AND w.lemma <> w0.lemma
+"""
+COMPACT_SYNONYMS_QUERY = """
+    SELECT DISTINCT ls.lemma, ls.pos, sl.lemma FROM lemma_synsets ls
+    JOIN synset_lemmas sl ON sl.synset = ls.synset
+    WHERE sl.lang = ? AND sl.lemma <> ls.lemma
+"""
+
+
+class SimplifiableLemmas:
+    def __init__(self, pairs: Iterable[Tuple[str, str]]):
+        """``pairs`` are lemmas with a WordNet part of speech"""
+        self.pairs = frozenset(pairs)
+
+    def may_simplify(self, lemma: str, pos: str) -> bool:
+        """``pos`` is a spaCy part of speech"""
+        return (lemma, WithWordnet.pos_mapping.get(pos, "r")) in self.pairs
+
+    def __contains__(self, pair: Tuple[str, str]) -> bool:
+        return pair in self.pairs
+
+    def __len__(self):
+        return len(self.pairs)
+
+    def save(self, filepath: str):
+        with open(filepath, "w") as f:
+            for lemma, pos in sorted(self.pairs):
+                f.write(f"{lemma}\t{pos}\n")
+
+    @classmethod
+    def load(cls, filepath: str):
+        with open(filepath) as f:
+            return cls(tuple(line.rstrip("\n").split("\t")) for line in f)
+
+
+def build_prefilter(
+    db_path: str, jlpt_words: Dict[str, int], lang: str = "jpn"
+) -> SimplifiableLemmas:
+    """Keeps the lemmas with a synonym of a higher level, levels being
+    defaulted to 1 as done by ``Processor``
+    """
+    pairs = set()
+    with closing(wordnet.connect(db_path)) as db:
+        query = COMPACT_SYNONYMS_QUERY if wordnet.is_compact(db) else SYNONYMS_QUERY
+        for lemma, pos, synonym in db.execute(query, (lang,)):
+            if jlpt_words.get(synonym, 1) > jlpt_words.get(lemma, 1):
+                pairs.add((lemma, pos))
+    return SimplifiableLemmas(pairs)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format=settings.LOG_FORMAT)
+    parser = argparse.ArgumentParser(prog="prefilter")
+    parser.add_argument("-o", "--output", required=True)
+    parser.add_argument("--wordnet", default=settings.WORDNET_DB_PATH)
+    parser.add_argument("--jlpt", default=settings.JLPT_WORDS_PATH)
+    args = parser.parse_args()
+
+    prefilter = build_prefilter(args.wordnet, load_jlpt_words(args.jlpt))
+    prefilter.save(args.output)
+    logging.info("%s simplifiable lemmas written to %s", len(prefilter), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,133 +1,269 @@
-import gzip
-import re
-import json
-from slt.ngram import NGramsContainer
-from typing import Dict, Tuple
-import csv
+from slt.ngram import LazyNGramsContainer, NGramsContainer, load_ngrams
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
 
+import numpy as np
 import spacy
 
-from slt import japanese, settings
-from slt.entities import Sentence, Word, Status
-from slt.synonyms import WordnetWithW2vThresholdExtractor, SynonymExtractor
+from slt import japanese, profiling, settings
+from slt.analysis import DocAnalysis
+from slt.entities import Sentence, Status
+from slt.instrumentation import instrumentation
+from slt.lexicon import JlptLexicon, LevelPartitionedWords, load_jlpt_words
+from slt.loading import timed_load
+from slt.nlp import load_nlp
+from slt.prefilter import SimplifiableLemmas
+from slt.synonyms import LRUCache, WordnetWithW2vThresholdExtractor, SynonymExtractor
 from slt.conjugation import Conjugator
 
 
 NGRAM_RATIO_THRESHOLD = 10
 
 
+def is_rejected(current_counts, new_counts) -> np.ndarray:
+    """Whether the bigrams with a candidate, of counts ``new_counts``, are too
+    rare compared to the original ones
+    """
+    current_counts = np.broadcast_to(current_counts, np.shape(new_counts))
+    ratios = np.divide(
+        current_counts,
+        new_counts,
+        out=np.zeros(np.shape(new_counts)),
+        where=new_counts > 0,
+    )
+    return (new_counts == 0) & (current_counts > 0) | (new_counts > 0) & (
+        ratios > NGRAM_RATIO_THRESHOLD
+    )
+
+
 class Processor:
     def __init__(
         self,
         synonyms_extractor: SynonymExtractor,
         nlp,
-        jlpt_words: Dict[str, int],
-        ngrams: NGramsContainer,
+        jlpt_words: Union[Dict[str, int], JlptLexicon],
+        ngrams: Union[NGramsContainer, LazyNGramsContainer],
+        conjugator: Conjugator = None,
+        prefilter: SimplifiableLemmas = None,
     ):
         self.synonyms_extractor = synonyms_extractor
         self.nlp = nlp
         self.jlpt_words = jlpt_words
         self.ngrams = ngrams
-        self.conjugator = Conjugator()
-
-    def get_sorted_synonyms(self, token, max_word_level=0):
-        result = []
-        for candidate in self.synonyms_extractor.find_synonyms(
-            token.lemma_, topn=-1, pos=token.pos_
-        ):
-            candidate_level = self.jlpt_words.get(candidate, 1)
-            if candidate_level <= max_word_level:
-                continue
-            result.append(candidate)
+        if conjugator is None:
+            with timed_load("conjugator"):
+                conjugator = Conjugator()
+        self.conjugator = conjugator
+        self.prefilter = prefilter
+        # (lemma, pos) -> synonyms partitioned by level
+        self._leveled_synonyms = LRUCache()
+
+    def clear_cache(self):
+        self._leveled_synonyms.clear()
+        if hasattr(self.synonyms_extractor, "clear_cache"):
+            self.synonyms_extractor.clear_cache()
+
+    def get_sorted_synonyms(self, token, max_word_level=0, synonyms=None):
+        """Synonyms of ``token`` easier than ``max_word_level``, the most
+        similar first
+        """
+        key = (token.lemma_, token.pos_)
+        leveled = self._leveled_synonyms.get(key)
+        if leveled is None:
+            if synonyms is not None and key in synonyms:
+                candidates = synonyms[key]
+            else:
+                with instrumentation.timer("synonyms"):
+                    candidates = self.synonyms_extractor.find_synonyms(
+                        token.lemma_, topn=-1, pos=token.pos_
+                    )
+            leveled = LevelPartitionedWords(candidates, self.jlpt_words)
+            self._leveled_synonyms[key] = leveled
+        result = leveled.easier_than(max_word_level)
+        instrumentation.distribution("candidates_per_token", len(result))
         return result
 
-    def adjust_token(self, old_token: spacy.tokens.token.Token, new_word: str):
+    def adjust_token(
+        self,
+        old_token: spacy.tokens.token.Token,
+        new_word: str,
+        analysis: DocAnalysis = None,
+    ):
         if old_token.pos_ == "VERB":
-            verb_tokens = self.get_verb_tokens(old_token)
+            if analysis is None:
+                verb_tokens = self.get_verb_tokens(old_token)
+            else:
+                verb_tokens = analysis.verb_groups[old_token.i]
             verb_text = "".join([t.text for t in verb_tokens])
-            return self.conjugator.adjust_conjugation(
-                verb_text, [t.lemma_ for t in verb_tokens], new_word
-            )
+            with instrumentation.timer("conjugation"):
+                return self.conjugator.adjust_conjugation(
+                    verb_text, [t.lemma_ for t in verb_tokens], new_word
+                )
         return new_word
 
-    def compute_token(self, token):
-        if token.pos_ == "AUX" or japanese.only_hiragana(token.text):
+    @staticmethod
+    def is_skipped(token) -> bool:
+        return token.pos_ == "AUX" or japanese.only_hiragana(token.text)
+
+    def may_simplify(self, token) -> bool:
+        """Whether ``token`` may have an easier synonym, without any lookup"""
+        if self.is_skipped(token):
+            return False
+        return self.prefilter is None or self.prefilter.may_simplify(
+            token.lemma_, token.pos_
+        )
+
+    def prefetch_synonyms(self, *docs) -> Dict[Tuple[str, str], List[str]]:
+        """Retrieves the synonyms of all the tokens of ``docs`` at once, except
+        those already partitioned by level
+        """
+        words_with_pos = {
+            (t.lemma_, t.pos_)
+            for doc in docs
+            for t in doc
+            if self.may_simplify(t) and (t.lemma_, t.pos_) not in self._leveled_synonyms
+        }
+        with instrumentation.timer("synonyms"):
+            return self.synonyms_extractor.find_synonyms_batch(words_with_pos, topn=-1)
+
+    def compute_token(self, token, synonyms=None, analysis: DocAnalysis = None):
+        if not self.may_simplify(token):
+            if not self.is_skipped(token):
+                instrumentation.incr("prefiltered_tokens")
             return token.text
         word_level = self.jlpt_words.get(token.lemma_, 1)
-        synonyms = self.get_sorted_synonyms(token, max_word_level=word_level)
-
-        for candidate in synonyms:
-            before, after = self.get_count_to_replace(token, candidate)
-            if token.idx > before and token.pos_ in ["NOUN", "ADJ"]:
-                previous_token = token.nbor(-1 - before)
-                current_ngram = self.ngrams[previous_token.text + token.text]
-                new_ngram = self.ngrams[previous_token.text + candidate]
-                if (
-                    (new_ngram == 0 and current_ngram > 0)
-                    or new_ngram > 0
-                    and current_ngram / new_ngram > NGRAM_RATIO_THRESHOLD
-                ):
-                    continue
-            if token.idx + after < len(token.doc) and token.pos_ in ["NOUN", "ADJ"]:
-                next_token = token.nbor(1 + after)
-                current_ngram = self.ngrams[token.text + next_token.text]
-                new_ngram = self.ngrams[candidate + next_token.text]
-                if (new_ngram == 0 and current_ngram > 0) or (
-                    new_ngram > 0 and current_ngram / new_ngram > NGRAM_RATIO_THRESHOLD
-                ):
-                    continue
-            return candidate
+        synonyms = self.get_sorted_synonyms(
+            token, max_word_level=word_level, synonyms=synonyms
+        )
+        with instrumentation.timer("ngrams"):
+            return self.select_candidate(token, synonyms, analysis)
+
+    def select_candidate(
+        self, token, synonyms: List[str], analysis: DocAnalysis = None
+    ) -> str:
+        """Returns the first of ``synonyms`` that fits in the context of
+        ``token`` according to the n-grams, or the text of ``token``
+
+        The bigrams of all the candidates with their neighbours are looked up
+        at once, and compared to those of ``token``
+        """
+        if not synonyms or token.pos_ not in ["NOUN", "ADJ"]:
+            return synonyms[0] if synonyms else token.text
+        doc = token.doc
+        if analysis is None:
+            analysis = DocAnalysis(doc)
+        # the tokens before are the same for all candidates
+        extents = [analysis.count_to_replace(token, c) for c in synonyms]
+        before = extents[0][0]
+        # bigram -> index in the counts
+        bigrams: Dict[str, int] = {}
+
+        def bigram(text: str) -> int:
+            return bigrams.setdefault(text, len(bigrams))
+
+        left = None
+        if token.i - before > 0:
+            previous = token.nbor(-1 - before).text
+            left = (
+                bigram(previous + token.text),
+                [bigram(previous + candidate) for candidate in synonyms],
+            )
+        # -1 where there is no token after the replaced ones
+        right_current = np.full(len(synonyms), -1)
+        right_new = np.full(len(synonyms), -1)
+        for i, (candidate, (_, after)) in enumerate(zip(synonyms, extents)):
+            if token.i + 1 + after < len(doc):
+                next_text = doc[token.i + 1 + after].text
+                right_current[i] = bigram(token.text + next_text)
+                right_new[i] = bigram(candidate + next_text)
+
+        instrumentation.incr("ngram_lookups", len(bigrams))
+        counts = self.ngrams.counts(list(bigrams))
+        left_rejected = np.zeros(len(synonyms), dtype=bool)
+        if left is not None:
+            left_rejected = is_rejected(counts[left[0]], counts[left[1]])
+        right_rejected = np.zeros(len(synonyms), dtype=bool)
+        checked = right_new >= 0
+        right_rejected[checked] = is_rejected(
+            counts[right_current[checked]], counts[right_new[checked]]
+        )
+        for i in np.flatnonzero(~left_rejected):
+            if not right_rejected[i]:
+                return synonyms[i]
 
         return token.text
 
     def process_sentence(self, sentence) -> Tuple[Sentence, Sentence]:
-        doc = self.nlp(sentence)
+        """Records a profile of the call for a sample of the sentences, see
+        ``slt.profiling``
+        """
+        if profiling.sampled():
+            with profiling.profile("process_sentence", sentence=sentence):
+                return self._process_sentence(sentence)
+        return self._process_sentence(sentence)
+
+    def _process_sentence(self, sentence) -> Tuple[Sentence, Sentence]:
+        with instrumentation.timer("nlp"):
+            doc = self.nlp(sentence)
+        return self.process_doc(doc)
+
+    def process_sentences(
+        self, sentences: Iterable[str], batch_size: int = settings.BATCH_SIZE
+    ) -> Iterator[Tuple[Sentence, Sentence]]:
+        """Processes ``sentences`` by batches of ``batch_size``, yielding the
+        result for each of them in order
+        """
+        docs = self.nlp.pipe(sentences, batch_size=batch_size)
+        while True:
+            with instrumentation.timer("nlp"):
+                batch = list(islice(docs, batch_size))
+            if not batch:
+                break
+            synonyms = self.prefetch_synonyms(*batch)
+            for doc in batch:
+                yield self.process_doc(doc, synonyms)
+
+    def process_doc(self, doc, synonyms=None) -> Tuple[Sentence, Sentence]:
+        with instrumentation.timer("process_doc"):
+            return self._process_doc(doc, synonyms)
+
+    def _process_doc(self, doc, synonyms=None) -> Tuple[Sentence, Sentence]:
+        if synonyms is None:
+            synonyms = self.prefetch_synonyms(doc)
+        analysis = DocAnalysis(doc)
         old_sentence = Sentence()
         new_sentence = Sentence()
         seen = set()
         for i, token in enumerate(doc):
             if i in seen:
-                old_sentence.append(Word(token.text, status=Status.REMOVED))
+                old_sentence.append_word(token.text, Status.REMOVED)
                 continue
-            new_word_surface = self.compute_token(token)
+            new_word_surface = self.compute_token(token, synonyms, analysis)
             if new_word_surface != token.text:
-                new_word_surface = self.adjust_token(token, new_word_surface)
+                new_word_surface = self.adjust_token(token, new_word_surface, analysis)
             if new_word_surface == token.text:
-                new_word = Word(new_word_surface, status=Status.UNCHANGED)
-                old_sentence.append(Word(token.text, status=Status.UNCHANGED))
+                new_status = Status.UNCHANGED
+                old_sentence.append_word(token.text, Status.UNCHANGED)
                 before, after = 0, 0
             else:
-                new_word = Word(new_word_surface, status=Status.ADDED)
-                old_sentence.append(Word(token.text, status=Status.REMOVED))
-                before, after = self.get_count_to_replace(token, new_word_surface)
+                new_status = Status.ADDED
+                old_sentence.append_word(token.text, Status.REMOVED)
+                before, after = analysis.count_to_replace(token, new_word_surface)
 
             for j in range(i, i + after + 1):
                 seen.add(j)
 
-            if before > 0:
-                new_sentence = new_sentence[:-before]
-
-            new_sentence.append(new_word)
+            new_sentence.truncate(before)
+            new_sentence.append_word(new_word_surface, new_status)
 
         return new_sentence, old_sentence
 
-    def get_count_to_replace(self, token, new_word_surface) -> Tuple[int, int]:
-        before, after = 0, 0
-        if token.pos_ == "VERB":
-            after = len(self.get_verb_tokens(token)) - 1
-        elif (
-            token.pos_ == "ADJ"
-            and [t.text for t in token.rights][:1] in [["な"], ["だ"]]
-            and new_word_surface.endswith("い")
-            or new_word_surface.endswith("かった")
-        ):
-            after = 1
-
-        lefts = list(token.lefts)
-        if lefts and lefts[-1].pos_ == "INTJ" and lefts[-1].text in ["お", "ご"]:
-            before = 1
-
-        return (before, after)
+    @staticmethod
+    def get_count_to_replace(token, new_word_surface) -> Tuple[int, int]:
+        """See ``DocAnalysis.count_to_replace``, which should be used when
+        replacing several tokens of the same doc
+        """
+        return DocAnalysis(token.doc).count_to_replace(token, new_word_surface)
 
     @staticmethod
     def get_verb_tokens(root):
@@ -148,25 +284,44 @@ class Processor:
         jlpt_words_path=settings.JLPT_WORDS_PATH,
         ngrams_path=settings.NGRAMS_PATH,
         w2v=None,
+        spacy_profile=settings.SPACY_PROFILE,
+        lazy_ngrams=settings.LAZY_NGRAMS,
+        verbs_path=settings.VERBS_PATH,
+        prefilter_path=settings.PREFILTER_PATH,
     ):
         if w2v:
             synonyms_extractor = WordnetWithW2vThresholdExtractor(
                 wordnet_db_path, w2v, lang="jpn"
             )
         else:
-            synonyms_extractor = WordnetWithW2vThresholdExtractor.load(
-                w2v_model_path, wordnet_db_path
-            )
-        nlp = spacy.load(japanese_model)
-        with open(jlpt_words_path) as f:
-            jlpt_words = {
-                w: int(row["level"])
-                for row in csv.DictReader(f)
-                for w in re.split(r"\s+|、", row["word"])
-            }
-        with gzip.open(ngrams_path) as f:
-            ngrams = NGramsContainer.from_dict(json.load(f))
-        return cls(synonyms_extractor, nlp, jlpt_words, ngrams=ngrams)
+            with timed_load("word2vec"):
+                synonyms_extractor = WordnetWithW2vThresholdExtractor.load(
+                    w2v_model_path, wordnet_db_path
+                )
+        with timed_load("spacy"):
+            nlp = load_nlp(japanese_model, profile=spacy_profile)
+        with timed_load("jlpt"):
+            jlpt_words = load_jlpt_words(jlpt_words_path)
+        # share the same pipeline to tokenize n-grams
+        if lazy_ngrams:
+            ngrams = LazyNGramsContainer(ngrams_path, nlp=nlp)
+        else:
+            with timed_load("ngrams"):
+                ngrams = load_ngrams(ngrams_path, nlp=nlp)
+        with timed_load("conjugator"):
+            conjugator = Conjugator(verbs_path=verbs_path)
+        prefilter = None
+        if prefilter_path:
+            with timed_load("prefilter"):
+                prefilter = SimplifiableLemmas.load(prefilter_path)
+        return cls(
+            synonyms_extractor,
+            nlp,
+            jlpt_words,
+            ngrams=ngrams,
+            conjugator=conjugator,
+            prefilter=prefilter,
+        )
 
 
 # parser = Parser.load()
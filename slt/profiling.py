@@ -0,0 +1,133 @@
+"""Profiles of single requests, stored in ``settings.PROFILE_DIR``
+
+Each profile is a ``.pstats`` file, readable with ``pstats`` or tools such as
+snakeviz, next to a ``.json`` file describing the profiled call
+"""
+import cProfile
+import json
+import os
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from slt import settings
+
+
+PROFILE_SUFFIX = ".pstats"
+PROFILE_ID_RE = re.compile(r"^[\w-]+$")
+
+_local = threading.local()
+# a single profiler can be enabled at a time in a process
+_profiler_lock = threading.Lock()
+_counter_lock = threading.Lock()
+_counter = 0
+
+
+def sampled(rate: float = None) -> bool:
+    """Whether a call should be profiled according to the sample rate"""
+    if rate is None:
+        rate = settings.PROFILE_SAMPLE_RATE
+    return rate > 0 and random.random() < rate
+
+
+def active() -> bool:
+    """Whether a profile is already being recorded in the current thread"""
+    return getattr(_local, "profile", None) is not None
+
+
+def new_profile_id(label: str) -> str:
+    global _counter  # pylint: disable=global-statement, invalid-name
+    with _counter_lock:
+        _counter += 1
+        counter = _counter
+    timestamp = time.strftime("%Y%m%dT%H%M%S")
+    return f"{timestamp}-{os.getpid()}-{counter}-{label}"
+
+
+@contextmanager
+def profile(label: str, directory: str = None, **metadata):
+    """Profiles the block and saves the result in ``directory``
+
+    Yields the id of the profile, or ``None`` when nothing is recorded as
+    the current thread is already profiled by an enclosing block, or another
+    thread is being profiled. ``metadata`` must be serializable to JSON
+    """
+    if active() or not _profiler_lock.acquire(blocking=False):
+        yield None
+        return
+    try:
+        with _record(label, directory, metadata) as profile_id:
+            yield profile_id
+    finally:
+        _profiler_lock.release()
+
+
+@contextmanager
+def _record(label: str, directory: Optional[str], metadata: Dict[str, Any]):
+    directory = directory or settings.PROFILE_DIR
+    profile_id = new_profile_id(label)
+    profiler = cProfile.Profile()
+    _local.profile = profiler
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        yield profile_id
+    finally:
+        profiler.disable()
+        duration = time.perf_counter() - start
+        _local.profile = None
+        os.makedirs(directory, exist_ok=True)
+        profiler.dump_stats(os.path.join(directory, profile_id + PROFILE_SUFFIX))
+        with open(os.path.join(directory, profile_id + ".json"), "w") as f:
+            json.dump(
+                {"id": profile_id, "label": label, "duration": duration, **metadata},
+                f,
+                ensure_ascii=False,
+            )
+        prune(directory)
+
+
+def prune(directory: str, keep: int = None):
+    """Deletes all but the ``keep`` most recent profiles"""
+    if keep is None:
+        keep = settings.PROFILE_KEEP
+    for profile_id in list_profile_ids(directory)[keep:]:
+        for suffix in [PROFILE_SUFFIX, ".json"]:
+            try:
+                os.remove(os.path.join(directory, profile_id + suffix))
+            except FileNotFoundError:
+                pass
+
+
+def list_profile_ids(directory: str) -> List[str]:
+    """Ids of the profiles in ``directory``, most recent first"""
+    try:
+        entries = list(os.scandir(directory))
+    except FileNotFoundError:
+        return []
+    entries = [e for e in entries if e.name.endswith(PROFILE_SUFFIX)]
+    entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    return [e.name[: -len(PROFILE_SUFFIX)] for e in entries]
+
+
+def list_profiles(directory: str = None, limit: int = 50) -> List[Dict[str, Any]]:
+    directory = directory or settings.PROFILE_DIR
+    profiles = []
+    for profile_id in list_profile_ids(directory)[:limit]:
+        try:
+            with open(os.path.join(directory, profile_id + ".json")) as f:
+                profiles.append(json.load(f))
+        except (FileNotFoundError, json.JSONDecodeError):
+            profiles.append({"id": profile_id})
+    return profiles
+
+
+def profile_path(profile_id: str, directory: str = None) -> Optional[str]:
+    """Path of the stats of a profile, or ``None`` if it does not exist"""
+    if not PROFILE_ID_RE.match(profile_id):
+        return None
+    path = os.path.join(directory or settings.PROFILE_DIR, profile_id + PROFILE_SUFFIX)
+    return path if os.path.exists(path) else None
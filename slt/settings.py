@@ -14,14 +14,60 @@ WORDNET_DB_PATH = path.expanduser(
 W2V_MODEL_PATH = path.expanduser(
     os.environ.get("W2V_MODEL_PATH", "~/.local/share/models/cc.ja.300.bin")
 )
+# use an approximate nearest neighbour index in Word2vecSynonymExtractor, see slt.ann
+W2V_ANN = os.environ.get("W2V_ANN", "false").lower() == "true"
+# number of clusters scanned per query, higher is more accurate but slower
+ANN_NPROBE = int(os.environ.get("ANN_NPROBE", "16"))
 JAPANESE_MODEL = os.environ.get("JAPANESE_MODEL", "ja_core_news_sm")
+# see slt.nlp.PIPELINE_PROFILES
+SPACY_PROFILE = os.environ.get("SPACY_PROFILE", "serving")
 JLPT_WORDS_PATH = os.environ.get(
     "JLPT_WORDS_PATH", path.join(PROJECT_ROOT, "data/jlpt-vocab.csv")
 )
+WORDNET_POOL_SIZE = int(os.environ.get("WORDNET_POOL_SIZE", "8"))
+WORDNET_POOL_TIMEOUT = float(os.environ.get("WORDNET_POOL_TIMEOUT", "10"))
+WORDNET_MMAP_SIZE = int(os.environ.get("WORDNET_MMAP_SIZE", str(256 * 1024 * 1024)))
+# negative values are in KiB, see https://sqlite.org/pragma.html#pragma_cache_size
+WORDNET_CACHE_SIZE = int(os.environ.get("WORDNET_CACHE_SIZE", "-65536"))
+
+# lemmas which may be simplified, see slt.prefilter, all are looked up if unset
+PREFILTER_PATH = os.environ.get("PREFILTER_PATH")
 
 NGRAMS_PATH = path.expanduser(
     os.environ.get("NGRAMS_PATH", "~/.local/share/models/wiki-ja-ngrams.json.gz")
 )
+# only load the n-grams when they are first needed
+LAZY_NGRAMS = os.environ.get("LAZY_NGRAMS", "false").lower() == "true"
+
+# "background" to start serving while the models load, or "eager"
+MODEL_LOADING = os.environ.get("MODEL_LOADING", "background")
+
+# number of sentences processed together, see Processor.process_sentences
+BATCH_SIZE = int(os.environ.get("BATCH_SIZE", "32"))
+STREAM_BATCH_SIZE = int(os.environ.get("STREAM_BATCH_SIZE", "4"))
+
+# ASGI serving, see slt.workers.ProcessorPool
+SERVING_EXECUTOR = os.environ.get("SERVING_EXECUTOR", "process")
+SERVING_WORKERS = int(os.environ.get("SERVING_WORKERS", "2"))
+SERVING_MAX_PENDING = int(os.environ.get("SERVING_MAX_PENDING", "32"))
+REQUEST_TIMEOUT = float(os.environ.get("REQUEST_TIMEOUT", "10"))
+# Unix domain socket served by slt.sidecar
+SIDECAR_SOCKET = os.environ.get("SIDECAR_SOCKET", "/tmp/slt-sidecar.sock")
+
+# token expected in the X-Admin-Token header by the admin endpoints, which are
+# disabled when it is not set
+ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN")
+# fraction of the sentences profiled, see slt.profiling
+PROFILE_SAMPLE_RATE = float(os.environ.get("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_DIR = path.expanduser(os.environ.get("PROFILE_DIR", "~/.cache/slt/profiles"))
+# number of profiles kept, the oldest ones are deleted
+PROFILE_KEEP = int(os.environ.get("PROFILE_KEEP", "200"))
+
+# results kept for /translate/document, see slt.incremental
+DOCUMENT_STORE_MAX_SENTENCES = int(
+    os.environ.get("DOCUMENT_STORE_MAX_SENTENCES", "100000")
+)
+DOCUMENT_TTL = float(os.environ.get("DOCUMENT_TTL", "3600"))
 
 CONJUGATOR_DATA = path.join(PROJECT_ROOT, "data/conjo.csv")
 VERBS_PATH = path.join(PROJECT_ROOT, "data/verbs.csv")
@@ -0,0 +1,319 @@
+"""Serves ``Processor`` to other processes of the same host over a Unix domain
+socket, without the overhead of HTTP::
+
+    python -m slt.sidecar --socket /tmp/slt-sidecar.sock
+
+Every frame is a header, made of the length of the payload, the id of the
+request and an operation (or a status in responses), followed by the payload
+encoded with MessagePack. Responses carry the id of their request and are
+sent as soon as they are ready, so a connection can have many requests in
+flight. ``SidecarClient`` is a thread-safe client keeping a pool of such
+connections
+"""
+import argparse
+import asyncio
+import itertools
+import logging
+import os
+import socket
+import struct
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+import msgpack
+
+from slt import settings
+from slt.workers import ProcessorPool, QueueFullError
+
+
+# payload length, request id, operation or status
+HEADER = struct.Struct("!IIB")
+MAX_PAYLOAD_SIZE = 16 * 1024 * 1024
+
+# operations
+PROCESS_SENTENCE = 1
+PROCESS_SENTENCES = 2
+
+# statuses, the payload of errors is their message
+OK = 0
+ERROR = 1
+BUSY = 2
+TIMEOUT = 3
+
+
+class SidecarError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def encode_frame(request_id: int, code: int, payload: Any) -> bytes:
+    data = msgpack.packb(payload)
+    return HEADER.pack(len(data), request_id, code) + data
+
+
+class SidecarServer:
+    def __init__(
+        self,
+        pool: ProcessorPool = None,
+        path: str = settings.SIDECAR_SOCKET,
+        max_batch_size: int = settings.BATCH_SIZE,
+    ):
+        """Batches of more than ``max_batch_size`` sentences are rejected, as a
+        batch occupies a worker until it is fully processed
+        """
+        self.pool = pool or ProcessorPool()
+        self.path = path
+        self.max_batch_size = max_batch_size
+        # tasks handling the open connections
+        self._handlers = set()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        handler = asyncio.current_task()
+        self._handlers.add(handler)
+        tasks = set()
+        write_lock = asyncio.Lock()
+        try:
+            while True:
+                length, request_id, operation = HEADER.unpack(
+                    await reader.readexactly(HEADER.size)
+                )
+                if length > MAX_PAYLOAD_SIZE:
+                    logging.warning("closing connection sending %s bytes", length)
+                    break
+                payload = msgpack.unpackb(await reader.readexactly(length))
+                # requests are answered in the order they complete
+                task = asyncio.create_task(
+                    self.respond(writer, write_lock, request_id, operation, payload)
+                )
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except ValueError:
+            logging.warning("closing connection sending an invalid payload")
+        finally:
+            for task in tasks:
+                task.cancel()
+            self._handlers.discard(handler)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def call(self, operation: int, payload: Any) -> Any:
+        if operation == PROCESS_SENTENCE and isinstance(payload, str):
+            return await self.pool.process_sentence(payload)
+        if operation == PROCESS_SENTENCES and isinstance(payload, list):
+            if not all(isinstance(sentence, str) for sentence in payload):
+                raise SidecarError(ERROR, "sentences must be strings")
+            if len(payload) > self.max_batch_size:
+                raise SidecarError(
+                    ERROR, f"batches are limited to {self.max_batch_size} sentences"
+                )
+            return await self.pool.process_sentences(payload)
+        raise SidecarError(ERROR, f"invalid request for operation {operation}")
+
+    async def respond(
+        self,
+        writer: asyncio.StreamWriter,
+        write_lock: asyncio.Lock,
+        request_id: int,
+        operation: int,
+        payload: Any,
+    ):
+        try:
+            status, result = OK, await self.call(operation, payload)
+        except SidecarError as e:
+            status, result = e.status, str(e)
+        except QueueFullError:
+            status, result = BUSY, "too many pending requests"
+        except asyncio.TimeoutError:
+            status, result = TIMEOUT, "processing timed out"
+        except Exception as e:  # pylint: disable=broad-except
+            logging.exception("request %s failed", request_id)
+            status, result = ERROR, str(e)
+        # frames are written whole, the lock only keeps a single task draining
+        writer.write(encode_frame(request_id, status, result))
+        async with write_lock:
+            await writer.drain()
+
+    async def serve(self):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.pool.start)
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        server = await asyncio.start_unix_server(self.handle, path=self.path)
+        logging.info("serving on %s", self.path)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            # the server only stops accepting connections
+            handlers = list(self._handlers)
+            for handler in handlers:
+                handler.cancel()
+            await asyncio.gather(*handlers, return_exceptions=True)
+            self.pool.shutdown()
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+
+class SidecarConnection:
+    def __init__(self, path: str):
+        """Connection on which requests are sent from any thread, responses
+        being read by a background thread
+        """
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.connect(path)
+        self.closed = False
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._reader = threading.Thread(target=self._read_responses, daemon=True)
+        self._reader.start()
+
+    def send(self, operation: int, payload: Any) -> Future:
+        future = Future()
+        with self._lock:
+            if self.closed:
+                raise ConnectionError("connection closed")
+            # ids wrap around long after the first ones are answered
+            request_id = next(self._ids) % 2**32
+            self._pending[request_id] = future
+            future.add_done_callback(partial(self._forget, request_id))
+            try:
+                self.socket.sendall(encode_frame(request_id, operation, payload))
+            except OSError:
+                del self._pending[request_id]
+                raise
+        return future
+
+    def _forget(self, request_id: int, future: Future):
+        """Stops waiting for the response of cancelled requests"""
+        if future.cancelled():
+            with self._lock:
+                self._pending.pop(request_id, None)
+
+    def _read_exactly(self, size: int) -> bytes:
+        data = bytearray()
+        while len(data) < size:
+            chunk = self.socket.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("connection closed by the server")
+            data += chunk
+        return bytes(data)
+
+    def _read_responses(self):
+        try:
+            while True:
+                length, request_id, status = HEADER.unpack(
+                    self._read_exactly(HEADER.size)
+                )
+                result = msgpack.unpackb(self._read_exactly(length))
+                with self._lock:
+                    future = self._pending.pop(request_id, None)
+                # cancelled requests are answered anyway
+                if future is None or not future.set_running_or_notify_cancel():
+                    continue
+                if status == OK:
+                    future.set_result(result)
+                else:
+                    future.set_exception(SidecarError(status, result))
+        except (OSError, ValueError) as e:
+            self._fail(e)
+
+    def _fail(self, error: Exception):
+        with self._lock:
+            self.closed = True
+            pending, self._pending = self._pending, {}
+        self.socket.close()
+        if not isinstance(error, ConnectionError):
+            error = ConnectionError(str(error))
+        for future in pending.values():
+            if future.set_running_or_notify_cancel():
+                future.set_exception(error)
+
+    def close(self):
+        with self._lock:
+            self.closed = True
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.socket.close()
+
+
+class SidecarClient:
+    def __init__(
+        self,
+        path: str = settings.SIDECAR_SOCKET,
+        size: int = 2,
+        timeout: Optional[float] = None,
+    ):
+        """Sends requests over ``size`` connections to the sidecar at
+        ``path``, opened on first use and again once closed. Waits at most
+        ``timeout`` seconds for each response
+        """
+        self.path = path
+        self.size = size
+        self.timeout = timeout
+        self._connections: List[Optional[SidecarConnection]] = [None] * size
+        self._next = itertools.count()
+        self._lock = threading.Lock()
+
+    def _get_connection(self) -> SidecarConnection:
+        with self._lock:
+            i = next(self._next) % self.size
+            connection = self._connections[i]
+            if connection is None or connection.closed:
+                connection = self._connections[i] = SidecarConnection(self.path)
+            return connection
+
+    def request(self, operation: int, payload: Any) -> Any:
+        future = self._get_connection().send(operation, payload)
+        try:
+            return future.result(self.timeout)
+        except FutureTimeoutError:
+            # stops waiting for the response, unless it is being delivered
+            future.cancel()
+            raise
+
+    def process_sentence(self, sentence: str) -> Dict[str, Any]:
+        return self.request(PROCESS_SENTENCE, sentence)
+
+    def process_sentences(self, sentences: List[str]) -> List[Dict[str, Any]]:
+        return self.request(PROCESS_SENTENCES, sentences)
+
+    def close(self):
+        with self._lock:
+            for connection in self._connections:
+                if connection is not None:
+                    connection.close()
+            self._connections = [None] * self.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format=settings.LOG_FORMAT)
+    parser = argparse.ArgumentParser(prog="sidecar")
+    parser.add_argument("--socket", default=settings.SIDECAR_SOCKET)
+    args = parser.parse_args()
+
+    server = SidecarServer(path=args.socket)
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""ASGI entry point exposing ``/translate``
+
+Requests are accepted on the event loop while ``Processor`` runs in a bounded
+pool of workers, see ``slt.workers.ProcessorPool``. Run it with::
+
+    uvicorn slt.slt_asgi:app
+"""
+import asyncio
+import json
+import logging
+
+from slt import settings
+from slt.workers import ProcessorPool, QueueFullError
+
+
+MAX_BODY_SIZE = 1024 * 1024
+
+CORS_HEADERS = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-methods", b"POST, OPTIONS"),
+    (b"access-control-allow-headers", b"content-type"),
+]
+
+
+class RequestError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+async def send_response(send, status: int, body: bytes = b"", headers=None):
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": CORS_HEADERS + (headers or []),
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+async def send_json(send, status: int, data):
+    body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+    await send_response(
+        send, status, body, headers=[(b"content-type", b"application/json")]
+    )
+
+
+async def read_body(receive) -> bytes:
+    body = b""
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            raise RequestError(400, "client disconnected")
+        body += message.get("body", b"")
+        if len(body) > MAX_BODY_SIZE:
+            raise RequestError(413, "request body too large")
+        if not message.get("more_body", False):
+            return body
+
+
+async def read_sentence(receive) -> str:
+    try:
+        sentence = json.loads(await read_body(receive))["sentence"]
+    except (ValueError, KeyError, TypeError):
+        raise RequestError(400, "expected a JSON object with a sentence") from None
+    if not isinstance(sentence, str):
+        raise RequestError(400, "sentence must be a string")
+    return sentence
+
+
+class App:
+    def __init__(self, pool: ProcessorPool = None):
+        self.pool = pool or ProcessorPool()
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                loop = asyncio.get_running_loop()
+                # loading the models blocks for a while
+                await loop.run_in_executor(None, self.pool.start)
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.pool.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def translate(self, receive, send):
+        sentence = await read_sentence(receive)
+        try:
+            result = await self.pool.process_sentence(sentence)
+        except QueueFullError:
+            raise RequestError(429, "too many pending requests") from None
+        except asyncio.TimeoutError:
+            raise RequestError(504, "processing timed out") from None
+        await send_json(send, 200, result)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self.lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        try:
+            if scope["path"] != "/translate":
+                raise RequestError(404, "not found")
+            if scope["method"] == "OPTIONS":
+                await send_response(send, 204)
+            elif scope["method"] == "POST":
+                await self.translate(receive, send)
+            else:
+                raise RequestError(405, "method not allowed")
+        except RequestError as e:
+            await send_json(send, e.status, {"error": e.message})
+
+
+logging.basicConfig(level=logging.INFO, format=settings.LOG_FORMAT)
+app = App()
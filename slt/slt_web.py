@@ -1,41 +1,281 @@
-from flask import Flask, jsonify, render_template, request
+import codecs
+import hmac
+import json
+import time
+from typing import Dict
+
+import msgpack
+from flask import (
+    Flask,
+    Response,
+    abort,
+    g,
+    jsonify,
+    render_template,
+    request,
+    send_file,
+    stream_with_context,
+)
 from flask_cors import cross_origin
 from gensim.models.keyedvectors import KeyedVectors
 
-from slt import settings
+from slt import inspect, metrics, profiling, settings
+from slt.entities import encode_result, escape_surrogates
+from slt.incremental import DocumentStore, IncrementalSimplifier
+from slt.instrumentation import instrumentation
+from slt.japanese import SentenceSplitter, split_sentences
+from slt.loading import LOAD_TIMES, BackgroundLoader, timed_load
 from slt.processor import Processor
 
 
 processor: Processor = None
+loader: BackgroundLoader = None
+documents = DocumentStore()
 
+STREAM_CHUNK_SIZE = 4096
 
-def create_app():
+JSON = "application/json"
+# surfaces and integer statuses of the words in separate arrays
+COMPACT_JSON = "application/vnd.slt.compact+json"
+MSGPACK = "application/x-msgpack"
+RESPONSE_FORMATS = {
+    JSON: "json",
+    COMPACT_JSON: "compact",
+    MSGPACK: "msgpack",
+    "application/msgpack": "msgpack",
+}
+# endpoints whose requests are measured
+MEASURED_ENDPOINTS = ["index", "translate", "translate_stream", "translate_document"]
+
+
+def load_processor():
     global processor  # pylint: disable=global-statement, invalid-name
-    app_ = Flask(__name__)
-    w2v = KeyedVectors.load_word2vec_format(settings.W2V_MODEL_PATH, binary=True)
+    with timed_load("word2vec"):
+        w2v = KeyedVectors.load_word2vec_format(settings.W2V_MODEL_PATH, binary=True)
     processor = Processor.load(w2v=w2v)
+
+
+def create_app():
+    global loader  # pylint: disable=global-statement, invalid-name
+    app_ = Flask(__name__)
+    if settings.MODEL_LOADING == "background":
+        loader = BackgroundLoader(load_processor)
+        loader.start()
+    else:
+        load_processor()
     return app_
 
 
 app = create_app()
 
 
+@app.before_request
+def start_timer():
+    g.start = time.perf_counter()
+
+
+@app.after_request
+def record_request(response):
+    if request.endpoint in MEASURED_ENDPOINTS:
+        path = request.url_rule.rule
+        start = g.start
+
+        def observe_latency():
+            metrics.REQUEST_LATENCY.labels(path).observe(time.perf_counter() - start)
+
+        # streamed responses are only generated once returned from the view
+        response.call_on_close(observe_latency)
+        metrics.REQUESTS.labels(path, request.method, response.status_code).inc()
+        metrics.update_process_metrics(wordnet_pool_stats())
+    return response
+
+
+def wordnet_pool_stats() -> Dict[str, int]:
+    if processor is None or not hasattr(processor.synonyms_extractor, "pool_stats"):
+        return {}
+    return processor.synonyms_extractor.pool_stats()
+
+
+def not_ready():
+    response = jsonify({"error": "models are still loading"})
+    response.status_code = 503
+    response.headers["Retry-After"] = "10"
+    return response
+
+
+@app.route("/healthz")
+def healthz():
+    return jsonify({"status": "ok"})
+
+
+@app.route("/readyz")
+def readyz():
+    # copied at once, the loader may still be adding to it
+    body = {"ready": processor is not None, "load_times": dict(LOAD_TIMES)}
+    if loader is not None and loader.error is not None:
+        body["error"] = str(loader.error)
+    response = jsonify(body)
+    response.status_code = 200 if processor is not None else 503
+    return response
+
+
 @app.route("/")
 def index():
+    if processor is None:
+        return not_ready()
     sentence = request.args.get("sentence")
     kwargs = {"sentence": sentence}
     if sentence:
         result = processor.process_sentence(sentence)
         kwargs["new_sentence"], kwargs["old_sentence"] = result
+        metrics.INPUT_TOKENS.observe(len(kwargs["old_sentence"]))
     return render_template("index.html", **kwargs)
 
 
 @app.route("/translate", methods=["POST"])
 @cross_origin()
 def translate():
+    if processor is None:
+        return not_ready()
     sentence = request.get_json()["sentence"]
-    result = processor.process_sentence(sentence)
+    if request.headers.get("X-Profile") and is_admin():
+        with profiling.profile("translate", sentence=sentence) as profile_id:
+            response = translate_sentence(sentence)
+        if profile_id is not None:
+            response.headers["X-Profile-Id"] = profile_id
+        return response
+    return translate_sentence(sentence)
+
+
+def translate_sentence(sentence):
+    with instrumentation.trace() as trace:
+        result = processor.process_sentence(sentence)
     new_sentence, old_sentence = result
-    return jsonify(
-        {"new_sentence": new_sentence.as_dict(), "old_sentence": old_sentence.as_dict()}
+    metrics.INPUT_TOKENS.observe(len(old_sentence))
+    fields = {}
+    if request.args.get("debug"):
+        fields["debug"] = trace
+    response_format = get_response_format()
+    if response_format == "json":
+        response = Response(
+            encode_result(new_sentence, old_sentence, **fields), mimetype=JSON
+        )
+    else:
+        body = {
+            "new_sentence": new_sentence.as_columns(),
+            "old_sentence": old_sentence.as_columns(),
+            **fields,
+        }
+        if response_format == "msgpack":
+            response = Response(msgpack.packb(body), mimetype=MSGPACK)
+        else:
+            response = Response(
+                escape_surrogates(
+                    json.dumps(body, ensure_ascii=False, separators=(",", ":"))
+                ),
+                mimetype=COMPACT_JSON,
+            )
+    response.vary.add("Accept")
+    return response
+
+
+def get_response_format() -> str:
+    """Either ``json``, ``compact`` or ``msgpack``, from the ``format`` query
+    parameter or the ``Accept`` header
+    """
+    response_format = request.args.get("format")
+    if response_format in RESPONSE_FORMATS.values():
+        return response_format
+    mimetype = request.accept_mimetypes.best_match(list(RESPONSE_FORMATS), JSON)
+    return RESPONSE_FORMATS[mimetype]
+
+
+def is_admin() -> bool:
+    token = request.headers.get("X-Admin-Token") or ""
+    return bool(settings.ADMIN_TOKEN) and hmac.compare_digest(
+        token.encode(), settings.ADMIN_TOKEN.encode()
     )
+
+
+@app.route("/admin/memory")
+def memory():
+    if not is_admin():
+        abort(403)
+    if processor is None:
+        return not_ready()
+    return jsonify(inspect.inspect_processor(processor))
+
+
+@app.route("/admin/profiles")
+def list_profiles():
+    if not is_admin():
+        abort(403)
+    limit = request.args.get("limit", 50, type=int)
+    return jsonify(profiling.list_profiles(limit=limit))
+
+
+@app.route("/admin/profiles/<profile_id>")
+def download_profile(profile_id):
+    if not is_admin():
+        abort(403)
+    path = profiling.profile_path(profile_id)
+    if path is None:
+        abort(404)
+    return send_file(path, mimetype="application/octet-stream", as_attachment=True)
+
+
+@app.route("/metrics")
+def prometheus_metrics():
+    return Response(metrics.generate_metrics(), mimetype=metrics.CONTENT_TYPE_LATEST)
+
+
+@app.route("/stats")
+def stats():
+    return jsonify({**instrumentation.snapshot(), "wordnet_pool": wordnet_pool_stats()})
+
+
+def iter_request_sentences():
+    """Reads the sentences of the request body as it is received.
+    The body is either NDJSON with a ``text`` field on each line, or plain text
+    """
+    if request.mimetype == "application/x-ndjson":
+        for line in request.stream:
+            if line.strip():
+                yield from split_sentences(json.loads(line)["text"])
+        return
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    splitter = SentenceSplitter()
+    while chunk := request.stream.read(STREAM_CHUNK_SIZE):
+        yield from splitter.feed(decoder.decode(chunk))
+    yield from splitter.feed(decoder.decode(b"", final=True))
+    yield from splitter.flush()
+
+
+@app.route("/translate/stream", methods=["POST"])
+@cross_origin()
+def translate_stream():
+    if processor is None:
+        return not_ready()
+
+    def generate():
+        results = processor.process_sentences(
+            iter_request_sentences(), batch_size=settings.STREAM_BATCH_SIZE
+        )
+        for i, (new_sentence, old_sentence) in enumerate(results):
+            yield encode_result(new_sentence, old_sentence, index=i) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+
+@app.route("/translate/document", methods=["POST"])
+@cross_origin()
+def translate_document():
+    """Simplifies a new version of a document, only processing the sentences
+    which changed since the last version sent with the same ``document_id``
+    """
+    if processor is None:
+        return not_ready()
+    body = request.get_json()
+    simplifier = IncrementalSimplifier(processor, documents)
+    sentences = simplifier.update(str(body["document_id"]), body["text"])
+    return jsonify({"document_id": body["document_id"], "sentences": sentences})
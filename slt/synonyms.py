@@ -1,26 +1,63 @@
-from typing import List
+from typing import Dict, Iterable, List, Tuple
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from functools import lru_cache
 import threading
-import sqlite3
 
 import numpy as np
 from gensim.models.keyedvectors import KeyedVectors
 
+from slt import ann, settings, wordnet
+from slt.instrumentation import instrumentation
+
 
 CACHE_SIZE = 10_000
 DEFAULT_SIMILARITY_THRESHOLD = 0.4
 
 
-thread_local = threading.local()
-
-
 def load_word2vec_model(model_path: str, is_binary: bool = None):
     if is_binary is None:
         is_binary = model_path.endswith(".bin")
     return KeyedVectors.load_word2vec_format(model_path, binary=is_binary)
 
 
+def rank_by_similarity(
+    candidates: List[str], scores, topn: int, threshold: float
+) -> List[str]:
+    sorted_indices = np.argsort(scores)[::-1]
+    return [candidates[i] for i in sorted_indices[:topn] if scores[i] >= threshold]
+
+
+class LRUCache:
+    def __init__(self, maxsize: int = CACHE_SIZE):
+        """Thread-safe mapping keeping the ``maxsize`` most recently used keys"""
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
 class SynonymExtractor(ABC):  # pylint: disable=too-few-public-methods
     """Base class for synonyms extractor"""
 
@@ -28,6 +65,17 @@ class SynonymExtractor(ABC):  # pylint: disable=too-few-public-methods
     def find_synonyms(self, word: str, topn: int = 10, pos: str = "") -> List[str]:
         """Extract ``topn`` synonyms of ``word``"""
 
+    def find_synonyms_batch(
+        self, words_with_pos: Iterable[Tuple[str, str]], topn: int = 10
+    ) -> Dict[Tuple[str, str], List[str]]:
+        """Extract ``topn`` synonyms of each ``(word, pos)`` pair
+        Subclasses can override this to share work between the words
+        """
+        return {
+            (word, pos): self.find_synonyms(word, topn=topn, pos=pos)
+            for word, pos in words_with_pos
+        }
+
 
 class WithWordnet:  # pylint: disable=too-few-public-methods
     pos_mapping = {"NOUN": "n", "VERB": "v", "ADJ": "a"}
@@ -35,32 +83,72 @@ class WithWordnet:  # pylint: disable=too-few-public-methods
     def __init__(self, db_path: str, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.db_path = db_path
+        self._compact = None
+        self._pool = None
+        self._pool_lock = threading.Lock()
 
     @property
-    def db(self):
-        if not hasattr(thread_local, "wordnet_db"):
-            thread_local.wordnet_db = sqlite3.connect(self.db_path)
-        return thread_local.wordnet_db
+    def compact(self) -> bool:
+        """Whether ``db_path`` was built by ``slt.wordnet`` rather than
+        being the stock WordNet dump
+        """
+        if self._compact is None:
+            self._compact = wordnet.is_compact_db(self.db_path)
+        return self._compact
+
+    @property
+    def pool(self) -> wordnet.ConnectionPool:
+        with self._pool_lock:
+            if self._pool is None:
+                # the compact database is never written to once built
+                self._pool = wordnet.ConnectionPool(
+                    self.db_path, immutable=self.compact
+                )
+            return self._pool
+
+    def pool_stats(self) -> Dict[str, int]:
+        if self._pool is None:
+            return {}
+        return self._pool.stats()
 
     def pos_to_wordnet(self, pos: str) -> str:
         return self.pos_mapping.get(pos, "r")
 
 
 class Word2vecSynonymExtractor(SynonymExtractor):
-    def __init__(self, model):
-        """Uses word2vec to find synonyms"""
+    def __init__(self, model, index: ann.IVFIndex = None):
+        """Uses word2vec to find synonyms
+        If ``index`` is provided, it is used instead of an exhaustive search
+        """
         self.model = model
+        self.index = index
 
     @lru_cache(maxsize=CACHE_SIZE)
     def find_synonyms(self, word: str, topn: int = 10, pos: str = "") -> List[str]:
         if word not in self.model:
             return []
+        if self.index is not None and topn > 0:
+            ids, _ = self.index.search(
+                self.model.get_vector(word),
+                topn=topn,
+                exclude=self.model.key_to_index[word],
+            )
+            return [self.model.index_to_key[i] for i in ids]
         return [v[0] for v in self.model.most_similar(word, topn=topn)]
 
     @classmethod
-    def load(cls, model_path, is_binary=None):
+    def load(
+        cls, model_path, is_binary=None, use_ann=settings.W2V_ANN, nprobe=None
+    ):  # pylint: disable=arguments-differ
         model = load_word2vec_model(model_path, is_binary=is_binary)
-        return cls(model)
+        index = None
+        if use_ann:
+            index = ann.IVFIndex.load_or_build(
+                ann.index_path(model_path),
+                model.vectors,
+                nprobe=nprobe or settings.ANN_NPROBE,
+            )
+        return cls(model, index=index)
 
 
 class WordnetSynonymExtractor(WithWordnet, SynonymExtractor):
@@ -77,26 +165,108 @@ class WordnetSynonymExtractor(WithWordnet, SynonymExtractor):
         )
         {limit}
     """
+    # same parameters as ``SYNONYM_QUERY``, against ``slt.wordnet`` tables
+    COMPACT_SYNONYM_QUERY = """
+        SELECT DISTINCT sl.lemma FROM lemma_synsets ls
+        JOIN synset_lemmas sl ON sl.synset = ls.synset
+        WHERE sl.lang = ? AND sl.lemma <> ? AND ls.lemma = ?
+        {pos_condition}
+        {limit}
+    """
+    # synonyms of several lemmas, for all parts of speech
+    BATCH_SYNONYM_QUERY = """
+        SELECT DISTINCT w0.lemma, s2.pos, w.lemma FROM word w0
+        JOIN sense s0 ON w0.wordid = s0.wordid
+        JOIN synset s2 ON s0.synset = s2.synset
+        JOIN sense s ON s.synset = s0.synset
+        JOIN word w ON w.wordid = s.wordid
+        WHERE w.lang = ? AND w.lemma <> w0.lemma AND w0.lemma IN ({placeholders})
+    """
+    COMPACT_BATCH_SYNONYM_QUERY = """
+        SELECT DISTINCT ls.lemma, ls.pos, sl.lemma FROM lemma_synsets ls
+        JOIN synset_lemmas sl ON sl.synset = ls.synset
+        WHERE sl.lang = ? AND sl.lemma <> ls.lemma AND ls.lemma IN ({placeholders})
+    """
 
     def __init__(self, db_path: str, lang: str):
         """Uses wordnet to find synonyms"""
         super().__init__(db_path)
         self.lang = lang
+        # lemma -> wordnet pos -> synonyms
+        self._batch_cache = LRUCache()
 
     @lru_cache(maxsize=CACHE_SIZE)
     def find_synonyms(self, word: str, topn: int = 10, pos: str = "") -> List[str]:
-        cursor = self.db.cursor()
         args = (self.lang, word, word)
         format_args = dict(pos_condition="", limit="")
         if pos:
-            format_args["pos_condition"] = " AND s2.pos = ?"
+            pos_column = "ls.pos" if self.compact else "s2.pos"
+            format_args["pos_condition"] = f" AND {pos_column} = ?"
             args += (self.pos_to_wordnet(pos),)
         if topn > 0:
             format_args["limit"] = " LIMIT ?"
             args += (topn,)
-        query = self.SYNONYM_QUERY.format(**format_args)
-        cursor.execute(query, args)
-        return [v[0] for v in cursor.fetchall()]
+        query = self.COMPACT_SYNONYM_QUERY if self.compact else self.SYNONYM_QUERY
+        query = query.format(**format_args)
+        instrumentation.incr("sql_queries")
+        with self.pool.connection() as db:
+            return [v[0] for v in db.execute(query, args).fetchall()]
+
+    def clear_cache(self):
+        """Forgets the synonyms found so far, the ``find_synonyms`` caches are
+        shared by all the instances
+        """
+        for cls in type(self).__mro__:
+            find_synonyms = vars(cls).get("find_synonyms")
+            if hasattr(find_synonyms, "cache_clear"):
+                find_synonyms.cache_clear()
+        self._batch_cache.clear()
+
+    def _fetch_lemmas_synonyms(self, lemmas: List[str]) -> Dict[str, dict]:
+        """Retrieves the synonyms of all ``lemmas`` with a single query"""
+        synonyms = {lemma: {} for lemma in lemmas}
+        if not lemmas:
+            return synonyms
+        query = (
+            self.COMPACT_BATCH_SYNONYM_QUERY
+            if self.compact
+            else self.BATCH_SYNONYM_QUERY
+        )
+        query = query.format(placeholders=", ".join("?" * len(lemmas)))
+        instrumentation.incr("sql_queries")
+        with self.pool.connection() as db:
+            rows = db.execute(query, (self.lang, *lemmas)).fetchall()
+        for lemma, pos, synonym in rows:
+            synonyms[lemma].setdefault(pos, []).append(synonym)
+        return synonyms
+
+    def find_synonyms_batch(
+        self, words_with_pos: Iterable[Tuple[str, str]], topn: int = 10
+    ) -> Dict[Tuple[str, str], List[str]]:
+        words_with_pos = list(words_with_pos)
+        by_lemma = {}
+        missing = []
+        for word, _ in words_with_pos:
+            if word in by_lemma:
+                continue
+            by_lemma[word] = self._batch_cache.get(word)
+            if by_lemma[word] is None:
+                missing.append(word)
+        instrumentation.incr("synonym_cache_hits", len(by_lemma) - len(missing))
+        instrumentation.incr("synonym_cache_misses", len(missing))
+        for lemma, synonyms in self._fetch_lemmas_synonyms(missing).items():
+            self._batch_cache[lemma] = by_lemma[lemma] = synonyms
+
+        results = {}
+        for word, pos in words_with_pos:
+            if pos:
+                synonyms = by_lemma[word].get(self.pos_to_wordnet(pos), [])
+            else:
+                synonyms = list(
+                    dict.fromkeys(w for s in by_lemma[word].values() for w in s)
+                )
+            results[(word, pos)] = synonyms[:topn] if topn > 0 else synonyms
+        return results
 
     @classmethod
     def load(cls, db_path: str, lang: str = "jpn"):
@@ -151,17 +321,65 @@ class WordnetWithW2vThresholdExtractor(WordnetSynonymExtractor):
         super().__init__(db_path, lang)
         self.model = model
         self.similarity_threshold = similarity_threshold
+        # (word, pos, topn) -> synonyms ranked by similarity
+        self._ranked_cache = LRUCache()
 
     @lru_cache(maxsize=CACHE_SIZE)
     def find_synonyms(self, word: str, topn: int = 10, pos: str = "") -> List[str]:
         candidates = super().find_synonyms(word, topn=-1, pos=pos)
         scores = [self.similarity(word, c) for c in candidates]
-        sorted_indices = np.argsort(scores)[::-1]
-        return [
-            candidates[i]
-            for i in sorted_indices[:topn]
-            if scores[i] >= self.similarity_threshold
+        return rank_by_similarity(candidates, scores, topn, self.similarity_threshold)
+
+    def clear_cache(self):
+        super().clear_cache()
+        self._ranked_cache.clear()
+
+    def find_synonyms_batch(
+        self, words_with_pos: Iterable[Tuple[str, str]], topn: int = 10
+    ) -> Dict[Tuple[str, str], List[str]]:
+        """Only ranks the synonyms of the words which were not ranked yet"""
+        results = {}
+        missing = []
+        for word, pos in words_with_pos:
+            ranked = self._ranked_cache.get((word, pos, topn))
+            if ranked is None:
+                missing.append((word, pos))
+            else:
+                results[(word, pos)] = ranked
+        candidates = super().find_synonyms_batch(missing, topn=-1)
+        pairs = [
+            (word, candidate)
+            for (word, _), synonyms in candidates.items()
+            for candidate in synonyms
+        ]
+        scores = self.similarities(pairs)
+        offset = 0
+        for key, synonyms in candidates.items():
+            word_scores = scores[offset : offset + len(synonyms)]
+            offset += len(synonyms)
+            results[key] = rank_by_similarity(
+                synonyms, word_scores, topn, self.similarity_threshold
+            )
+            self._ranked_cache[(*key, topn)] = results[key]
+        return results
+
+    def similarities(self, pairs: List[Tuple[str, str]]) -> np.ndarray:
+        """Vectorized version of ``similarity`` over all ``pairs``"""
+        scores = np.full(len(pairs), self.similarity_threshold, dtype=np.float32)
+        known = [
+            i
+            for i, (word1, word2) in enumerate(pairs)
+            if word1 in self.model and word2 in self.model
         ]
+        if not known:
+            return scores
+        words = list(dict.fromkeys(w for i in known for w in pairs[i]))
+        positions = {w: i for i, w in enumerate(words)}
+        vectors = np.stack([self.model.get_vector(w, norm=True) for w in words])
+        left = vectors[[positions[pairs[i][0]] for i in known]]
+        right = vectors[[positions[pairs[i][1]] for i in known]]
+        scores[known] = np.einsum("ij,ij->i", left, right)
+        return scores
 
     def similarity(self, word1: str, word2: str) -> float:
         if word1 in self.model and word2 in self.model:
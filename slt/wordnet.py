@@ -0,0 +1,257 @@
+import argparse
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import weakref
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Dict
+
+from slt import settings
+
+
+# tables created by ``build_compact_db``, used to detect the compact schema
+LEMMA_SYNSETS_TABLE = "lemma_synsets"
+SYNSET_LEMMAS_TABLE = "synset_lemmas"
+
+COMPACT_SCHEMA = f"""
+    CREATE TABLE {LEMMA_SYNSETS_TABLE} (
+        lemma TEXT NOT NULL,
+        pos TEXT NOT NULL,
+        synset TEXT NOT NULL,
+        PRIMARY KEY (lemma, pos, synset)
+    ) WITHOUT ROWID;
+    CREATE TABLE {SYNSET_LEMMAS_TABLE} (
+        synset TEXT NOT NULL,
+        lang TEXT NOT NULL,
+        lemma TEXT NOT NULL,
+        PRIMARY KEY (synset, lang, lemma)
+    ) WITHOUT ROWID;
+"""
+
+# ``pos`` is the part of speech of the synset, not of the word, to match
+# the semantics of ``WordnetSynonymExtractor.SYNONYM_QUERY``
+COPY_LEMMA_SYNSETS = f"""
+    INSERT OR IGNORE INTO {LEMMA_SYNSETS_TABLE} (lemma, pos, synset)
+    SELECT w.lemma, s2.pos, s.synset
+    FROM source.word w
+    JOIN source.sense s ON w.wordid = s.wordid
+    JOIN source.synset s2 ON s.synset = s2.synset
+"""
+
+COPY_SYNSET_LEMMAS = f"""
+    INSERT OR IGNORE INTO {SYNSET_LEMMAS_TABLE} (synset, lang, lemma)
+    SELECT s.synset, w.lang, w.lemma
+    FROM source.word w
+    JOIN source.sense s ON w.wordid = s.wordid
+"""
+
+
+def connect(db_path: str, immutable: bool = False, **kwargs) -> sqlite3.Connection:
+    """Opens ``db_path`` read-only. ``immutable`` tells SQLite the file
+    cannot change, which skips locking and change detection entirely
+    """
+    # the path is escaped, as it may contain characters such as "?" or "#"
+    uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+    if immutable:
+        uri += "&immutable=1"
+    return sqlite3.connect(uri, uri=True, **kwargs)
+
+
+# pools of the process, reset in forked children, see ``ConnectionPool._reset``
+_pools: "weakref.WeakSet[ConnectionPool]" = weakref.WeakSet()
+
+
+def _reset_pools():
+    for pool in list(_pools):
+        pool._reset()  # pylint: disable=protected-access
+
+
+class ConnectionPool:
+    """Bounded pool of read-only connections to a WordNet database.
+
+    Connections are opened lazily up to ``size`` and handed out LIFO so that
+    the most recently used ones, with a warm page cache, are reused first.
+    ``sqlite3`` caches prepared statements per connection keyed on the SQL
+    text, so queries built from the same template are only compiled once
+    per connection
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        size: int = settings.WORDNET_POOL_SIZE,
+        immutable: bool = False,
+        timeout: float = settings.WORDNET_POOL_TIMEOUT,
+        mmap_size: int = settings.WORDNET_MMAP_SIZE,
+        cache_size: int = settings.WORDNET_CACHE_SIZE,
+        cached_statements: int = 256,
+    ):
+        self.db_path = db_path
+        self.size = size
+        self.immutable = immutable
+        self.timeout = timeout
+        self.pragmas = {
+            "mmap_size": mmap_size,
+            "cache_size": cache_size,
+            "query_only": "ON",
+        }
+        self.cached_statements = cached_statements
+        # connections inherited from a parent process, see ``_reset``
+        self._inherited = []
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._reset()
+        _pools.add(self)
+
+    def _reset(self):
+        """Forgets all connections, without closing them.
+
+        SQLite connections must not be used across ``fork``, so a child
+        process starts with an empty pool. The inherited connections are kept
+        referenced as closing them could interfere with the parent. Called
+        right after ``fork`` in the child, before any other thread runs. The
+        locks of the parent may have been held by its other threads, so
+        neither they nor the methods of the queue taking them are used
+        """
+        self._inherited.extend(self._idle.queue)
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._in_use = 0
+        self._peak_in_use = 0
+        self._acquisitions = 0
+        self._waits = 0
+        self._timeouts = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        db = connect(
+            self.db_path,
+            immutable=self.immutable,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+        )
+        for name, value in self.pragmas.items():
+            db.execute(f"PRAGMA {name} = {value}")
+        return db
+
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            should_create = self._created < self.size
+            if should_create:
+                self._created += 1
+            else:
+                self._waits += 1
+        if should_create:
+            try:
+                return self._connect()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            with self._lock:
+                self._timeouts += 1
+            raise TimeoutError(
+                f"no WordNet connection available after {self.timeout}s"
+            ) from None
+
+    @contextmanager
+    def connection(self):
+        db = self._acquire()
+        pid = os.getpid()
+        with self._lock:
+            self._acquisitions += 1
+            self._in_use += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+        try:
+            yield db
+        finally:
+            # connections acquired before a fork belong to the parent
+            if pid == os.getpid():
+                with self._lock:
+                    self._in_use -= 1
+                self._idle.put(db)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": self.size,
+                "created": self._created,
+                "in_use": self._in_use,
+                "idle": self._idle.qsize(),
+                "peak_in_use": self._peak_in_use,
+                "acquisitions": self._acquisitions,
+                "waits": self._waits,
+                "timeouts": self._timeouts,
+            }
+
+    def close(self):
+        while True:
+            try:
+                db = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            db.close()
+            with self._lock:
+                self._created -= 1
+
+
+os.register_at_fork(after_in_child=_reset_pools)
+
+
+def is_compact(db: sqlite3.Connection) -> bool:
+    row = db.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (LEMMA_SYNSETS_TABLE,),
+    ).fetchone()
+    return row is not None
+
+
+def is_compact_db(db_path: str) -> bool:
+    with closing(connect(db_path)) as db:
+        return is_compact(db)
+
+
+def build_compact_db(source_path: str, output_path: str):
+    """Derives a serving database from the stock ``wnjpn.db`` containing
+    only the denormalized tables needed to look up synonyms
+    """
+    if os.path.exists(output_path):
+        os.remove(output_path)
+    with closing(sqlite3.connect(output_path)) as db:
+        db.executescript(COMPACT_SCHEMA)
+        db.execute("ATTACH DATABASE ? AS source", (source_path,))
+        logging.info("copying lemma to synset mapping")
+        db.execute(COPY_LEMMA_SYNSETS)
+        logging.info("copying synset to lemmas mapping")
+        db.execute(COPY_SYNSET_LEMMAS)
+        db.commit()
+        db.execute("DETACH DATABASE source")
+        logging.info("computing statistics")
+        db.execute("ANALYZE")
+        db.commit()
+        db.execute("VACUUM")
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format=settings.LOG_FORMAT)
+    parser = argparse.ArgumentParser(prog="wordnet")
+    parser.add_argument(
+        "file", nargs="?", default=settings.WORDNET_DB_PATH, help="stock wnjpn.db"
+    )
+    parser.add_argument("-o", "--output", required=True, help="output file")
+    args = parser.parse_args()
+
+    build_compact_db(args.file, args.output)
+
+
+if __name__ == "__main__":
+    main()
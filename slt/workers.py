@@ -0,0 +1,151 @@
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List
+
+from slt import settings
+from slt.processor import Processor
+
+
+# processor of the current worker, see ``init_worker``
+_processor: Processor = None
+_processor_lock = threading.Lock()
+# processors of the threads of a pool, see ``init_thread_worker``
+_local = threading.local()
+
+
+class QueueFullError(Exception):
+    """Raised when too many requests are already pending"""
+
+
+def init_worker():
+    global _processor  # pylint: disable=global-statement, invalid-name
+    with _processor_lock:
+        if _processor is None:
+            logging.info("loading processor in process %s", os.getpid())
+            _processor = Processor.load()
+
+
+def init_thread_worker():
+    """Loads a processor for the current thread only, as the Sudachi tokenizer
+    cannot be used by several threads at once
+    """
+    if getattr(_local, "processor", None) is None:
+        logging.info("loading processor in thread %s", threading.get_ident())
+        _local.processor = Processor.load()
+
+
+def get_processor() -> Processor:
+    init_worker()
+    return _processor
+
+
+def current_processor() -> Processor:
+    """Processor of the current thread, if it has one, else of the process"""
+    return getattr(_local, "processor", None) or _processor
+
+
+def process_sentence(sentence: str) -> Dict[str, Any]:
+    new_sentence, old_sentence = current_processor().process_sentence(sentence)
+    # plain dicts are cheaper to send back from another process
+    return {
+        "new_sentence": new_sentence.as_dict(),
+        "old_sentence": old_sentence.as_dict(),
+    }
+
+
+def process_sentences(sentences: List[str]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "new_sentence": new_sentence.as_dict(),
+            "old_sentence": old_sentence.as_dict(),
+        }
+        for new_sentence, old_sentence in current_processor().process_sentences(
+            sentences
+        )
+    ]
+
+
+class ProcessorPool:
+    def __init__(
+        self,
+        executor: str = settings.SERVING_EXECUTOR,
+        workers: int = settings.SERVING_WORKERS,
+        max_pending: int = settings.SERVING_MAX_PENDING,
+        timeout: float = settings.REQUEST_TIMEOUT,
+    ):
+        """Runs ``Processor`` outside of the event loop
+
+        ``executor`` is either ``process``, where each worker process loads its
+        own processor, or ``thread``, where each thread loads its own processor
+        in the current process. At most ``max_pending`` calls can be running or
+        queued at the same time, further calls raise ``QueueFullError``
+        """
+        self.executor_type = executor
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.executor: Executor = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def start(self):
+        if self.executor_type == "process":
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=init_worker
+            )
+            # load the models in every worker now rather than on the first requests
+            for future in [
+                self.executor.submit(init_worker) for _ in range(self.workers)
+            ]:
+                future.result()
+        elif self.executor_type == "thread":
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.workers, initializer=init_thread_worker
+            )
+            for future in [
+                self.executor.submit(init_thread_worker) for _ in range(self.workers)
+            ]:
+                future.result()
+        else:
+            raise ValueError(f"unknown executor: {self.executor_type}")
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _release(self, _future):
+        with self._lock:
+            self._pending -= 1
+
+    async def run(self, func, *args):
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise QueueFullError(f"{self._pending} requests already pending")
+            self._pending += 1
+        future = self.executor.submit(func, *args)
+        # the slot is only released once the call actually finished, so that
+        # timed out calls which are still running keep counting
+        future.add_done_callback(self._release)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            # only has an effect if the call did not start yet
+            future.cancel()
+            raise
+
+    async def process_sentence(self, sentence: str) -> Dict[str, Any]:
+        return await self.run(process_sentence, sentence)
+
+    async def process_sentences(self, sentences: List[str]) -> List[Dict[str, Any]]:
+        """Processes ``sentences`` in a single call, which counts as one
+        pending request
+        """
+        return await self.run(process_sentences, sentences)
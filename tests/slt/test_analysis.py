@@ -0,0 +1,83 @@
+import random
+import unittest
+from typing import Tuple
+
+from spacy.tokens import Doc, Token
+from spacy.vocab import Vocab
+
+from slt.analysis import COPULAS, HONORIFIC_PREFIXES, VERB_GROUP_DEPS, DocAnalysis
+
+
+WORDS = ["お", "ご", "な", "だ", "食事", "し", "た", "静か", "い", "かった"]
+POS = ["INTJ", "VERB", "ADJ", "NOUN", "AUX"]
+DEPS = VERB_GROUP_DEPS + ["nsubj", "obj", "advcl"]
+
+
+def count_to_replace(token: Token, new_word_surface: str) -> Tuple[int, int]:
+    """Reference implementation following the children of ``token``"""
+    before, after = 0, 0
+    lefts, rights = list(token.lefts), list(token.rights)
+    if token.pos_ == "VERB":
+        for right in rights:
+            if right.dep_ not in VERB_GROUP_DEPS:
+                break
+            after += 1
+    elif (
+        token.pos_ == "ADJ"
+        and rights
+        and rights[0].text in COPULAS
+        and new_word_surface.endswith("い")
+        or new_word_surface.endswith("かった")
+    ):
+        after = 1
+    if lefts and lefts[-1].pos_ == "INTJ" and lefts[-1].text in HONORIFIC_PREFIXES:
+        before = 1
+    return before, after
+
+
+def random_doc(rng: random.Random, length: int) -> Doc:
+    """Doc with a random dependency tree, not necessarily projective"""
+    order = list(range(length))
+    rng.shuffle(order)
+    heads = [0] * length
+    heads[order[0]] = order[0]
+    for position, i in enumerate(order[1:], start=1):
+        heads[i] = order[rng.randrange(position)]
+    deps = ["ROOT" if heads[i] == i else rng.choice(DEPS) for i in range(length)]
+    return Doc(
+        Vocab(),
+        words=[rng.choice(WORDS) for _ in range(length)],
+        pos=[rng.choice(POS) for _ in range(length)],
+        heads=heads,
+        deps=deps,
+    )
+
+
+class DocAnalysisTests(unittest.TestCase):
+    def test_matches_children(self):
+        rng = random.Random(0)
+        for _ in range(300):
+            doc = random_doc(rng, rng.randint(1, 12))
+            analysis = DocAnalysis(doc)
+            for token in doc:
+                for surface in ["静か", "美しい", "よかった"]:
+                    self.assertEqual(
+                        analysis.count_to_replace(token, surface),
+                        count_to_replace(token, surface),
+                        (list(doc), [t.head.i for t in doc], token.i, surface),
+                    )
+
+    def test_verb_groups(self):
+        doc = Doc(
+            Vocab(),
+            words=["食事", "し", "まし", "た"],
+            pos=["NOUN", "VERB", "AUX", "AUX"],
+            heads=[1, 1, 1, 1],
+            deps=["obj", "ROOT", "aux", "aux"],
+        )
+        analysis = DocAnalysis(doc)
+        self.assertEqual(
+            [t.text for t in analysis.verb_groups[1]], ["し", "まし", "た"]
+        )
+        self.assertIsNone(analysis.verb_groups[0])
+        self.assertEqual(analysis.count_to_replace(doc[1], "食べる"), (0, 2))
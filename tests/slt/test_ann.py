@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from slt import ann
+
+
+def exact_search(vectors: np.ndarray, query: np.ndarray, topn: int) -> np.ndarray:
+    scores = (vectors @ query) / np.linalg.norm(vectors, axis=1)
+    return np.argsort(-scores)[:topn]
+
+
+class IVFIndexTests(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        # clustered vectors, as word embeddings are
+        centers = rng.normal(size=(20, 16))
+        self.vectors = (
+            centers[rng.integers(0, 20, 2000)] + 0.3 * rng.normal(size=(2000, 16))
+        ).astype(np.float32)
+
+    def test_nearest_centroids_does_not_depend_on_chunk_size(self):
+        centroids = self.vectors[:30]
+        expected = np.argmax(self.vectors @ centroids.T, axis=1)
+        for chunk_size in [1, 7, 2000, 5000]:
+            np.testing.assert_array_equal(
+                ann.nearest_centroids(self.vectors, centroids, chunk_size), expected
+            )
+
+    def test_build_partitions_every_vector(self):
+        index = ann.IVFIndex.build(self.vectors, chunk_size=100)
+        self.assertEqual(index.n_lists, int(np.sqrt(len(self.vectors))))
+        self.assertEqual(index.offsets[-1], len(self.vectors))
+        np.testing.assert_array_equal(
+            np.sort(index.order), np.arange(len(self.vectors))
+        )
+
+    def test_search_with_every_list_is_exact(self):
+        index = ann.IVFIndex.build(self.vectors, n_lists=16)
+        for i in [0, 10, 1234]:
+            ids, scores = index.search(
+                self.vectors[i], topn=5, nprobe=index.n_lists, exclude=i
+            )
+            expected = [
+                j for j in exact_search(self.vectors, self.vectors[i], 6) if j != i
+            ]
+            self.assertEqual(list(ids), expected[:5])
+            self.assertTrue(np.all(np.diff(scores) <= 0))
+
+    def test_search_recall(self):
+        index = ann.IVFIndex.build(self.vectors, n_lists=16, nprobe=4)
+        queries = range(0, 2000, 40)
+        recall = np.mean(
+            [
+                len(
+                    set(index.search(self.vectors[i], topn=10)[0])
+                    & set(exact_search(self.vectors, self.vectors[i], 10))
+                )
+                / 10
+                for i in queries
+            ]
+        )
+        self.assertGreater(recall, 0.9)
+
+    def test_save_and_load(self):
+        index = ann.IVFIndex.build(self.vectors, n_lists=8)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "index" + ann.INDEX_SUFFIX)
+            index.save(path)
+            loaded = ann.IVFIndex.load(path, self.vectors)
+            np.testing.assert_array_equal(loaded.order, index.order)
+            with self.assertRaises(ValueError):
+                ann.IVFIndex.load(path, self.vectors[:10])
@@ -0,0 +1,47 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from slt.batch import map_bounded
+
+
+class MapBoundedTests(unittest.TestCase):
+    def test_results_in_order(self):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                map_bounded(
+                    executor, lambda x: x * 2, range(100), chunk_size=3, max_pending=4
+                )
+            )
+        self.assertEqual(results, [x * 2 for x in range(100)])
+
+    def test_reads_items_as_results_are_consumed(self):
+        read = []
+        lock = threading.Lock()
+
+        def items():
+            for i in range(1000):
+                with lock:
+                    read.append(i)
+                yield i
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = map_bounded(executor, str, items(), chunk_size=8, max_pending=4)
+            self.assertEqual(next(results), "0")
+            # the first chunk and the 4 submitted after it was consumed
+            self.assertLessEqual(len(read), 5 * 8)
+            self.assertEqual(list(results), [str(i) for i in range(1, 1000)])
+
+    def test_propagates_errors(self):
+        def fail(x):
+            if x == 5:
+                raise ValueError(x)
+            return x
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = map_bounded(
+                executor, fail, range(10), chunk_size=2, max_pending=2
+            )
+            self.assertEqual([next(results) for _ in range(4)], [0, 1, 2, 3])
+            with self.assertRaises(ValueError):
+                list(results)
@@ -0,0 +1,103 @@
+import json
+import unittest
+
+from slt.entities import (
+    STATUS_CODES,
+    Sentence,
+    Status,
+    Word,
+    encode_result,
+    find_changes,
+)
+
+
+def make_sentence(*words) -> Sentence:
+    sentence = Sentence()
+    for surface, status in words:
+        sentence.append_word(surface, status)
+    return sentence
+
+
+class SentenceTests(unittest.TestCase):
+    def setUp(self):
+        self.sentence = make_sentence(
+            ("大学", Status.REMOVED),
+            ("学校", Status.ADDED),
+            ("に", Status.UNCHANGED),
+            ('"\\\n', Status.UNCHANGED),
+        )
+
+    def test_words(self):
+        self.assertEqual(self.sentence[1], Word("学校", Status.ADDED))
+        self.assertEqual(self.sentence[1:3].words, self.sentence.words[1:3])
+        self.assertEqual(Sentence(self.sentence), self.sentence)
+        self.assertEqual(self.sentence.text, '大学学校に"\\\n')
+        self.sentence.truncate(2)
+        self.assertEqual(self.sentence.surfaces, ["大学", "学校"])
+
+    def test_to_json_matches_json_dumps(self):
+        self.assertEqual(
+            self.sentence.to_json(),
+            json.dumps(
+                self.sentence.as_dict(), ensure_ascii=False, separators=(",", ":")
+            ),
+        )
+        self.assertEqual(Sentence().to_json(), "[]")
+
+    def test_to_json_escapes_lone_surrogates(self):
+        sentence = make_sentence(
+            ("今日\ud800", Status.UNCHANGED), ("\udfff", Status.ADDED)
+        )
+        encoded = sentence.to_json()
+        # encodable, and decoded back to the same surfaces
+        encoded.encode("utf-8")
+        self.assertEqual(json.loads(encoded), sentence.as_dict())
+        self.assertIn("\\ud800", encoded)
+
+    def test_as_columns(self):
+        columns = self.sentence.as_columns()
+        self.assertEqual(columns["surfaces"], self.sentence.surfaces)
+        self.assertEqual(columns["statuses"], [2, 1, 0, 0])
+        # the columns are copies
+        columns["surfaces"].append("。")
+        self.assertEqual(len(self.sentence), 4)
+        decoded = [
+            {"surface": surface, "status": list(STATUS_CODES)[code].value}
+            for surface, code in zip(columns["surfaces"][:4], columns["statuses"])
+        ]
+        self.assertEqual(decoded, self.sentence.as_dict())
+
+    def test_encode_result(self):
+        old_sentence = make_sentence(("大学", Status.REMOVED), ("に", Status.UNCHANGED))
+        new_sentence = make_sentence(("学校", Status.ADDED), ("に", Status.UNCHANGED))
+        result = encode_result(
+            new_sentence, old_sentence, index=3, debug={"x": "\ud800"}
+        )
+        result.encode("utf-8")
+        self.assertEqual(
+            json.loads(result),
+            {
+                "index": 3,
+                "debug": {"x": "\ud800"},
+                "new_sentence": new_sentence.as_dict(),
+                "old_sentence": old_sentence.as_dict(),
+            },
+        )
+
+    def test_find_changes(self):
+        old_sentence = make_sentence(
+            ("大学", Status.REMOVED),
+            ("に", Status.UNCHANGED),
+            ("参り", Status.REMOVED),
+            ("まし", Status.REMOVED),
+        )
+        new_sentence = make_sentence(
+            ("学校", Status.ADDED),
+            ("に", Status.UNCHANGED),
+            ("行き", Status.ADDED),
+            ("まし", Status.ADDED),
+        )
+        self.assertEqual(
+            find_changes(old_sentence, new_sentence),
+            [("大学", "学校"), ("参りまし", "行きまし")],
+        )
@@ -0,0 +1,85 @@
+import unittest
+from unittest import mock
+
+from slt.entities import Sentence, Status
+from slt.incremental import DocumentStore, IncrementalSimplifier
+
+
+def results(*sentences):
+    return {s: {"new_sentence": s, "old_sentence": s} for s in sentences}
+
+
+class DocumentStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch("slt.incremental.time.monotonic", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_and_set(self):
+        store = DocumentStore(max_sentences=10, ttl=60)
+        self.assertEqual(store.get("a"), {})
+        store.set("a", results("1", "2"))
+        self.assertEqual(store.get("a"), results("1", "2"))
+        store.set("a", results("3"))
+        self.assertEqual(store.get("a"), results("3"))
+        self.assertEqual((len(store), store.sentences), (1, 1))
+        store.delete("a")
+        store.delete("a")
+        self.assertEqual((len(store), store.sentences), (0, 0))
+
+    def test_expires_documents_after_ttl(self):
+        store = DocumentStore(max_sentences=10, ttl=60)
+        store.set("a", results("1"))
+        self.now += 30
+        store.set("b", results("2"))
+        self.now += 31
+        self.assertEqual(store.get("a"), {})
+        self.assertEqual(store.get("b"), results("2"))
+        self.now += 30
+        self.assertEqual(store.get("b"), {})
+        self.assertEqual((len(store), store.sentences), (0, 0))
+
+    def test_evicts_least_recently_updated_documents(self):
+        store = DocumentStore(max_sentences=4, ttl=60)
+        store.set("a", results("1", "2"))
+        store.set("b", results("3", "4"))
+        # updating a makes b the least recently updated
+        store.set("a", results("1", "2"))
+        store.set("c", results("5"))
+        self.assertEqual(store.get("b"), {})
+        self.assertEqual(store.get("a"), results("1", "2"))
+        self.assertEqual(store.get("c"), results("5"))
+        self.assertEqual(store.sentences, 3)
+
+    def test_keeps_nothing_larger_than_the_store(self):
+        store = DocumentStore(max_sentences=2, ttl=60)
+        store.set("a", results("1", "2", "3"))
+        self.assertEqual(store.get("a"), {})
+        self.assertEqual(store.sentences, 0)
+
+
+class IncrementalSimplifierTests(unittest.TestCase):
+    def test_only_processes_changed_sentences(self):
+        processor = mock.Mock()
+
+        def process_sentences(sentences):
+            for sentence in sentences:
+                new_sentence = Sentence()
+                new_sentence.append_word(sentence, Status.UNCHANGED)
+                yield new_sentence, new_sentence
+
+        processor.process_sentences.side_effect = process_sentences
+        simplifier = IncrementalSimplifier(processor, DocumentStore(10, 60))
+
+        first = simplifier.update("doc", "今日は晴れです。明日は雨です。")
+        self.assertEqual([r["reused"] for r in first], [False, False])
+        second = simplifier.update(
+            "doc", "今日は晴れです。明後日は雪です。今日は晴れです。"
+        )
+        self.assertEqual([r["reused"] for r in second], [True, False, True])
+        self.assertEqual(
+            processor.process_sentences.call_args_list[-1].args[0], ["明後日は雪です。"]
+        )
+        self.assertEqual(second[2]["new_sentence"], first[0]["new_sentence"])
+        self.assertEqual([r["index"] for r in second], [0, 1, 2])
@@ -0,0 +1,67 @@
+import random
+import unittest
+
+from slt.japanese import SentenceSplitter, split_sentences
+
+
+TEXT = (
+    "本日は友人とお食事した後に、大学に参りました。「本当ですか？」と聞かれた。\n"
+    "明日は雨です！！傘を持っていきます\n\n"
+    "「行こう！」と言った。Really?! はい。。。終わり"
+)
+
+
+def split_in_chunks(text: str, sizes) -> list:
+    splitter = SentenceSplitter()
+    sentences = []
+    start = 0
+    for size in sizes:
+        sentences.extend(splitter.feed(text[start : start + size]))
+        start += size
+    sentences.extend(splitter.feed(text[start:]))
+    sentences.extend(splitter.flush())
+    return sentences
+
+
+class SplitSentencesTests(unittest.TestCase):
+    def test_split_sentences(self):
+        self.assertEqual(
+            split_sentences(TEXT),
+            [
+                "本日は友人とお食事した後に、大学に参りました。",
+                "「本当ですか？」と聞かれた。",
+                "明日は雨です！！",
+                "傘を持っていきます",
+                "「行こう！」と言った。",
+                "Really?!",
+                "はい。。。",
+                "終わり",
+            ],
+        )
+
+
+class SentenceSplitterTests(unittest.TestCase):
+    def test_single_chunk(self):
+        self.assertEqual(split_in_chunks(TEXT, []), split_sentences(TEXT))
+
+    def test_every_chunk_boundary(self):
+        expected = split_sentences(TEXT)
+        for boundary in range(len(TEXT) + 1):
+            self.assertEqual(split_in_chunks(TEXT, [boundary]), expected, boundary)
+
+    def test_random_chunks(self):
+        rng = random.Random(0)
+        expected = split_sentences(TEXT)
+        for _ in range(200):
+            sizes = [rng.randint(0, 5) for _ in range(len(TEXT))]
+            self.assertEqual(split_in_chunks(TEXT, sizes), expected)
+
+    def test_yields_sentences_as_soon_as_complete(self):
+        splitter = SentenceSplitter()
+        self.assertEqual(
+            list(splitter.feed("今日は晴れです。明日")), ["今日は晴れです。"]
+        )
+        # the punctuation could still be followed by a closing bracket
+        self.assertEqual(list(splitter.feed("は雨です。")), [])
+        self.assertEqual(list(splitter.feed("\n")), ["明日は雨です。"])
+        self.assertEqual(list(splitter.flush()), [])
@@ -0,0 +1,89 @@
+import os
+import random
+import tempfile
+import unittest
+
+from slt.lexicon import (
+    LEXICON_SUFFIX,
+    JlptLexicon,
+    LevelPartitionedWords,
+    load_jlpt_words,
+    read_jlpt_csv,
+)
+
+
+class JlptLexiconTests(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(0)
+        kana = [chr(c) for c in range(ord("ぁ"), ord("ゖ"))] + list("食事大学友人")
+        self.words = {
+            "".join(rng.choices(kana, k=rng.randint(1, 5))): rng.randint(1, 5)
+            for _ in range(2000)
+        }
+
+    def test_levels_match_dict(self):
+        lexicon = JlptLexicon(JlptLexicon.compile(self.words))
+        self.assertEqual(len(lexicon), len(self.words))
+        for word, level in self.words.items():
+            self.assertIn(word, lexicon)
+            self.assertEqual(lexicon.level(word), level)
+        self.assertEqual(
+            lexicon.levels(list(self.words)[:10]), list(self.words.values())[:10]
+        )
+
+    def test_missing_words(self):
+        lexicon = JlptLexicon(JlptLexicon.compile(self.words))
+        for word in ["", "missing", "ンンンンンン"]:
+            self.assertNotIn(word, lexicon)
+            self.assertIsNone(lexicon.level(word))
+            self.assertEqual(lexicon.get(word, 1), 1)
+
+    def test_empty_lexicon(self):
+        lexicon = JlptLexicon(JlptLexicon.compile({}))
+        self.assertEqual(len(lexicon), 0)
+        self.assertNotIn("食事", lexicon)
+
+    def test_rejects_other_files(self):
+        with self.assertRaises(ValueError):
+            JlptLexicon(b"\0" * 64)
+
+    def test_load_memory_mapped_and_csv(self):
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, "n5.csv")
+            with open(csv_path, "w") as f:
+                f.write("level,word\n5,食事\n3,友人、友達\n")
+            words = read_jlpt_csv(csv_path)
+            self.assertEqual(words, {"食事": 5, "友人": 3, "友達": 3})
+            self.assertEqual(load_jlpt_words(csv_path), words)
+
+            lexicon_path = os.path.join(directory, "jlpt" + LEXICON_SUFFIX)
+            with open(lexicon_path, "wb") as f:
+                f.write(JlptLexicon.compile(words))
+            lexicon = load_jlpt_words(lexicon_path)
+            self.assertIsInstance(lexicon, JlptLexicon)
+            self.assertEqual({w: lexicon.level(w) for w in words}, words)
+
+
+class LevelPartitionedWordsTests(unittest.TestCase):
+    def test_easier_than_matches_a_filter(self):
+        rng = random.Random(0)
+        for _ in range(100):
+            words = [f"w{i}" for i in range(rng.randint(0, 20))]
+            jlpt_words = {w: rng.randint(1, 5) for w in words if rng.random() < 0.8}
+            partition = LevelPartitionedWords(words, jlpt_words)
+            for level in range(0, 7):
+                self.assertEqual(
+                    partition.easier_than(level),
+                    [w for w in words if jlpt_words.get(w, 1) > level],
+                )
+
+    def test_default_level(self):
+        partition = LevelPartitionedWords(["a", "b"], {"a": 2}, default=4)
+        self.assertEqual(partition.easier_than(3), ["b"])
+        self.assertEqual(partition.easier_than(1), ["a", "b"])
+
+    def test_works_with_compiled_lexicon(self):
+        lexicon = JlptLexicon(JlptLexicon.compile({"食事": 5, "ご飯": 4}))
+        partition = LevelPartitionedWords(["ご飯", "食事", "召し上がる"], lexicon)
+        self.assertEqual(partition.easier_than(4), ["食事"])
+        self.assertEqual(partition.easier_than(0), ["ご飯", "食事", "召し上がる"])
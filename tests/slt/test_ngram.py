@@ -0,0 +1,48 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+
+
+TEXT = '{"content": "本日は友人とお食事した後に、大学に参りました"}\n'
+
+ROUNDTRIP = textwrap.dedent(
+    """
+    import json
+    import sys
+    from slt.ngram import open_corpus
+
+    filepath, text = sys.argv[1], json.loads(sys.argv[2])
+    with open_corpus(filepath, "wt") as f:
+        f.write(text)
+    with open_corpus(filepath) as f:
+        assert f.read() == text
+    with open_corpus(filepath, "rb") as f:
+        assert f.read().decode("utf-8") == text
+    """
+)
+
+
+class OpenCorpusTests(unittest.TestCase):
+    def test_text_is_utf8_whatever_the_locale(self):
+        root = os.path.join(os.path.dirname(__file__), "..", "..")
+        # an ASCII locale, without Python switching to UTF-8 on its own
+        env = {**os.environ, "LC_ALL": "C", "PYTHONUTF8": "0", "PYTHONPATH": root}
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ["corpus.jsonl", "corpus.jsonl.gz", "corpus.jsonl.bz2"]:
+                subprocess.run(
+                    [
+                        sys.executable,
+                        "-c",
+                        ROUNDTRIP,
+                        os.path.join(directory, name),
+                        # ASCII, the arguments being decoded with the locale
+                        json.dumps(TEXT),
+                    ],
+                    env=env,
+                    check=True,
+                    capture_output=True,
+                )
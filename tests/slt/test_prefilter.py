@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+
+from benchmarks.run import build_fixtures, read_sentences
+from slt.instrumentation import instrumentation
+from slt.prefilter import SimplifiableLemmas, build_prefilter
+from slt.processor import Processor
+
+
+class SimplifiableLemmasTests(unittest.TestCase):
+    def test_may_simplify(self):
+        prefilter = SimplifiableLemmas([("迅速", "a"), ("本日", "n")])
+        self.assertTrue(prefilter.may_simplify("迅速", "ADJ"))
+        self.assertTrue(prefilter.may_simplify("本日", "NOUN"))
+        self.assertFalse(prefilter.may_simplify("本日", "VERB"))
+        self.assertFalse(prefilter.may_simplify("今日", "NOUN"))
+
+    def test_save_and_load(self):
+        prefilter = SimplifiableLemmas([("迅速", "a"), ("本日", "n"), ("参る", "v")])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "simplifiable.tsv")
+            prefilter.save(path)
+            loaded = SimplifiableLemmas.load(path)
+        self.assertEqual(loaded.pairs, prefilter.pairs)
+
+
+class PrefilterTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        fixtures = build_fixtures(cls.directory.name, "blank")
+        cls.processor = Processor.load(**fixtures)
+        cls.prefilter = build_prefilter(
+            fixtures["wordnet_db_path"], cls.processor.jlpt_words
+        )
+        cls.sentences = read_sentences()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def process(self, prefilter: SimplifiableLemmas):
+        self.processor.prefilter = prefilter
+        self.processor.clear_cache()
+        results = []
+        with instrumentation.trace() as trace:
+            for sentence in self.sentences:
+                new_sentence, old_sentence = self.processor.process_sentence(sentence)
+                results.append((new_sentence.as_dict(), old_sentence.as_dict()))
+        return results, trace["counters"]["prefiltered_tokens"]
+
+    def test_same_results_with_the_prefilter(self):
+        results, prefiltered = self.process(None)
+        self.assertEqual(prefiltered, 0)
+        self.assertTrue(
+            any(word["status"] == "added" for new, _ in results for word in new)
+        )
+        prefiltered_results, prefiltered = self.process(self.prefilter)
+        self.assertGreater(prefiltered, 0)
+        self.assertEqual(prefiltered_results, results)
+
+    def test_counts_each_prefiltered_token_once(self):
+        doc = self.processor.nlp("彼は会議の資料を迅速に作成し、上司に提出した")
+        self.processor.prefilter = SimplifiableLemmas([])
+        self.addCleanup(setattr, self.processor, "prefilter", None)
+        candidates = [t for t in doc if not self.processor.is_skipped(t)]
+        with instrumentation.trace() as trace:
+            self.processor.process_doc(doc)
+        self.assertEqual(trace["counters"]["prefiltered_tokens"], len(candidates))
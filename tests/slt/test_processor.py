@@ -0,0 +1,90 @@
+import unittest
+from typing import Dict, List
+from unittest import mock
+
+import numpy as np
+from spacy.tokens import Doc
+from spacy.vocab import Vocab
+
+from slt.processor import Processor
+
+
+class BigramCounts:
+    """Counts of the bigrams looked up by ``Processor.select_candidate``"""
+
+    def __init__(self, counts: Dict[str, int]):
+        self._counts = counts
+        self.lookups: List[str] = []
+
+    def counts(self, keys: List[str]) -> np.ndarray:
+        self.lookups.extend(keys)
+        return np.array([self._counts.get(key, 0) for key in keys], dtype=np.int64)
+
+
+def make_doc(words: List[str], pos: List[str]) -> Doc:
+    # every token depends on the last one, which is the root
+    heads = [len(words) - 1] * len(words)
+    deps = ["dep"] * (len(words) - 1) + ["ROOT"]
+    return Doc(
+        Vocab(),
+        words=words,
+        spaces=[False] * len(words),
+        pos=pos,
+        heads=heads,
+        deps=deps,
+    )
+
+
+def make_processor(counts: Dict[str, int]) -> Processor:
+    return Processor(
+        synonyms_extractor=mock.Mock(),
+        nlp=mock.Mock(),
+        jlpt_words={},
+        ngrams=BigramCounts(counts),
+        conjugator=mock.Mock(),
+    )
+
+
+class SelectCandidateTests(unittest.TestCase):
+    def test_replacement_extending_past_the_doc(self):
+        # a candidate in the past tense replaces the token after it too,
+        # which does not exist
+        doc = make_doc(["犬", "猫", "。"], ["NOUN", "NOUN", "PUNCT"])
+        processor = make_processor({})
+        self.assertEqual(processor.select_candidate(doc[1], ["よかった"]), "よかった")
+        self.assertNotIn("猫。", processor.ngrams.lookups)
+
+    def test_checks_the_token_after_anywhere_in_the_doc(self):
+        # the character offset of the token is past the number of tokens
+        doc = make_doc(
+            ["ずっと昔", "から", "天気", "は", "雨"],
+            ["NOUN", "ADP", "NOUN", "ADP", "NOUN"],
+        )
+        processor = make_processor({"天気は": 100, "空模様は": 50})
+        self.assertEqual(
+            processor.select_candidate(doc[2], ["気候", "空模様"]), "空模様"
+        )
+        self.assertIn("気候は", processor.ngrams.lookups)
+
+    def test_checks_the_token_before(self):
+        doc = make_doc(["今日", "天気", "は"], ["NOUN", "NOUN", "ADP"])
+        processor = make_processor(
+            {"今日天気": 100, "今日空模様": 20, "天気は": 1, "空模様は": 1}
+        )
+        self.assertEqual(
+            processor.select_candidate(doc[1], ["気候", "空模様"]), "空模様"
+        )
+
+    def test_keeps_the_token_when_every_candidate_is_rejected(self):
+        doc = make_doc(["天気", "は"], ["NOUN", "ADP"])
+        processor = make_processor({"天気は": 100})
+        self.assertEqual(processor.select_candidate(doc[0], ["気候"]), "天気")
+
+    def test_other_parts_of_speech_take_the_first_candidate(self):
+        doc = make_doc(["食べ", "た"], ["VERB", "AUX"])
+        processor = make_processor({})
+        self.assertEqual(
+            processor.select_candidate(doc[0], ["召し上がる", "食う"]), "召し上がる"
+        )
+        self.assertEqual(processor.select_candidate(doc[0], []), "食べ")
+        self.assertEqual(processor.ngrams.lookups, [])
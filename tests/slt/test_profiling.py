@@ -0,0 +1,59 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from slt import profiling
+
+
+class ProfileTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_saves_profile(self):
+        with profiling.profile(
+            "test", self.directory.name, sentence="文"
+        ) as profile_id:
+            sum(range(1000))
+        self.assertIsNotNone(profile_id)
+        self.assertEqual(profiling.list_profile_ids(self.directory.name), [profile_id])
+        self.assertEqual(
+            profiling.list_profiles(self.directory.name)[0]["sentence"], "文"
+        )
+        path = profiling.profile_path(profile_id, self.directory.name)
+        self.assertTrue(os.path.exists(path))
+        self.assertIsNone(profiling.profile_path("../x", self.directory.name))
+
+    def test_nested_profile_is_skipped(self):
+        with profiling.profile("outer", self.directory.name) as outer:
+            with profiling.profile("inner", self.directory.name) as inner:
+                pass
+        self.assertIsNotNone(outer)
+        self.assertIsNone(inner)
+
+    def test_concurrent_profile_is_skipped(self):
+        started, done = threading.Event(), threading.Event()
+        ids = []
+
+        def profile_in_thread():
+            with profiling.profile("first", self.directory.name) as profile_id:
+                ids.append(profile_id)
+                started.set()
+                done.wait(5)
+
+        thread = threading.Thread(target=profile_in_thread)
+        thread.start()
+        started.wait(5)
+        try:
+            with profiling.profile("second", self.directory.name) as profile_id:
+                self.assertIsNone(profile_id)
+        finally:
+            done.set()
+            thread.join()
+        self.assertIsNotNone(ids[0])
+        # the lock is released once the first profile is saved
+        with profiling.profile("third", self.directory.name) as profile_id:
+            self.assertIsNotNone(profile_id)
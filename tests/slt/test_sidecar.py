@@ -0,0 +1,289 @@
+# pylint: disable=protected-access
+import asyncio
+import os
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import partial
+from unittest import mock
+
+import msgpack
+
+from benchmarks.run import build_fixtures
+from slt import sidecar
+from slt.entities import Sentence, Status
+from slt.processor import Processor
+from slt.workers import ProcessorPool
+
+
+class FakeProcessor:
+    """Upper cases sentences, sleeping for the number of seconds they
+    start with, if any
+    """
+
+    def process_sentence(self, sentence: str):
+        seconds, _, text = sentence.rpartition(":")
+        if seconds:
+            time.sleep(float(seconds))
+        new_sentence, old_sentence = Sentence(), Sentence()
+        new_sentence.append_word(text.upper(), Status.ADDED)
+        old_sentence.append_word(text, Status.REMOVED)
+        return new_sentence, old_sentence
+
+    def process_sentences(self, sentences):
+        return [self.process_sentence(sentence) for sentence in sentences]
+
+
+def expected(text: str):
+    return {
+        "new_sentence": [{"surface": text.upper(), "status": "added"}],
+        "old_sentence": [{"surface": text, "status": "removed"}],
+    }
+
+
+def read_frame(sock: socket.socket):
+    def read_exactly(size):
+        data = b""
+        while len(data) < size:
+            chunk = sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("closed")
+            data += chunk
+        return data
+
+    length, request_id, status = sidecar.HEADER.unpack(
+        read_exactly(sidecar.HEADER.size)
+    )
+    return request_id, status, msgpack.unpackb(read_exactly(length))
+
+
+class SidecarTests(unittest.TestCase):
+    max_pending = 8
+    timeout = 5
+
+    def load_processor(self):
+        return FakeProcessor()
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        # every thread of the pool loads its own processor
+        patcher = mock.patch.object(Processor, "load", self.load_processor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.path = os.path.join(self.directory.name, "sidecar.sock")
+        pool = ProcessorPool(
+            "thread", workers=2, max_pending=self.max_pending, timeout=self.timeout
+        )
+        self.server = sidecar.SidecarServer(pool, self.path, max_batch_size=4)
+        self.loop = asyncio.new_event_loop()
+        self.task = self.loop.create_task(self.server.serve())
+        self.thread = threading.Thread(target=self.run_server)
+        self.thread.start()
+        deadline = time.monotonic() + 5
+        while not os.path.exists(self.path):
+            if time.monotonic() > deadline:
+                self.fail("the server did not start")
+            time.sleep(0.01)
+
+    def run_server(self):
+        try:
+            self.loop.run_until_complete(self.task)
+        except asyncio.CancelledError:
+            pass
+
+    def tearDown(self):
+        self.loop.call_soon_threadsafe(self.task.cancel)
+        self.thread.join(5)
+        self.loop.close()
+        self.directory.cleanup()
+
+    def connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(5)
+        sock.connect(self.path)
+        self.addCleanup(sock.close)
+        return sock
+
+
+class ServerTests(SidecarTests):
+    def test_process_sentence_and_batch(self):
+        with sidecar.SidecarClient(self.path, size=2, timeout=5) as client:
+            self.assertEqual(client.process_sentence("abc"), expected("abc"))
+            self.assertEqual(
+                client.process_sentences(["a", "b", "c"]),
+                [expected("a"), expected("b"), expected("c")],
+            )
+            self.assertEqual(client.process_sentences([]), [])
+
+    def test_frames(self):
+        sock = self.connect()
+        sock.sendall(
+            sidecar.encode_frame(7, sidecar.PROCESS_SENTENCE, "abc")
+            + sidecar.encode_frame(8, sidecar.PROCESS_SENTENCES, ["x"])
+        )
+        responses = {}
+        for _ in range(2):
+            request_id, status, result = read_frame(sock)
+            responses[request_id] = (status, result)
+        self.assertEqual(
+            responses,
+            {7: (sidecar.OK, expected("abc")), 8: (sidecar.OK, [expected("x")])},
+        )
+
+    def test_responses_in_completion_order(self):
+        sock = self.connect()
+        sock.sendall(
+            sidecar.encode_frame(1, sidecar.PROCESS_SENTENCE, "0.5:slow")
+            + sidecar.encode_frame(2, sidecar.PROCESS_SENTENCE, "fast")
+        )
+        self.assertEqual(read_frame(sock), (2, sidecar.OK, expected("fast")))
+        self.assertEqual(read_frame(sock), (1, sidecar.OK, expected("slow")))
+
+    def test_invalid_requests(self):
+        sock = self.connect()
+        sock.sendall(
+            sidecar.encode_frame(1, sidecar.PROCESS_SENTENCE, 3)
+            + sidecar.encode_frame(2, 99, "abc")
+            + sidecar.encode_frame(3, sidecar.PROCESS_SENTENCES, ["a", 1])
+            + sidecar.encode_frame(4, sidecar.PROCESS_SENTENCES, ["a"] * 5)
+        )
+        statuses = {}
+        for _ in range(4):
+            request_id, status, message = read_frame(sock)
+            self.assertIsInstance(message, str)
+            statuses[request_id] = status
+        self.assertEqual(statuses, {i: sidecar.ERROR for i in range(1, 5)})
+        # the connection is still usable
+        sock.sendall(sidecar.encode_frame(5, sidecar.PROCESS_SENTENCE, "a"))
+        self.assertEqual(read_frame(sock), (5, sidecar.OK, expected("a")))
+
+    def test_closes_connection_on_invalid_frame(self):
+        sock = self.connect()
+        sock.sendall(sidecar.HEADER.pack(sidecar.MAX_PAYLOAD_SIZE + 1, 1, 1))
+        self.assertEqual(sock.recv(1), b"")
+        sock = self.connect()
+        sock.sendall(sidecar.HEADER.pack(1, 1, 1) + b"\xc1")
+        self.assertEqual(sock.recv(1), b"")
+
+
+class BusyServerTests(SidecarTests):
+    max_pending = 1
+    timeout = 0.2
+
+    def test_busy_and_timeout(self):
+        sock = self.connect()
+        sock.sendall(
+            sidecar.encode_frame(1, sidecar.PROCESS_SENTENCE, "0.5:slow")
+            + sidecar.encode_frame(2, sidecar.PROCESS_SENTENCE, "fast")
+        )
+        self.assertEqual(read_frame(sock)[:2], (2, sidecar.BUSY))
+        self.assertEqual(read_frame(sock)[:2], (1, sidecar.TIMEOUT))
+
+    def test_client_raises_errors(self):
+        with sidecar.SidecarClient(self.path, size=1) as client:
+            with self.assertRaises(sidecar.SidecarError) as context:
+                client.process_sentence("0.5:slow")
+            self.assertEqual(context.exception.status, sidecar.TIMEOUT)
+
+
+class ClientTests(SidecarTests):
+    max_pending = 64
+
+    def test_concurrent_requests(self):
+        with sidecar.SidecarClient(self.path, size=2, timeout=5) as client:
+            texts = [f"{i % 3 * 0.01}:text{i}" for i in range(40)]
+            results = [None] * len(texts)
+
+            def request(i):
+                results[i] = client.process_sentence(texts[i])
+
+            threads = [
+                threading.Thread(target=request, args=(i,)) for i in range(len(texts))
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(results, [expected(f"text{i}") for i in range(40)])
+
+    def test_timeout_forgets_the_request(self):
+        with sidecar.SidecarClient(self.path, size=1, timeout=0.05) as client:
+            with self.assertRaises(FutureTimeoutError):
+                client.process_sentence("0.3:slow")
+            connection = client._connections[0]
+            self.assertEqual(connection._pending, {})
+            # the late response is ignored
+            time.sleep(0.4)
+            self.assertEqual(client.process_sentence("fast"), expected("fast"))
+
+    def test_reconnects_after_close(self):
+        with sidecar.SidecarClient(self.path, size=1, timeout=5) as client:
+            self.assertEqual(client.process_sentence("a"), expected("a"))
+            connection = client._connections[0]
+            connection.close()
+            self.assertEqual(client.process_sentence("b"), expected("b"))
+            self.assertIsNot(client._connections[0], connection)
+            client.close()
+            self.assertEqual(client.process_sentence("c"), expected("c"))
+
+    def test_pending_requests_fail_when_the_connection_is_lost(self):
+        connection = sidecar.SidecarConnection(self.path)
+        future = connection.send(sidecar.PROCESS_SENTENCE, "1:slow")
+        connection.socket.shutdown(socket.SHUT_RDWR)
+        with self.assertRaises(ConnectionError):
+            future.result(5)
+        self.assertTrue(connection.closed)
+        with self.assertRaises(ConnectionError):
+            connection.send(sidecar.PROCESS_SENTENCE, "a")
+
+
+class PipelineTests(SidecarTests):
+    max_pending = 64
+
+    @classmethod
+    def setUpClass(cls):
+        cls.fixtures_directory = tempfile.TemporaryDirectory()
+        fixtures = build_fixtures(cls.fixtures_directory.name, "blank")
+        # not bound to the tests, and called with the original ``load``
+        cls.load_processor = partial(Processor.load, **fixtures)
+        cls.processor = cls.load_processor()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.fixtures_directory.cleanup()
+
+    def test_concurrent_requests(self):
+        sentences = [
+            "本日は友人とお食事した後に、大学に参りました",
+            "ご希望の日付を選択して下さい",
+            "彼は会議の資料を迅速に作成し、上司に提出した",
+        ] * 10
+        results = [None] * len(sentences)
+        with sidecar.SidecarClient(self.path, size=2, timeout=30) as client:
+
+            def request(i):
+                results[i] = client.process_sentence(sentences[i])
+
+            threads = [
+                threading.Thread(target=request, args=(i,))
+                for i in range(len(sentences))
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            batch = client.process_sentences(sentences[:3])
+        expected_results = []
+        for sentence in sentences:
+            new_sentence, old_sentence = self.processor.process_sentence(sentence)
+            expected_results.append(
+                {
+                    "new_sentence": new_sentence.as_dict(),
+                    "old_sentence": old_sentence.as_dict(),
+                }
+            )
+        self.assertEqual(results, expected_results)
+        self.assertEqual(batch, expected_results[:3])
@@ -0,0 +1,60 @@
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+from benchmarks.run import build_fixtures
+from slt.synonyms import WordnetWithW2vThresholdExtractor
+
+POS = ["NOUN", "VERB", "ADJ", ""]
+
+
+class WordnetWithW2vThresholdExtractorTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        fixtures = build_fixtures(cls.directory.name, "blank")
+        cls.db_path = fixtures["wordnet_db_path"]
+        cls.w2v_model_path = fixtures["w2v_model_path"]
+        db = sqlite3.connect(cls.db_path)
+        cls.lemmas = [
+            row[0]
+            for row in db.execute("SELECT DISTINCT lemma FROM word WHERE lang = 'jpn'")
+        ]
+        db.close()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def setUp(self):
+        self.extractor = WordnetWithW2vThresholdExtractor.load(
+            self.w2v_model_path, self.db_path
+        )
+        self.extractor.clear_cache()
+        self.addCleanup(self.extractor.clear_cache)
+
+    def test_batch_matches_find_synonyms(self):
+        words_with_pos = [(lemma, pos) for lemma in self.lemmas for pos in POS]
+        for topn in [-1, 1, 3]:
+            expected = {
+                (word, pos): self.extractor.find_synonyms(word, topn=topn, pos=pos)
+                for word, pos in words_with_pos
+            }
+            # ranked, then from the cache
+            for _ in range(2):
+                self.assertEqual(
+                    self.extractor.find_synonyms_batch(words_with_pos, topn=topn),
+                    expected,
+                )
+
+    def test_batch_ranks_words_once(self):
+        words_with_pos = [(lemma, "NOUN") for lemma in self.lemmas]
+        with mock.patch.object(
+            self.extractor, "similarities", wraps=self.extractor.similarities
+        ) as similarities:
+            first = self.extractor.find_synonyms_batch(words_with_pos, topn=-1)
+            second = self.extractor.find_synonyms_batch(words_with_pos[:5], topn=-1)
+        self.assertEqual(similarities.call_count, 2)
+        self.assertEqual(similarities.call_args.args, ([],))
+        self.assertEqual(second, {key: first[key] for key in words_with_pos[:5]})
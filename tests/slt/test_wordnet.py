@@ -0,0 +1,169 @@
+import json
+import os
+import select
+import signal
+import sqlite3
+import tempfile
+import threading
+import unittest
+from contextlib import closing
+
+from slt import wordnet
+from slt.synonyms import WordnetSynonymExtractor
+
+
+FIXTURE = os.path.join(
+    os.path.dirname(__file__), "..", "..", "benchmarks", "fixtures", "wordnet.sql"
+)
+
+
+def load_fixture(db_path: str):
+    db = sqlite3.connect(db_path)
+    with open(FIXTURE) as f:
+        db.executescript(f.read())
+    db.commit()
+    db.close()
+
+
+def count_words(pool: wordnet.ConnectionPool) -> int:
+    with pool.connection() as db:
+        return db.execute("SELECT COUNT(*) FROM word").fetchone()[0]
+
+
+class ConnectionPoolTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.directory.name, "wordnet.db")
+        load_fixture(self.db_path)
+        self.pool = wordnet.ConnectionPool(self.db_path, size=2, timeout=0.1)
+
+    def tearDown(self):
+        self.pool.close()
+        self.directory.cleanup()
+
+    def test_reuses_connections(self):
+        for _ in range(5):
+            count_words(self.pool)
+        stats = self.pool.stats()
+        self.assertEqual(stats["created"], 1)
+        self.assertEqual(stats["acquisitions"], 5)
+        self.assertEqual(stats["idle"], 1)
+
+    def test_times_out_when_exhausted(self):
+        with self.pool.connection(), self.pool.connection():
+            with self.assertRaises(TimeoutError):
+                count_words(self.pool)
+        self.assertEqual(self.pool.stats()["timeouts"], 1)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires fork")
+    def test_forked_child_starts_with_empty_pool(self):
+        count_words(self.pool)
+        held = self.pool.connection()
+        held.__enter__()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            # the child reports its pool statistics through the pipe
+            try:
+                before = self.pool.stats()
+                threads = [
+                    threading.Thread(
+                        target=lambda: [count_words(self.pool) for _ in range(20)]
+                    )
+                    for _ in range(8)
+                ]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                held.__exit__(None, None, None)
+                after = self.pool.stats()
+                os.write(write_fd, json.dumps([before, after]).encode())
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as f:
+            before, after = json.load(f)
+        os.waitpid(pid, 0)
+        self.assertEqual(before["created"], 0)
+        self.assertEqual(before["in_use"], 0)
+        self.assertEqual(after["in_use"], 0)
+        self.assertLessEqual(after["created"], 2)
+        self.assertEqual(after["acquisitions"], 160)
+        held.__exit__(None, None, None)
+        self.assertEqual(self.pool.stats()["in_use"], 0)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires fork")
+    def test_fork_while_the_pool_is_locked(self):
+        count_words(self.pool)
+        read_fd, write_fd = os.pipe()
+        # as if another thread was using the queue during the fork
+        with self.pool._idle.mutex:  # pylint: disable=protected-access
+            pid = os.fork()
+            if pid == 0:
+                try:
+                    os.write(write_fd, str(count_words(self.pool)).encode())
+                finally:
+                    os._exit(0)
+        os.close(write_fd)
+        try:
+            ready, _, _ = select.select([read_fd], [], [], 5)
+            if not ready:
+                os.kill(pid, signal.SIGKILL)
+                self.fail("the child is deadlocked")
+            self.assertEqual(
+                os.read(read_fd, 100).decode(), str(count_words(self.pool))
+            )
+        finally:
+            os.close(read_fd)
+            os.waitpid(pid, 0)
+
+
+class CompactDbTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.db_path = os.path.join(self.directory.name, "wordnet.db")
+        load_fixture(self.db_path)
+
+    def test_connect_escapes_the_path(self):
+        db_path = os.path.join(self.directory.name, "word?net#1%20.db")
+        os.rename(self.db_path, db_path)
+        with closing(wordnet.connect(db_path)) as db:
+            self.assertGreater(db.execute("SELECT COUNT(*) FROM word").fetchone()[0], 0)
+        self.assertFalse(wordnet.is_compact_db(db_path))
+        self.assertEqual(os.listdir(self.directory.name), [os.path.basename(db_path)])
+
+    def test_same_synonyms_as_the_stock_db(self):
+        compact_path = os.path.join(self.directory.name, "compact.db")
+        wordnet.build_compact_db(self.db_path, compact_path)
+        self.assertTrue(wordnet.is_compact_db(compact_path))
+        with closing(sqlite3.connect(self.db_path)) as db:
+            lemmas = [row[0] for row in db.execute("SELECT DISTINCT lemma FROM word")]
+        stock = WordnetSynonymExtractor(self.db_path, "jpn")
+        compact = WordnetSynonymExtractor(compact_path, "jpn")
+        for extractor in [stock, compact]:
+            self.addCleanup(extractor.pool.close)
+        self.addCleanup(stock.clear_cache)
+        for lemma in lemmas:
+            for pos in ["NOUN", "VERB", "ADJ", "ADV", ""]:
+                self.assertEqual(
+                    sorted(compact.find_synonyms(lemma, topn=-1, pos=pos)),
+                    sorted(stock.find_synonyms(lemma, topn=-1, pos=pos)),
+                    (lemma, pos),
+                )
+        words_with_pos = [(lemma, "NOUN") for lemma in lemmas]
+        self.assertEqual(
+            {
+                key: sorted(synonyms)
+                for key, synonyms in compact.find_synonyms_batch(
+                    words_with_pos, topn=-1
+                ).items()
+            },
+            {
+                key: sorted(synonyms)
+                for key, synonyms in stock.find_synonyms_batch(
+                    words_with_pos, topn=-1
+                ).items()
+            },
+        )